@@ -180,6 +180,19 @@ extern int _PyUnicodeWriter_FormatV(
     const char *format,
     va_list vargs);
 
+/* Return the number of characters written to the writer. */
+static inline Py_ssize_t
+_PyUnicodeWriter_GetLength(PyUnicodeWriter *writer)
+{
+    return ((_PyUnicodeWriter *)writer)->pos;
+}
+
+/* Take the content of the writer as a str, or as UTF-8 encoded bytes if
+   as_utf8 is non-zero, and empty the writer to reuse it. */
+PyAPI_FUNC(PyObject*) _PyUnicodeWriter_TakeContent(
+    PyUnicodeWriter *writer,
+    int as_utf8);
+
 /* --- UTF-7 Codecs ------------------------------------------------------- */
 
 extern PyObject* _PyUnicode_EncodeUTF7(
@@ -27,6 +27,10 @@
 # when the device block size is available.
 DEFAULT_BUFFER_SIZE = 128 * 1024  # bytes
 
+# Maximum size to which the buffer of a BufferedReader grows when reading a
+# file sequentially.
+_MAX_SEQUENTIAL_BUFFER_SIZE = 1024 * 1024
+
 # NOTE: Base classes defined here are registered with the "official" ABCs
 # defined in io.py. We don't use real inheritance though, because we don't want
 # to inherit the C implementations.
@@ -37,6 +41,29 @@
 # Does open() check its 'errors' argument?
 _CHECK_ERRORS = (hasattr(sys, "gettotalrefcount") or sys.flags.dev_mode)
 
+# Access patterns accepted by FileIO.advise()
+_ADVICES = dict.fromkeys(['normal', 'sequential', 'random',
+                          'willneed', 'dontneed', 'noreuse'])
+if hasattr(os, 'posix_fadvise'):
+    _ADVICES.update(normal=os.POSIX_FADV_NORMAL,
+                    sequential=os.POSIX_FADV_SEQUENTIAL,
+                    random=os.POSIX_FADV_RANDOM,
+                    willneed=os.POSIX_FADV_WILLNEED,
+                    dontneed=os.POSIX_FADV_DONTNEED,
+                    noreuse=os.POSIX_FADV_NOREUSE)
+
+# Maximum number of lines passed at once to FileIO.writelines() by
+# BufferedWriter.writelines()
+_WRITELINES_BATCH_SIZE = 1024
+
+# Maximum number of buffers passed to os.writev()
+try:
+    _IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, OSError, ValueError):
+    _IOV_MAX = -1
+if _IOV_MAX <= 0:
+    _IOV_MAX = 16
+
 
 def text_encoding(encoding, stacklevel=2):
     """
@@ -239,11 +266,13 @@ def open(file, mode="r", buffering=-1, encoding=None, errors=None,
     result = raw
     try:
         line_buffering = False
+        default_buffering = False
         if buffering == 1 or buffering < 0 and raw._isatty_open_only():
             buffering = -1
             line_buffering = True
         if buffering < 0:
             buffering = max(min(raw._blksize, 8192 * 1024), DEFAULT_BUFFER_SIZE)
+            default_buffering = True
         if buffering < 0:
             raise ValueError("invalid buffering size")
         if buffering == 0:
@@ -256,6 +285,8 @@ def open(file, mode="r", buffering=-1, encoding=None, errors=None,
             buffer = BufferedWriter(raw, buffering)
         elif reading:
             buffer = BufferedReader(raw, buffering)
+            # The buffer size was not requested: let it grow.
+            buffer._grow = default_buffering and type(raw) is FileIO
         else:
             raise ValueError("unknown mode: %r" % mode)
         result = buffer
@@ -1053,6 +1084,10 @@ def __init__(self, raw, buffer_size=DEFAULT_BUFFER_SIZE):
         self.buffer_size = buffer_size
         self._reset_read_buf()
         self._read_lock = Lock()
+        # Grow the buffer when reading a file sequentially, like the C
+        # implementation.  Only set by open() when no buffer size is given.
+        self._grow = False
+        self._filled = False
 
     def readable(self):
         return self.raw.readable()
@@ -1061,6 +1096,18 @@ def _reset_read_buf(self):
         self._read_buf = b""
         self._read_pos = 0
 
+    def _raw_read_buffer(self, size):
+        # Double the buffer size, up to _MAX_SEQUENTIAL_BUFFER_SIZE, if the
+        # previous read filled the whole buffer and all of it was consumed.
+        if (self._filled and size == self.buffer_size
+                and size < _MAX_SEQUENTIAL_BUFFER_SIZE):
+            self.buffer_size = size = min(size * 2,
+                                          _MAX_SEQUENTIAL_BUFFER_SIZE)
+        chunk = self.raw.read(size)
+        self._filled = (self._grow and size == self.buffer_size
+                        and chunk is not None and len(chunk) == size)
+        return chunk
+
     def read(self, size=None):
         """Read size bytes.
 
@@ -1112,7 +1159,11 @@ def _read_unlocked(self, n=None):
         chunks = [buf[pos:]]
         wanted = max(self.buffer_size, n)
         while avail < n:
-            chunk = self.raw.read(wanted)
+            if wanted == self.buffer_size:
+                chunk = self._raw_read_buffer(wanted)
+                wanted = self.buffer_size
+            else:
+                chunk = self.raw.read(wanted)
             if chunk in empty_values:
                 nodata_val = chunk
                 break
@@ -1141,8 +1192,10 @@ def _peek_unlocked(self, n=0):
         want = min(n, self.buffer_size)
         have = len(self._read_buf) - self._read_pos
         if have < want or have <= 0:
-            to_read = self.buffer_size - have
-            current = self.raw.read(to_read)
+            if have <= 0:
+                current = self._raw_read_buffer(self.buffer_size)
+            else:
+                current = self.raw.read(self.buffer_size - have)
             if current:
                 self._read_buf = self._read_buf[self._read_pos:] + current
                 self._read_pos = 0
@@ -1228,6 +1281,7 @@ def seek(self, pos, whence=0):
                 pos -= len(self._read_buf) - self._read_pos
             pos = _BufferedIOMixin.seek(self, pos, whence)
             self._reset_read_buf()
+            self._filled = False
             return pos
 
 class BufferedWriter(_BufferedIOMixin):
@@ -1259,6 +1313,11 @@ def write(self, b):
         with self._write_lock:
             if self.closed:
                 raise ValueError("write to closed file")
+            if not self._write_buf:
+                data = memoryview(b).cast('B')
+                if len(data) >= self.buffer_size:
+                    # Large writes skip the buffer.
+                    return self._write_direct(data)
             # XXX we can implement some more tricks to try and avoid
             # partial writes
             if len(self._write_buf) > self.buffer_size:
@@ -1281,6 +1340,72 @@ def write(self, b):
                         raise BlockingIOError(e.errno, e.strerror, written)
             return written
 
+    def _write_direct(self, data):
+        written = 0
+        while len(data) - written >= self.buffer_size:
+            n = self.raw.write(data[written:])
+            if n is None:
+                # Buffer as much as possible.
+                tail = data[written:written + self.buffer_size]
+                self._write_buf.extend(tail)
+                written += len(tail)
+                if written < len(data):
+                    raise BlockingIOError(
+                        errno.EAGAIN,
+                        "write could not complete without blocking", written)
+                return written
+            if n > len(data) - written or n < 0:
+                raise OSError("write() returned incorrect number of bytes")
+            written += n
+        self._write_buf.extend(data[written:])
+        return len(data)
+
+    def writelines(self, lines):
+        """Write an iterable of bytes-like objects to the stream.
+
+        If the data does not fit in the buffer and the raw stream is a
+        FileIO, the buffer is flushed and the data is written with the
+        vectored FileIO.writelines() instead of being copied into the buffer.
+        """
+        # The lines are consumed lazily, in batches.
+        batch = []
+        try:
+            for line in lines:
+                batch.append(line)
+                if len(batch) >= _WRITELINES_BATCH_SIZE:
+                    full, batch = batch, []
+                    self._writelines_batch(full)
+        except BaseException:
+            # Write the lines already consumed before propagating the error.
+            if batch:
+                self._writelines_batch(batch)
+            raise
+        self._writelines_batch(batch)
+
+    def _writelines_batch(self, lines):
+        if type(self.raw) is FileIO:
+            for line in lines:
+                if isinstance(line, str):
+                    raise TypeError("can't write str to binary stream")
+            views = [memoryview(line) for line in lines]
+            total = sum(view.nbytes for view in views)
+            with self._write_lock:
+                if self.closed:
+                    raise ValueError("write to closed file")
+                if (total >= self.buffer_size or
+                        len(self._write_buf) + total > self.buffer_size):
+                    try:
+                        self._flush_unlocked()
+                    except BlockingIOError as e:
+                        raise BlockingIOError(e.errno, e.strerror, 0)
+                    self._write_vectored(views)
+                    return
+        for line in lines:
+            self.write(line)
+
+    def _write_vectored(self, views):
+        self.raw.writelines(views)
+
     def truncate(self, pos=None):
         with self._write_lock:
             self._flush_unlocked()
@@ -1481,6 +1606,14 @@ def write(self, b):
                 self._reset_read_buf()
         return BufferedWriter.write(self, b)
 
+    def _write_vectored(self, views):
+        if self._read_buf:
+            # Undo readahead
+            with self._read_lock:
+                self.raw.seek(self._read_pos - len(self._read_buf), 1)
+                self._reset_read_buf()
+        self.raw.writelines(views)
+
 
 def _new_buffersize(bytes_read):
     # Parallels _io/fileio.c new_buffersize
@@ -1763,6 +1896,59 @@ def write(self, b):
         except BlockingIOError:
             return None
 
+    def writelines(self, lines):
+        """Write an iterable of bytes-like objects to the file.
+
+        All the data is written, with as few writev() system calls as
+        possible where available.  In non-blocking mode, BlockingIOError is
+        raised if the write would block, with the number of bytes written
+        in its characters_written attribute.
+        """
+        self._checkClosed()
+        self._checkWritable()
+        # The lines are consumed lazily and written in batches of at most
+        # _IOV_MAX buffers.
+        buffers = []
+        written = 0
+        try:
+            for line in lines:
+                buffers.append(memoryview(line).cast('B'))
+                if len(buffers) >= _IOV_MAX:
+                    batch, buffers = buffers, []
+                    written = self._writev_all(batch, written)
+        finally:
+            # Write the lines already consumed, even if the iteration failed.
+            self._writev_all(buffers, written)
+
+    def _writev_all(self, buffers, written):
+        # Write all the buffers and return the updated number of bytes
+        # written.
+        i = 0
+        while i < len(buffers):
+            if not buffers[i]:
+                i += 1
+                continue
+            try:
+                if hasattr(os, 'writev'):
+                    n = os.writev(self._fd, buffers[i:i + _IOV_MAX])
+                else:
+                    n = os.write(self._fd, buffers[i])
+            except BlockingIOError as e:
+                raise BlockingIOError(
+                    e.errno, "write could not complete without blocking",
+                    written) from None
+            written += n
+            # Skip the buffers written, and the written part of the last one
+            # after a partial write.
+            while n:
+                size = len(buffers[i])
+                if n < size:
+                    buffers[i] = buffers[i][n:]
+                    break
+                n -= size
+                i += 1
+        return written
+
     def seek(self, pos, whence=SEEK_SET):
         """Move to new file position.
 
@@ -1786,6 +1972,25 @@ def tell(self):
         self._checkClosed()
         return os.lseek(self._fd, 0, SEEK_CUR)
 
+    def advise(self, advice, offset=0, length=0, /):
+        """Announce how the file will be accessed.
+
+        advice is one of 'normal', 'sequential', 'random', 'willneed',
+        'dontneed' or 'noreuse'.  It applies to length bytes starting at
+        offset, or up to the end of the file if length is 0.  This is only a
+        hint: it does nothing on platforms without posix_fadvise().
+        """
+        self._checkClosed()
+        if not isinstance(advice, str):
+            raise TypeError(f"advise() argument 1 must be str, "
+                            f"not {type(advice).__name__}")
+        if advice not in _ADVICES:
+            raise ValueError(f"invalid advice: {advice!r}")
+        if offset < 0 or length < 0:
+            raise ValueError("offset and length must be non-negative")
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(self._fd, offset, length, _ADVICES[advice])
+
     def truncate(self, size=None):
         """Truncate the file to at most size bytes.
 
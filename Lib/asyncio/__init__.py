@@ -12,9 +12,11 @@
 from .futures import *
 from .graph import *
 from .locks import *
+from .pools import *
 from .protocols import *
 from .runners import *
 from .queues import *
+from .resolvers import *
 from .streams import *
 from .subprocess import *
 from .tasks import *
@@ -30,9 +32,11 @@
            futures.__all__ +
            graph.__all__ +
            locks.__all__ +
+           pools.__all__ +
            protocols.__all__ +
            runners.__all__ +
            queues.__all__ +
+           resolvers.__all__ +
            streams.__all__ +
            subprocess.__all__ +
            tasks.__all__ +
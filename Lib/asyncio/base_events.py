@@ -19,6 +19,7 @@
 import errno
 import heapq
 import itertools
+import math
 import os
 import socket
 import stat
@@ -204,6 +205,89 @@ def _check_ssl_socket(sock):
         raise TypeError("Socket cannot be of type SSLSocket")
 
 
+class _TimerWheel:
+    """Coarse time slots holding the timers due far in the future.
+
+    A timer due more than one slot ahead is put in the slot covering its
+    due time rather than in the event loop's heap, so scheduling and
+    cancelling it are O(1) and a cancelled timer is dropped immediately.
+    The timers of a slot are moved to the heap shortly before the slot
+    starts, so they still run at their exact time.
+    """
+
+    def __init__(self, resolution):
+        self.resolution = resolution
+        # Map the tick of each non-empty slot to a {id(handle): handle} dict.
+        self._slots = {}
+        # Heap of the ticks of the slots, possibly including stale ticks of
+        # slots that became empty.
+        self._ticks = []
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def _tick(self, when):
+        return int(when // self.resolution)
+
+    def add(self, handle, now):
+        """Put handle in its slot, return False if it is due too soon."""
+        when = handle._when
+        if not math.isfinite(when):
+            return False
+        tick = self._tick(when)
+        if tick <= self._tick(now) + 1:
+            return False
+        slot = self._slots.get(tick)
+        if slot is None:
+            slot = self._slots[tick] = {}
+            heapq.heappush(self._ticks, tick)
+        slot[id(handle)] = handle
+        self._count += 1
+        return True
+
+    def discard(self, handle):
+        if not math.isfinite(handle._when):
+            return
+        tick = self._tick(handle._when)
+        slot = self._slots.get(tick)
+        if slot is not None and slot.get(id(handle)) is handle:
+            del slot[id(handle)]
+            self._count -= 1
+            if not slot:
+                del self._slots[tick]
+
+    def next_deadline(self):
+        """Return the time at which pop_due() must be called next."""
+        ticks = self._ticks
+        while ticks and ticks[0] not in self._slots:
+            heapq.heappop(ticks)
+        if not ticks:
+            return None
+        return (ticks[0] - 1) * self.resolution
+
+    def pop_due(self, now):
+        """Remove and return the timers of the slots starting next."""
+        ticks = self._ticks
+        limit = self._tick(now) + 1
+        handles = []
+        while ticks and ticks[0] <= limit:
+            slot = self._slots.pop(heapq.heappop(ticks), None)
+            if slot is not None:
+                handles.extend(slot.values())
+        self._count -= len(handles)
+        return handles
+
+    def pop_all(self):
+        handles = []
+        for slot in self._slots.values():
+            handles.extend(slot.values())
+        self._slots.clear()
+        self._ticks.clear()
+        self._count = 0
+        return handles
+
+
 class _SendfileFallbackProtocol(protocols.Protocol):
     def __init__(self, transp):
         if not isinstance(transp, transports._FlowControlMixin):
@@ -422,6 +506,7 @@ def __init__(self):
         self._stopping = False
         self._ready = collections.deque()
         self._scheduled = []
+        self._timer_wheel = None
         self._default_executor = None
         self._internal_fds = 0
         # Identifier of the thread running the event loop, or None if the
@@ -437,6 +522,7 @@ def __init__(self):
         self.slow_callback_duration = 0.1
         self._current_handle = None
         self._task_factory = None
+        self._resolver_cache = None
         self._coroutine_origin_tracking_enabled = False
         self._coroutine_origin_tracking_saved_depth = None
 
@@ -496,6 +582,56 @@ def get_task_factory(self):
         """Return a task factory, or None if the default one is in use."""
         return self._task_factory
 
+    def set_resolver_cache(self, cache):
+        """Set a resolver cache used by loop.getaddrinfo().
+
+        If cache is None, lookups are not cached, which is the default.
+        Otherwise, it must be an object with a getaddrinfo() coroutine
+        method, such as an asyncio.ResolverCache instance.
+        """
+        if (cache is not None and
+                not callable(getattr(cache, 'getaddrinfo', None))):
+            raise TypeError('resolver cache must have a getaddrinfo() method '
+                            'or be None')
+        self._resolver_cache = cache
+
+    def get_resolver_cache(self):
+        """Return the resolver cache, or None if lookups are not cached."""
+        return self._resolver_cache
+
+    def set_timer_wheel(self, resolution):
+        """Set the slot size of the timer wheel, in seconds.
+
+        Timers due more than one slot ahead are kept in a timer wheel,
+        where scheduling and cancelling them is O(1), until shortly before
+        they are due.  This is useful when many timeouts are pending and
+        most of them are cancelled before they expire.
+
+        If resolution is None, the timer wheel is disabled, which is the
+        default.
+        """
+        if resolution is not None:
+            if (isinstance(resolution, bool) or
+                    not isinstance(resolution, (int, float))):
+                raise TypeError('resolution must be a number or None')
+            if not resolution > 0 or not math.isfinite(resolution):
+                raise ValueError('resolution must be positive and finite')
+        wheel = self._timer_wheel
+        if wheel is not None:
+            for handle in wheel.pop_all():
+                heapq.heappush(self._scheduled, handle)
+                handle._scheduled = True
+        if resolution is None:
+            self._timer_wheel = None
+        else:
+            self._timer_wheel = _TimerWheel(resolution)
+
+    def get_timer_wheel(self):
+        """Return the slot size of the timer wheel, or None if disabled."""
+        if self._timer_wheel is None:
+            return None
+        return self._timer_wheel.resolution
+
     def _make_socket_transport(self, sock, protocol, waiter=None, *,
                                extra=None, server=None):
         """Create socket transport."""
@@ -743,6 +879,8 @@ def close(self):
         self._closed = True
         self._ready.clear()
         self._scheduled.clear()
+        if self._timer_wheel is not None:
+            self._timer_wheel.pop_all()
         self._executor_shutdown_called = True
         executor = self._default_executor
         if executor is not None:
@@ -810,8 +948,10 @@ def call_at(self, when, callback, *args, context=None):
         timer = events.TimerHandle(when, callback, args, self, context)
         if timer._source_traceback:
             del timer._source_traceback[-1]
-        heapq.heappush(self._scheduled, timer)
-        timer._scheduled = True
+        wheel = self._timer_wheel
+        if wheel is None or not wheel.add(timer, self.time()):
+            heapq.heappush(self._scheduled, timer)
+            timer._scheduled = True
         return timer
 
     def call_soon(self, callback, *args, context=None):
@@ -928,6 +1068,10 @@ def _getaddrinfo_debug(self, host, port, family, type, proto, flags):
 
     async def getaddrinfo(self, host, port, *,
                           family=0, type=0, proto=0, flags=0):
+        if self._resolver_cache is not None:
+            return await self._resolver_cache.getaddrinfo(
+                host, port, family=family, type=type, proto=proto,
+                flags=flags)
         if self._debug:
             getaddr_func = self._getaddrinfo_debug
         else:
@@ -1962,6 +2106,8 @@ def _timer_handle_cancelled(self, handle):
         """Notification that a TimerHandle has been cancelled."""
         if handle._scheduled:
             self._timer_cancelled_count += 1
+        elif self._timer_wheel is not None:
+            self._timer_wheel.discard(handle)
 
     def _run_once(self):
         """Run one full iteration of the event loop.
@@ -1994,12 +2140,26 @@ def _run_once(self):
                 handle = heapq.heappop(self._scheduled)
                 handle._scheduled = False
 
+        wheel = self._timer_wheel
+        if wheel:
+            # Move the timers which will soon be due from the timer wheel
+            # to the heap.
+            for handle in wheel.pop_due(self.time()):
+                heapq.heappush(self._scheduled, handle)
+                handle._scheduled = True
+
         timeout = None
         if self._ready or self._stopping:
             timeout = 0
-        elif self._scheduled:
+        elif self._scheduled or wheel:
             # Compute the desired timeout.
-            timeout = self._scheduled[0]._when - self.time()
+            if self._scheduled:
+                when = self._scheduled[0]._when
+                if wheel:
+                    when = min(when, wheel.next_deadline())
+            else:
+                when = wheel.next_deadline()
+            timeout = when - self.time()
             if timeout > MAXIMUM_SELECT_TIMEOUT:
                 timeout = MAXIMUM_SELECT_TIMEOUT
             elif timeout < 0:
@@ -639,6 +639,22 @@ def set_task_factory(self, factory):
     def get_task_factory(self):
         raise NotImplementedError
 
+    # Resolver cache.
+
+    def set_resolver_cache(self, cache):
+        raise NotImplementedError
+
+    def get_resolver_cache(self):
+        raise NotImplementedError
+
+    # Timer wheel.
+
+    def set_timer_wheel(self, resolution):
+        raise NotImplementedError
+
+    def get_timer_wheel(self):
+        raise NotImplementedError
+
     # Error handlers.
 
     def get_exception_handler(self):
@@ -0,0 +1,286 @@
+"""A pool of reusable stream connections."""
+
+__all__ = ('ConnectionPool',)
+
+import collections
+
+from . import events
+from . import exceptions
+from . import streams
+
+
+class _Connection:
+    __slots__ = ('key', 'reader', 'writer', 'idle_handle')
+
+    def __init__(self, key, reader, writer):
+        self.key = key
+        self.reader = reader
+        self.writer = writer
+        self.idle_handle = None
+
+
+class _PooledConnection:
+    """Asynchronous context manager returned by ConnectionPool.connection()."""
+
+    def __init__(self, pool, args, kwargs):
+        self._pool = pool
+        self._args = args
+        self._kwargs = kwargs
+        self._writer = None
+
+    async def __aenter__(self):
+        reader, writer = await self._pool.acquire(*self._args, **self._kwargs)
+        self._writer = writer
+        return reader, writer
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        # The state of the connection is unknown after an error: do not
+        # reuse it.
+        self._pool.release(self._writer, discard=exc_type is not None)
+
+
+class ConnectionPool:
+    """A pool of stream connections, keyed by address and SSL context.
+
+    acquire() returns a (reader, writer) pair, reusing an idle connection
+    to the same (host, port, ssl, server_hostname) if one is available and
+    healthy, or opening a new one with open_connection().  Connections must
+    be given back to the pool with release().
+
+    At most *max_per_key* connections are open for each key; further
+    acquire() calls wait in FIFO order for a connection to be released.
+    Idle connections are closed after *idle_timeout* seconds, or never if
+    it is None.
+
+    *health_check* is an optional callable which is passed the reader and
+    the writer of an idle connection before it is reused, and returns
+    whether the connection can be reused.  It may be a coroutine function.
+
+    Other keyword arguments are passed to open_connection().
+    """
+
+    def __init__(self, *, max_per_key=10, idle_timeout=60.0,
+                 health_check=None, **kwds):
+        if max_per_key < 1:
+            raise ValueError('max_per_key must be at least 1')
+        if idle_timeout is not None and idle_timeout < 0:
+            raise ValueError('idle_timeout must be non-negative or None')
+        if health_check is not None and not callable(health_check):
+            raise TypeError('health_check must be a callable or None')
+        self._max_per_key = max_per_key
+        self._idle_timeout = idle_timeout
+        self._health_check = health_check
+        self._kwds = kwds
+        # Idle connections per key, the most recently released last.  Like
+        # the other per-key mappings, a key is removed once its deque is
+        # empty, so that they do not grow with every address ever used.
+        self._idle = {}
+        # Number of open or opening connections per key.
+        self._count = collections.Counter()
+        # Futures of the acquire() calls waiting for a connection per key.
+        self._waiters = {}
+        self._in_use = {}
+        self._closed = False
+
+    def __repr__(self):
+        info = [self.__class__.__name__]
+        if self._closed:
+            info.append('closed')
+        info.append(f'max_per_key={self._max_per_key}')
+        info.append(f'open={self._count.total()}')
+        info.append(f'in_use={len(self._in_use)}')
+        return '<{}>'.format(' '.join(info))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def connection(self, host, port, *, ssl=None, server_hostname=None):
+        """Return an asynchronous context manager for a pooled connection.
+
+        It acquires a connection and yields a (reader, writer) pair, then
+        releases the connection on exit.  The connection is closed rather
+        than released if the body raised an exception.
+        """
+        kwargs = {'ssl': ssl, 'server_hostname': server_hostname}
+        return _PooledConnection(self, (host, port), kwargs)
+
+    async def acquire(self, host, port, *, ssl=None, server_hostname=None):
+        """Return a (reader, writer) pair connected to host and port."""
+        key = (host, port, ssl, server_hostname)
+        while True:
+            if self._closed:
+                raise RuntimeError('the connection pool is closed')
+            idle = self._idle.get(key)
+            if idle:
+                conn = idle.pop()
+                if not idle:
+                    del self._idle[key]
+                if conn.idle_handle is not None:
+                    conn.idle_handle.cancel()
+                    conn.idle_handle = None
+                # Reserve the connection while checking its health.
+                self._in_use[conn.writer] = conn
+                try:
+                    healthy = await self._check(conn)
+                except BaseException:
+                    self.release(conn.writer, discard=True)
+                    raise
+                if healthy:
+                    return conn.reader, conn.writer
+                self.release(conn.writer, discard=True)
+                continue
+
+            if (self._count[key] < self._max_per_key
+                    and not self._waiters.get(key)):
+                self._count[key] += 1
+                return await self._open(key)
+
+            conn = await self._wait(key)
+            if conn is None:
+                # A connection slot was handed over.
+                return await self._open(key)
+            return conn.reader, conn.writer
+
+    async def _check(self, conn):
+        reader, writer = conn.reader, conn.writer
+        if (writer.is_closing() or reader.at_eof()
+                or reader.exception() is not None):
+            return False
+        if self._health_check is None:
+            return True
+        result = self._health_check(reader, writer)
+        if hasattr(result, '__await__'):
+            result = await result
+        return bool(result)
+
+    async def _open(self, key):
+        host, port, ssl, server_hostname = key
+        try:
+            reader, writer = await streams.open_connection(
+                host, port, ssl=ssl, server_hostname=server_hostname,
+                **self._kwds)
+        except BaseException:
+            self._free_slot(key)
+            raise
+        conn = _Connection(key, reader, writer)
+        if self._closed:
+            self._free_slot(key)
+            writer.close()
+            raise RuntimeError('the connection pool is closed')
+        self._in_use[writer] = conn
+        return reader, writer
+
+    async def _wait(self, key):
+        loop = events.get_running_loop()
+        waiter = loop.create_future()
+        waiters = self._waiters.get(key)
+        if waiters is None:
+            waiters = self._waiters[key] = collections.deque()
+        waiters.append(waiter)
+        try:
+            return await waiter
+        except exceptions.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Cancelled after being handed a connection or a slot:
+                # pass it on.
+                conn = waiter.result()
+                if conn is None:
+                    self._free_slot(key)
+                else:
+                    self.release(conn.writer)
+            raise
+        finally:
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+            if not waiters and self._waiters.get(key) is waiters:
+                del self._waiters[key]
+
+    def _wake_waiter(self, key, conn):
+        waiters = self._waiters.get(key)
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiters:
+                del self._waiters[key]
+            if not waiter.done():
+                if conn is not None:
+                    self._in_use[conn.writer] = conn
+                waiter.set_result(conn)
+                return True
+        return False
+
+    def _free_slot(self, key):
+        # Hand the slot over to the first waiter, if any.
+        if not self._wake_waiter(key, None):
+            self._count[key] -= 1
+            if not self._count[key]:
+                del self._count[key]
+
+    def _expire(self, conn):
+        conn.idle_handle = None
+        idle = self._idle[conn.key]
+        idle.remove(conn)
+        if not idle:
+            del self._idle[conn.key]
+        conn.writer.close()
+        self._free_slot(conn.key)
+
+    def release(self, writer, *, discard=False):
+        """Give a connection acquired from the pool back to it.
+
+        If discard is true, or the connection is closing, it is closed
+        rather than kept for reuse.
+        """
+        try:
+            conn = self._in_use.pop(writer)
+        except KeyError:
+            raise ValueError('the connection was not acquired from '
+                             'this pool') from None
+        key = conn.key
+        if (discard or self._closed or writer.is_closing()
+                or conn.reader.at_eof()):
+            writer.close()
+            self._free_slot(key)
+            return
+        if self._wake_waiter(key, conn):
+            return
+        if self._idle_timeout is not None:
+            loop = events.get_running_loop()
+            conn.idle_handle = loop.call_later(self._idle_timeout,
+                                               self._expire, conn)
+        idle = self._idle.get(key)
+        if idle is None:
+            idle = self._idle[key] = collections.deque()
+        idle.append(conn)
+
+    async def close(self):
+        """Close the idle connections and reject further acquire() calls.
+
+        Connections in use are closed when they are released.
+        """
+        self._closed = True
+        for waiters in self._waiters.values():
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(
+                        RuntimeError('the connection pool is closed'))
+        self._waiters.clear()
+        writers = []
+        for idle in self._idle.values():
+            while idle:
+                conn = idle.pop()
+                if conn.idle_handle is not None:
+                    conn.idle_handle.cancel()
+                conn.writer.close()
+                writers.append(conn.writer)
+                self._free_slot(conn.key)
+        self._idle.clear()
+        for writer in writers:
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
@@ -68,13 +68,15 @@ def _put(self, item):
 
     # End of the overridable methods.
 
-    def _wakeup_next(self, waiters):
-        # Wake up the next waiter (if any) that isn't cancelled.
+    def _wakeup_next(self, waiters, n=1):
+        # Wake up the next n waiters (if any) that aren't cancelled.
         while waiters:
             waiter = waiters.popleft()
             if not waiter.done():
                 waiter.set_result(None)
-                break
+                n -= 1
+                if not n:
+                    break
 
     def __repr__(self):
         return f'<{type(self).__name__} at {id(self):#x} {self._format()}>'
@@ -131,28 +133,53 @@ async def put(self, item):
         Raises QueueShutDown if the queue has been shut down.
         """
         while self.full():
-            if self._is_shutdown:
-                raise QueueShutDown
-            putter = self._get_loop().create_future()
-            self._putters.append(putter)
-            try:
-                await putter
-            except:
-                putter.cancel()  # Just in case putter is not done yet.
-                try:
-                    # Clean self._putters from canceled putters.
-                    self._putters.remove(putter)
-                except ValueError:
-                    # The putter could be removed from self._putters by a
-                    # previous get_nowait call or a shutdown call.
-                    pass
-                if not self.full() and not putter.cancelled():
-                    # We were woken up by get_nowait(), but can't take
-                    # the call.  Wake up the next in line.
-                    self._wakeup_next(self._putters)
-                raise
+            await self._wait_for_free_slot()
         return self.put_nowait(item)
 
+    async def put_many(self, items):
+        """Put all items of an iterable into the queue.
+
+        The items are put in order.  As long as the queue has free slots,
+        as many items as fit are put at once, waking up to that many getters.
+        If the queue is full, wait until free slots are available.
+
+        Raises QueueShutDown if the queue has been shut down.  In that case,
+        the items put before the queue was shut down remain in the queue.
+        """
+        items = list(items)
+        start = 0
+        while start < len(items):
+            while self.full():
+                await self._wait_for_free_slot()
+            if self._maxsize <= 0:
+                stop = len(items)
+            else:
+                stop = start + self._maxsize - self.qsize()
+            self.put_many_nowait(items[start:stop])
+            start = stop
+
+    async def _wait_for_free_slot(self):
+        if self._is_shutdown:
+            raise QueueShutDown
+        putter = self._get_loop().create_future()
+        self._putters.append(putter)
+        try:
+            await putter
+        except:
+            putter.cancel()  # Just in case putter is not done yet.
+            try:
+                # Clean self._putters from canceled putters.
+                self._putters.remove(putter)
+            except ValueError:
+                # The putter could be removed from self._putters by a
+                # previous get_nowait call or a shutdown call.
+                pass
+            if not self.full() and not putter.cancelled():
+                # We were woken up by get_nowait(), but can't take
+                # the call.  Wake up the next in line.
+                self._wakeup_next(self._putters)
+            raise
+
     def put_nowait(self, item):
         """Put an item into the queue without blocking.
 
@@ -169,6 +196,26 @@ def put_nowait(self, item):
         self._finished.clear()
         self._wakeup_next(self._getters)
 
+    def put_many_nowait(self, items):
+        """Put all items of an iterable into the queue without blocking.
+
+        If there are not enough free slots for all items, raise QueueFull
+        and put none of them.  Up to one getter per item is woken up.
+
+        Raises QueueShutDown if the queue has been shut down.
+        """
+        if self._is_shutdown:
+            raise QueueShutDown
+        items = list(items)
+        if self._maxsize > 0 and self.qsize() + len(items) > self._maxsize:
+            raise QueueFull
+        for item in items:
+            self._put(item)
+        if items:
+            self._unfinished_tasks += len(items)
+            self._finished.clear()
+            self._wakeup_next(self._getters, len(items))
+
     async def get(self):
         """Remove and return an item from the queue.
 
@@ -178,28 +225,47 @@ async def get(self):
         if the queue has been shut down immediately.
         """
         while self.empty():
-            if self._is_shutdown and self.empty():
-                raise QueueShutDown
-            getter = self._get_loop().create_future()
-            self._getters.append(getter)
-            try:
-                await getter
-            except:
-                getter.cancel()  # Just in case getter is not done yet.
-                try:
-                    # Clean self._getters from canceled getters.
-                    self._getters.remove(getter)
-                except ValueError:
-                    # The getter could be removed from self._getters by a
-                    # previous put_nowait call, or a shutdown call.
-                    pass
-                if not self.empty() and not getter.cancelled():
-                    # We were woken up by put_nowait(), but can't take
-                    # the call.  Wake up the next in line.
-                    self._wakeup_next(self._getters)
-                raise
+            await self._wait_for_item()
         return self.get_nowait()
 
+    async def get_many(self, max_items=None):
+        """Remove and return a list of items from the queue.
+
+        If queue is empty, wait until an item is available.  Then return all
+        items immediately available, but no more than max_items if it is not
+        None, without waiting for more.
+
+        Raises QueueShutDown if the queue has been shut down and is empty, or
+        if the queue has been shut down immediately.
+        """
+        if max_items is not None and max_items < 1:
+            raise ValueError("'max_items' must be None or a positive integer")
+        while self.empty():
+            await self._wait_for_item()
+        return self.get_many_nowait(max_items)
+
+    async def _wait_for_item(self):
+        if self._is_shutdown and self.empty():
+            raise QueueShutDown
+        getter = self._get_loop().create_future()
+        self._getters.append(getter)
+        try:
+            await getter
+        except:
+            getter.cancel()  # Just in case getter is not done yet.
+            try:
+                # Clean self._getters from canceled getters.
+                self._getters.remove(getter)
+            except ValueError:
+                # The getter could be removed from self._getters by a
+                # previous put_nowait call, or a shutdown call.
+                pass
+            if not self.empty() and not getter.cancelled():
+                # We were woken up by put_nowait(), but can't take
+                # the call.  Wake up the next in line.
+                self._wakeup_next(self._getters)
+            raise
+
     def get_nowait(self):
         """Remove and return an item from the queue.
 
@@ -216,6 +282,29 @@ def get_nowait(self):
         self._wakeup_next(self._putters)
         return item
 
+    def get_many_nowait(self, max_items=None):
+        """Remove and return a list of items from the queue.
+
+        Return all items immediately available, but no more than max_items
+        if it is not None.  Up to one putter per item is woken up.  If no
+        item is available, raise QueueEmpty.
+
+        Raises QueueShutDown if the queue has been shut down and is empty, or
+        if the queue has been shut down immediately.
+        """
+        if max_items is not None and max_items < 1:
+            raise ValueError("'max_items' must be None or a positive integer")
+        if self.empty():
+            if self._is_shutdown:
+                raise QueueShutDown
+            raise QueueEmpty
+        n = self.qsize()
+        if max_items is not None:
+            n = min(n, max_items)
+        items = [self._get() for _ in range(n)]
+        self._wakeup_next(self._putters, n)
+        return items
+
     def task_done(self):
         """Indicate that a formerly enqueued task is complete.
 
@@ -0,0 +1,140 @@
+"""Caching of getaddrinfo() lookups."""
+
+__all__ = ('ResolverCache',)
+
+import collections
+import socket
+
+from . import events
+from . import tasks
+
+
+_CacheInfo = collections.namedtuple(
+    'ResolverCacheInfo', ['hits', 'misses', 'coalesced', 'maxsize', 'currsize'])
+
+
+async def _default_resolver(host, port, *, family=0, type=0, proto=0, flags=0):
+    loop = events.get_running_loop()
+    return await loop.run_in_executor(
+        None, socket.getaddrinfo, host, port, family, type, proto, flags)
+
+
+class ResolverCache:
+    """A cache of getaddrinfo() results, for use by an event loop.
+
+    Results are kept for *ttl* seconds, and failed lookups (which raise
+    an OSError such as socket.gaierror) for *negative_ttl* seconds.  At
+    most *maxsize* results are kept, the least recently used ones are
+    evicted first.  Concurrent lookups of the same address are coalesced
+    into a single call of the resolver.
+
+    *resolver* is a coroutine function with the signature of
+    loop.getaddrinfo(), which performs the actual lookups.  By default,
+    socket.getaddrinfo() is called in the default executor of the loop.
+    """
+
+    def __init__(self, *, ttl=60.0, negative_ttl=5.0, maxsize=1024,
+                 resolver=None):
+        if ttl < 0:
+            raise ValueError('ttl must be non-negative')
+        if negative_ttl < 0:
+            raise ValueError('negative_ttl must be non-negative')
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+        if resolver is None:
+            resolver = _default_resolver
+        elif not callable(resolver):
+            raise TypeError('resolver must be a callable or None')
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._maxsize = maxsize
+        self._resolver = resolver
+        # Map a lookup key to an (expiration time, result, error) tuple, in
+        # least recently used order.  error is the (type, args) tuple of the
+        # exception of a failed lookup: a new exception is raised on every
+        # hit, so that callers do not share its traceback and context.
+        self._cache = collections.OrderedDict()
+        # Map a lookup key to the task performing it.
+        self._pending = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+
+    def __repr__(self):
+        return (f'<{self.__class__.__name__} ttl={self._ttl} '
+                f'negative_ttl={self._negative_ttl} '
+                f'maxsize={self._maxsize} currsize={len(self._cache)}>')
+
+    async def getaddrinfo(self, host, port, *,
+                          family=0, type=0, proto=0, flags=0):
+        """Return the cached result of a lookup, or perform it."""
+        key = (host, port, family, type, proto, flags)
+        loop = events.get_running_loop()
+        entry = self._cache.get(key)
+        if entry is not None:
+            expires, result, error = entry
+            if loop.time() < expires:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                if error is not None:
+                    exc_type, args = error
+                    raise exc_type(*args)
+                return list(result)
+            del self._cache[key]
+
+        task = self._pending.get(key)
+        if task is None:
+            self._misses += 1
+            task = loop.create_task(self._resolve(key))
+            self._pending[key] = task
+        else:
+            self._coalesced += 1
+        # Cancelling one caller must not cancel the lookup shared with
+        # the other ones.
+        return list(await tasks.shield(task))
+
+    async def _resolve(self, key):
+        host, port, family, type, proto, flags = key
+        loop = events.get_running_loop()
+        try:
+            result = await self._resolver(host, port, family=family,
+                                          type=type, proto=proto,
+                                          flags=flags)
+        except OSError as exc:
+            self._store(key, loop.time() + self._negative_ttl, None,
+                        (exc.__class__, exc.args))
+            raise
+        else:
+            result = tuple(result)
+            self._store(key, loop.time() + self._ttl, result, None)
+            return result
+        finally:
+            del self._pending[key]
+
+    def _store(self, key, expires, result, error):
+        if error is None:
+            if not self._ttl:
+                return
+        elif not self._negative_ttl:
+            return
+        self._cache[key] = (expires, result, error)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+
+    def cache_info(self):
+        """Report cache statistics.
+
+        Return a named tuple with the number of hits, misses and coalesced
+        lookups, the maximum size and the current size of the cache.
+        """
+        return _CacheInfo(self._hits, self._misses, self._coalesced,
+                          self._maxsize, len(self._cache))
+
+    def cache_clear(self):
+        """Clear the cache and its statistics.
+
+        Lookups in progress are not affected.
+        """
+        self._cache.clear()
+        self._hits = self._misses = self._coalesced = 0
@@ -936,6 +936,10 @@ def __init__(self, loop, sock, protocol, waiter=None,
         super().__init__(loop, sock, protocol, extra, server)
         self._eof = False
         self._empty_waiter = None
+        # Number of send()/sendmsg() calls which wrote data, and number of
+        # buffers they flushed completely.
+        self._write_calls = 0
+        self._buffers_written = 0
         if _HAS_SENDMSG:
             self._write_ready = self._write_sendmsg
         else:
@@ -1077,8 +1081,10 @@ def write(self, data):
                 self._fatal_error(exc, 'Fatal write error on socket transport')
                 return
             else:
+                self._write_calls += 1
                 data = memoryview(data)[n:]
                 if not data:
+                    self._buffers_written += 1
                     return
             # Not all was written; register write handler.
             self._loop._add_writer(self._sock_fd, self._write_ready)
@@ -1096,7 +1102,8 @@ def _write_sendmsg(self):
             return
         try:
             nbytes = self._sock.sendmsg(self._get_sendmsg_buffer())
-            self._adjust_leftover_buffer(nbytes)
+            self._write_calls += 1
+            self._buffers_written += self._adjust_leftover_buffer(nbytes)
         except (BlockingIOError, InterruptedError):
             pass
         except (SystemExit, KeyboardInterrupt):
@@ -1118,16 +1125,21 @@ def _write_sendmsg(self):
                 elif self._eof:
                     self._sock.shutdown(socket.SHUT_WR)
 
-    def _adjust_leftover_buffer(self, nbytes: int) -> None:
+    def _adjust_leftover_buffer(self, nbytes: int) -> int:
+        # Remove nbytes of sent data from the buffer and return the number
+        # of buffers which were sent completely.
         buffer = self._buffer
+        count = 0
         while nbytes:
             b = buffer.popleft()
             b_len = len(b)
             if b_len <= nbytes:
                 nbytes -= b_len
+                count += 1
             else:
                 buffer.appendleft(b[nbytes:])
                 break
+        return count
 
     def _write_send(self):
         assert self._buffer, 'Data should not be empty'
@@ -1136,9 +1148,12 @@ def _write_send(self):
         try:
             buffer = self._buffer.popleft()
             n = self._sock.send(buffer)
+            self._write_calls += 1
             if n != len(buffer):
                 # Not all data was written
                 self._buffer.appendleft(buffer[n:])
+            else:
+                self._buffers_written += 1
         except (BlockingIOError, InterruptedError):
             pass
         except (SystemExit, KeyboardInterrupt):
@@ -1181,6 +1196,15 @@ def writelines(self, list_of_data):
             self._conn_lost += 1
             return
 
+        if self._buffer:
+            # A write handler is already registered: the socket is not
+            # writable, so just queue the data for it.
+            self._buffer.extend([memoryview(data) for data in list_of_data])
+            self._maybe_pause_protocol()
+            return
+
+        # The buffers are never joined: _write_sendmsg() sends them all
+        # at once with a single scatter/gather system call.
         self._buffer.extend([memoryview(data) for data in list_of_data])
         self._write_ready()
         # If the entire buffer couldn't be written, register a write handler
@@ -763,6 +763,40 @@ async def readexactly(self, n):
         self._maybe_resume_transport()
         return data
 
+    async def readinto(self, buffer):
+        """Read up to len(buffer) bytes from the stream into buffer.
+
+        buffer must be a writable bytes-like object.  Return the number of
+        bytes read, as soon as at least 1 byte is available in the internal
+        buffer.  If EOF is received before any byte is read, return 0.
+
+        The data is copied directly from the internal buffer into buffer,
+        without creating an intermediate bytes object.
+
+        If stream was paused, this function will automatically resume it if
+        needed.
+        """
+        if self._exception is not None:
+            raise self._exception
+
+        with memoryview(buffer) as m, m.cast('B') as view:
+            if view.readonly:
+                raise TypeError('readinto() argument must be a writable '
+                                'bytes-like object')
+            if not view:
+                return 0
+
+            if not self._buffer and not self._eof:
+                await self._wait_for_data('readinto')
+
+            n = min(len(self._buffer), len(view))
+            with memoryview(self._buffer) as data:
+                view[:n] = data[:n]
+        # Removing a prefix of a bytearray does not move the remaining data.
+        del self._buffer[:n]
+        self._maybe_resume_transport()
+        return n
+
     def __aiter__(self):
         return self
 
@@ -11,6 +11,7 @@
     'get_frame_info',
     'Strategy',
     'train_dict',
+    'ZstdPool',
 
     # compression.zstd._zstdfile
     'open',
@@ -30,7 +31,8 @@
 import enum
 from _zstd import (ZstdCompressor, ZstdDecompressor, ZstdDict, ZstdError,
                    get_frame_size, zstd_version)
-from compression.zstd._zstdfile import ZstdFile, open, _nbytes
+from compression.zstd._zstdfile import (ZstdFile, open, _nbytes,
+                                        _threads_options)
 
 # zstd_version_number is (MAJOR * 100 * 100 + MINOR * 100 + RELEASE)
 zstd_version_info = (*divmod(_zstd.zstd_version_number // 100, 100),
@@ -133,7 +135,7 @@ def finalize_dict(zstd_dict, /, samples, dict_size, level):
     return ZstdDict(dict_content)
 
 
-def compress(data, level=None, options=None, zstd_dict=None):
+def compress(data, level=None, options=None, zstd_dict=None, *, threads=1):
     """Return Zstandard compressed *data* as bytes.
 
     *level* is an int specifying the compression level to use, defaulting to
@@ -142,9 +144,12 @@ def compress(data, level=None, options=None, zstd_dict=None):
     parameters. See CompressionParameter for more on options.
     *zstd_dict* is a ZstdDict object, a pre-trained Zstandard dictionary. See
     the function train_dict for how to train a ZstdDict on sample data.
+    *threads* is the number of threads used to compress the data, a shortcut
+    for the CompressionParameter.nb_workers option.
 
     For incremental compression, use a ZstdCompressor instead.
     """
+    level, options = _threads_options(level, options, threads)
     comp = ZstdCompressor(level=level, options=options, zstd_dict=zstd_dict)
     return comp.compress(data, mode=ZstdCompressor.FLUSH_FRAME)
 
@@ -172,6 +177,55 @@ def decompress(data, zstd_dict=None, options=None):
     return b''.join(results)
 
 
+class ZstdPool:
+    """A pool of compressors sharing a Zstandard dictionary.
+
+    Creating a compressor and loading a dictionary into it costs more than
+    compressing a small message. A ZstdPool keeps the compressors bound to
+    *zstd_dict* and reuses them for every frame, so that many small
+    messages can be compressed and decompressed with a low per-call overhead.
+    The dictionary is digested once and shared by all the compressors and
+    decompressors of the pool.
+
+    *zstd_dict*, *level* and *options* are the same as for compress().
+    *maxsize* is the maximum number of idle compressors kept in the pool, or
+    None for no limit.
+
+    The compress() and decompress() methods are thread-safe: each call checks
+    out a compressor, so concurrent threads never share one.
+    """
+
+    def __init__(self, zstd_dict=None, level=None, options=None, *,
+                 maxsize=None):
+        if isinstance(zstd_dict, ZstdDict):
+            zstd_dict = zstd_dict.as_digested_dict
+        self._zstd_dict = zstd_dict
+        self._level = level
+        self._options = options
+        self._maxsize = maxsize
+        # Create the first compressor now to validate the arguments.
+        self._compressors = [self._new_compressor()]
+
+    def _new_compressor(self):
+        return ZstdCompressor(level=self._level, options=self._options,
+                              zstd_dict=self._zstd_dict)
+
+    def compress(self, data):
+        """Return *data* compressed as a single Zstandard frame."""
+        try:
+            compressor = self._compressors.pop()
+        except IndexError:
+            compressor = self._new_compressor()
+        result = compressor.compress(data, mode=ZstdCompressor.FLUSH_FRAME)
+        if self._maxsize is None or len(self._compressors) < self._maxsize:
+            self._compressors.append(compressor)
+        return result
+
+    def decompress(self, data):
+        """Decompress one or more Zstandard frames of *data*."""
+        return decompress(data, zstd_dict=self._zstd_dict)
+
+
 class CompressionParameter(enum.IntEnum):
     """Compression parameters."""
 
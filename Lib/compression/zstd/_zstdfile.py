@@ -1,6 +1,7 @@
 import io
 from os import PathLike
-from _zstd import ZstdCompressor, ZstdDecompressor, ZSTD_DStreamOutSize
+from _zstd import (ZstdCompressor, ZstdDecompressor, ZSTD_DStreamOutSize,
+                   ZSTD_c_compressionLevel, ZSTD_c_nbWorkers)
 from compression._common import _streams
 
 __all__ = ('ZstdFile', 'open')
@@ -17,6 +18,23 @@ def _nbytes(dat, /):
         return mv.nbytes
 
 
+def _threads_options(level, options, threads):
+    # Translate *threads* into the nb_workers compression parameter.
+    if threads == 1:
+        return level, options
+    if threads < 1:
+        raise ValueError('threads must be at least 1')
+    if options is None:
+        options = {}
+        if level is not None:
+            options[ZSTD_c_compressionLevel] = level
+            level = None
+    else:
+        options = dict(options)
+    options[ZSTD_c_nbWorkers] = threads
+    return level, options
+
+
 class ZstdFile(_streams.BaseStream):
     """A file-like object providing transparent Zstandard (de)compression.
 
@@ -31,7 +49,7 @@ class ZstdFile(_streams.BaseStream):
     FLUSH_FRAME = ZstdCompressor.FLUSH_FRAME
 
     def __init__(self, file, /, mode='r', *,
-                 level=None, options=None, zstd_dict=None):
+                 level=None, options=None, zstd_dict=None, threads=1):
         """Open a Zstandard compressed file in binary mode.
 
         *file* can be either an file-like object, or a file name to open.
@@ -49,6 +67,10 @@ def __init__(self, file, /, mode='r', *,
 
         *zstd_dict* is an optional ZstdDict object, a pre-trained Zstandard
         dictionary. See train_dict() to train ZstdDict on sample data.
+
+        *threads* is the number of threads used to compress the data. If it
+        is greater than 1, the input is split into jobs compressed by as many
+        worker threads. Writing only blocks when all workers are busy.
         """
         self._fp = None
         self._close_fp = False
@@ -63,11 +85,14 @@ def __init__(self, file, /, mode='r', *,
         if mode == 'r':
             if level is not None:
                 raise TypeError('level is illegal in read mode')
+            if threads != 1:
+                raise TypeError('threads is illegal in read mode')
             self._mode = _MODE_READ
         elif mode in {'w', 'a', 'x'}:
             if level is not None and not isinstance(level, int):
                 raise TypeError('level must be int or None')
             self._mode = _MODE_WRITE
+            level, options = _threads_options(level, options, threads)
             self._compressor = ZstdCompressor(level=level, options=options,
                                               zstd_dict=zstd_dict)
             self._pos = 0
@@ -293,7 +318,7 @@ def writable(self):
 
 
 def open(file, /, mode='rb', *, level=None, options=None, zstd_dict=None,
-         encoding=None, errors=None, newline=None):
+         encoding=None, errors=None, newline=None, threads=1):
     """Open a Zstandard compressed file in binary or text mode.
 
     file can be either a file name (given as a str, bytes, or PathLike object),
@@ -303,8 +328,8 @@ def open(file, /, mode='rb', *, level=None, options=None, zstd_dict=None,
     The mode parameter can be 'r', 'rb' (default), 'w', 'wb', 'x', 'xb', 'a',
     'ab' for binary mode, or 'rt', 'wt', 'xt', 'at' for text mode.
 
-    The level, options, and zstd_dict parameters specify the settings the same
-    as ZstdFile.
+    The level, options, zstd_dict and threads parameters specify the settings
+    the same as ZstdFile.
 
     When using read mode (decompression), the options parameter is a dict
     representing advanced decompression options. The level parameter is not
@@ -337,7 +362,7 @@ def open(file, /, mode='rb', *, level=None, options=None, zstd_dict=None,
             raise ValueError('Argument "newline" not supported in binary mode')
 
     binary_file = ZstdFile(file, mode, level=level, options=options,
-                           zstd_dict=zstd_dict)
+                           zstd_dict=zstd_dict, threads=threads)
 
     if text_mode:
         return io.TextIOWrapper(binary_file, encoding, errors, newline)
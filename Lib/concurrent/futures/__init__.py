@@ -14,6 +14,7 @@
                                       BrokenExecutor,
                                       Future,
                                       Executor,
+                                      ExecutorMetrics,
                                       wait,
                                       as_completed)
 
@@ -27,6 +28,7 @@
     'BrokenExecutor',
     'Future',
     'Executor',
+    'ExecutorMetrics',
     'wait',
     'as_completed',
     'ProcessPoolExecutor',
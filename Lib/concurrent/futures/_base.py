@@ -3,6 +3,7 @@
 
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 
+import bisect
 import collections
 import logging
 import threading
@@ -587,9 +588,172 @@ def _get_snapshot(self):
 
     __class_getitem__ = classmethod(types.GenericAlias)
 
+class _MetricsRecord(object):
+    """The counters of an ExecutorMetrics written by a single thread."""
+
+    __slots__ = ('started', 'completed', 'failed', 'cancelled',
+                 'wait_time', 'run_time', 'wait_times', 'run_times')
+
+    def __init__(self, nbuckets):
+        self.started = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.wait_time = 0.0
+        self.run_time = 0.0
+        self.wait_times = [0] * nbuckets
+        self.run_times = [0] * nbuckets
+
+
+class ExecutorMetrics(object):
+    """Counters and timing histograms of the calls run by an executor.
+
+    The attributes can be read at any time without taking a lock.  Each
+    counter is written by a single thread, so no update is ever lost, but
+    the values read while calls are running are not guaranteed to be
+    consistent with each other.
+    """
+
+    # Upper bounds in seconds of the buckets of the timing histograms,
+    # from about a microsecond to about 17 minutes.  The histograms have
+    # an extra bucket for the times above the last bound.
+    BUCKETS = tuple(2.0 ** e for e in range(-20, 11))
+
+    def __init__(self, on_task_start=None, on_task_stop=None):
+        if on_task_start is not None and not callable(on_task_start):
+            raise TypeError("on_task_start must be a callable or None")
+        if on_task_stop is not None and not callable(on_task_stop):
+            raise TypeError("on_task_stop must be a callable or None")
+        self._on_task_start = on_task_start
+        self._on_task_stop = on_task_stop
+        # Only written by the executor with its submit lock held.
+        self._submitted = 0
+        self._records = []
+        self._local = threading.local()
+
+    def _record(self):
+        # Return the record owned by the current thread.
+        try:
+            return self._local.record
+        except AttributeError:
+            record = self._local.record = _MetricsRecord(len(self.BUCKETS) + 1)
+            self._records.append(record)
+            return record
+
+    def _task_cancelled(self):
+        self._record().cancelled += 1
+
+    def _task_started(self, future):
+        """Count a started call and return its start time."""
+        self._record().started += 1
+        if self._on_task_start is not None:
+            try:
+                self._on_task_start(future)
+            except Exception:
+                LOGGER.exception('exception calling on_task_start for %r',
+                                 future)
+        return time.monotonic()
+
+    def _task_stopped(self, future, wait_time, run_time, failed=False):
+        record = self._record()
+        record.wait_time += wait_time
+        record.run_time += run_time
+        record.wait_times[bisect.bisect_left(self.BUCKETS, wait_time)] += 1
+        record.run_times[bisect.bisect_left(self.BUCKETS, run_time)] += 1
+        if failed:
+            record.failed += 1
+        record.completed += 1
+        if self._on_task_stop is not None:
+            try:
+                self._on_task_stop(future, wait_time, run_time)
+            except Exception:
+                LOGGER.exception('exception calling on_task_stop for %r',
+                                 future)
+
+    def _sum(self, name):
+        return sum([getattr(record, name) for record in self._records])
+
+    def _histogram(self, name):
+        counts = [0] * (len(self.BUCKETS) + 1)
+        for record in self._records:
+            for i, count in enumerate(getattr(record, name)):
+                counts[i] += count
+        return counts
+
+    @property
+    def submitted(self):
+        """The number of calls submitted to the executor."""
+        return self._submitted
+
+    @property
+    def started(self):
+        """The number of calls which started running."""
+        return self._sum('started')
+
+    @property
+    def completed(self):
+        """The number of calls which returned or raised an exception."""
+        return self._sum('completed')
+
+    @property
+    def failed(self):
+        """The number of calls which raised an exception."""
+        return self._sum('failed')
+
+    @property
+    def cancelled(self):
+        """The number of calls cancelled before they started running."""
+        return self._sum('cancelled')
+
+    @property
+    def queued(self):
+        """The number of calls waiting to be started."""
+        return max(0, self.submitted - self.started - self.cancelled)
+
+    @property
+    def running(self):
+        """The number of calls currently running."""
+        return max(0, self.started - self.completed)
+
+    @property
+    def wait_time(self):
+        """The total time in seconds calls waited before running."""
+        return self._sum('wait_time')
+
+    @property
+    def run_time(self):
+        """The total time in seconds spent running calls."""
+        return self._sum('run_time')
+
+    def wait_time_histogram(self):
+        """Return the number of calls per bucket of waiting time.
+
+        The list has one item per bound in BUCKETS, counting the calls that
+        waited no more than that bound (and more than the previous one),
+        plus a last item for the calls that waited longer.
+        """
+        return self._histogram('wait_times')
+
+    def run_time_histogram(self):
+        """Return the number of calls per bucket of running time.
+
+        The buckets are the same as for wait_time_histogram().
+        """
+        return self._histogram('run_times')
+
+    def __repr__(self):
+        return ('<%s submitted=%d queued=%d running=%d completed=%d '
+                'failed=%d cancelled=%d>'
+                % (self.__class__.__name__, self.submitted, self.queued,
+                   self.running, self.completed, self.failed,
+                   self.cancelled))
+
+
 class Executor(object):
     """This is an abstract base class for concrete asynchronous executors."""
 
+    _metrics = None
+
     def submit(self, fn, /, *args, **kwargs):
         """Submits a callable to be executed with the given arguments.
 
@@ -671,6 +835,30 @@ def result_iterator():
                     future.cancel()
         return result_iterator()
 
+    def enable_metrics(self, *, on_task_start=None, on_task_stop=None):
+        """Starts collecting metrics about the calls run by the executor.
+
+        Any metrics collected before are discarded.
+
+        Args:
+            on_task_start: An optional callable called with the future of
+                a call when the call starts running.
+            on_task_stop: An optional callable called with the future of
+                a call, the time it waited before running and the time it
+                ran (in seconds) when the call returns or raises, before
+                the future is completed.
+
+        Returns:
+            An ExecutorMetrics instance, which is updated as calls are run.
+        """
+        metrics = ExecutorMetrics(on_task_start, on_task_stop)
+        self._metrics = metrics
+        return metrics
+
+    def disable_metrics(self):
+        """Stops collecting metrics about the calls run by the executor."""
+        self._metrics = None
+
     def shutdown(self, wait=True, *, cancel_futures=False):
         """Clean-up the resources associated with the Executor.
 
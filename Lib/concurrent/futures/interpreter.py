@@ -1,6 +1,7 @@
 """Implements InterpreterPoolExecutor."""
 
 from concurrent import interpreters
+import itertools
 import sys
 from . import thread as _thread
 import traceback
@@ -22,6 +23,22 @@ def do_call(results, func, args, kwargs):
         raise  # re-raise
 
 
+def do_call_chunk(fn, chunk):
+    """Call *fn* for each tuple of arguments in *chunk*.
+
+    The whole chunk is run in a single call into the worker interpreter.
+    The results are returned as a tuple, so that shareable results
+    (e.g. bytes, str, int or tuples of those) are passed back to the
+    calling interpreter without being pickled.
+    """
+    return tuple([fn(*args) for args in chunk])
+
+
+def _chain_from_iterable_of_tuples(iterable):
+    for element in iterable:
+        yield from element
+
+
 class WorkerContext(_thread.WorkerContext):
 
     @classmethod
@@ -106,7 +123,7 @@ def prepare_context(cls, initializer, initargs):
         return WorkerContext.prepare(initializer, initargs)
 
     def __init__(self, max_workers=None, thread_name_prefix='',
-                 initializer=None, initargs=()):
+                 initializer=None, initargs=(), *, work_stealing=False):
         """Initializes a new InterpreterPoolExecutor instance.
 
         Args:
@@ -116,8 +133,52 @@ def __init__(self, max_workers=None, thread_name_prefix='',
             initializer: A callable or script used to initialize
                 each worker interpreter.
             initargs: A tuple of arguments to pass to the initializer.
+            work_stealing: If true, give each worker its own work queue
+                and let idle workers steal work from busy ones.
         """
         thread_name_prefix = (thread_name_prefix or
                               (f"InterpreterPoolExecutor-{self._counter()}"))
         super().__init__(max_workers, thread_name_prefix,
-                         initializer, initargs)
+                         initializer, initargs, work_stealing=work_stealing)
+
+    def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None):
+        """Returns an iterator equivalent to map(fn, iter).
+
+        Args:
+            fn: A callable that will take as many arguments as there are
+                passed iterables.
+            timeout: The maximum number of seconds to wait. If None, then there
+                is no limit on the wait time.
+            chunksize: If greater than one, the iterables will be chopped into
+                chunks of size chunksize and each chunk will be run in
+                a worker interpreter with a single call.  If set to one,
+                the items in the list will be sent one at a time.
+            buffersize: The number of submitted tasks whose results have not
+                yet been yielded. If the buffer is full, iteration over the
+                iterables pauses until a result is yielded from the buffer.
+                If None, all input elements are eagerly collected, and a task is
+                submitted for each.
+
+        Returns:
+            An iterator equivalent to: map(func, *iterables) but the calls may
+            be evaluated out-of-order.
+
+        Raises:
+            TimeoutError: If the entire result iterator could not be generated
+                before the given timeout.
+            Exception: If fn(*args) raises for any values.
+        """
+        if chunksize < 1:
+            raise ValueError("chunksize must be >= 1.")
+        if chunksize == 1:
+            return super().map(fn, *iterables, timeout=timeout,
+                               buffersize=buffersize)
+
+        # Pass fn as an argument rather than binding it with partial(),
+        # so that it is shared with the worker the same way as by submit().
+        results = super().map(do_call_chunk,
+                              itertools.repeat(fn),
+                              itertools.batched(zip(*iterables), chunksize),
+                              timeout=timeout,
+                              buffersize=buffersize)
+        return _chain_from_iterable_of_tuples(results)
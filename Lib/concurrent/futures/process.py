@@ -47,13 +47,19 @@
 
 import os
 from concurrent.futures import _base
+import collections
 import queue
 import multiprocessing as mp
 # This import is required to load the multiprocessing.connection submodule
 # so that it can be accessed later as `mp.connection`
 import multiprocessing.connection
 from multiprocessing.queues import Queue
+from multiprocessing.reduction import ForkingPickler
+import array
+import io
+import pickle
 import threading
+import time
 import weakref
 from functools import partial
 import itertools
@@ -118,6 +124,13 @@ def _python_exit():
 EXTRA_QUEUED_CALLS = 1
 
 
+# Parameters of ProcessPoolExecutor.map() when chunksize is None: chunks are
+# sized so that a worker spends about _ADAPTIVE_CHUNK_TIME seconds on each of
+# them and so that their arguments pickle to about _ADAPTIVE_CHUNK_BYTES at
+# most.  The size of the chunks at most doubles from one chunk to the next.
+_ADAPTIVE_CHUNK_TIME = 0.05
+_ADAPTIVE_CHUNK_BYTES = 1 << 20
+
 # On Windows, WaitForMultipleObjects is used to wait for processes to finish.
 # It can wait on, at most, 63 objects. There is an overhead of two objects:
 # - the result queue reader
@@ -148,13 +161,20 @@ def _rebuild_exc(exc, tb):
     return exc
 
 class _WorkItem(object):
+    # The ExecutorMetrics to update, if the executor collects metrics.
+    metrics = None
+
     def __init__(self, future, fn, args, kwargs):
         self.future = future
         self.fn = fn
         self.args = args
         self.kwargs = kwargs
+        self.payload = None
 
 class _ResultItem(object):
+    # The time spent running the call, only set for timed calls.
+    run_time = None
+
     def __init__(self, work_id, exception=None, result=None, exit_pid=None):
         self.work_id = work_id
         self.exception = exception
@@ -162,11 +182,191 @@ def __init__(self, work_id, exception=None, result=None, exit_pid=None):
         self.exit_pid = exit_pid
 
 class _CallItem(object):
-    def __init__(self, work_id, fn, args, kwargs):
+    # Set to true on the instance to have the worker time the call.  This is
+    # a class attribute so that untimed call items do not pickle it.
+    timed = False
+
+    def __init__(self, work_id, fn, args, kwargs, payload=None):
         self.work_id = work_id
         self.fn = fn
         self.args = args
         self.kwargs = kwargs
+        # A _SharedMemoryPayload holding (fn, args, kwargs), if the executor
+        # uses the shared memory transport.
+        self.payload = payload
+
+
+# Types whose instances are moved to shared memory when they are large enough.
+_SHARED_MEMORY_TYPES = (bytes, bytearray, memoryview, array.array)
+
+
+class _SharedMemoryPickler(ForkingPickler):
+    """Pickler collecting large buffers instead of writing them inline.
+
+    Instances of _SHARED_MEMORY_TYPES are replaced by persistent ids, and
+    out-of-band buffers of objects supporting pickle protocol 5 are
+    collected through the buffer callback, as long as they are at least
+    *threshold* bytes long.
+    """
+
+    def __init__(self, file, threshold):
+        super().__init__(file, 5, buffer_callback=self._buffer_callback)
+        self.threshold = threshold
+        self.buffers = []
+        self.out_of_band = []
+
+    def persistent_id(self, obj):
+        cls = type(obj)
+        if cls not in _SHARED_MEMORY_TYPES:
+            return None
+        m = memoryview(obj)
+        if m.nbytes < self.threshold or not m.c_contiguous:
+            m.release()
+            return None
+        if cls is memoryview:
+            meta = (m.format, m.shape, m.readonly)
+            try:
+                # Check that the view can be rebuilt from raw bytes.
+                m.cast('B').cast(m.format, m.shape).release()
+            except (TypeError, ValueError):
+                m.release()
+                return None
+        elif cls is array.array:
+            meta = obj.typecode
+        else:
+            meta = None
+        self.buffers.append(m.cast('B'))
+        m.release()
+        return (cls.__name__, len(self.buffers) - 1, meta)
+
+    def _buffer_callback(self, buf):
+        raw = buf.raw()
+        if raw.nbytes < self.threshold:
+            # Serialize the buffer in-band.
+            raw.release()
+            return True
+        self.out_of_band.append(len(self.buffers))
+        self.buffers.append(raw)
+        return False
+
+
+class _SharedMemoryUnpickler(pickle.Unpickler):
+
+    def __init__(self, file, view, **kwargs):
+        super().__init__(file, **kwargs)
+        self.view = view
+
+    def persistent_load(self, pid):
+        kind, index, meta = pid
+        with self.view(index) as m:
+            if kind == 'bytes':
+                return bytes(m)
+            elif kind == 'bytearray':
+                return bytearray(m)
+            elif kind == 'array':
+                a = array.array(meta)
+                a.frombytes(m)
+                return a
+            elif kind == 'memoryview':
+                fmt, shape, readonly = meta
+                data = bytes(m) if readonly else bytearray(m)
+                return memoryview(data).cast(fmt, shape)
+        raise pickle.UnpicklingError(f'unsupported persistent id: {pid!r}')
+
+
+class _SharedMemoryPayload(object):
+    """A pickled object whose large buffers are stored in shared memory.
+
+    Only the pickle data and the name of the shared memory segment are sent
+    through the queues, so large payloads are copied once into the segment
+    by the sender and once out of it by the receiver instead of being
+    written through a pipe.  The creator of the segment registers it with
+    the resource tracker; whoever unlinks it unregisters it.
+    """
+
+    def __init__(self, data, name=None, layout=()):
+        self.data = data
+        self.name = name
+        self.layout = layout
+        # The creator's handle on the segment, never pickled.
+        self._shm = None
+
+    def __reduce__(self):
+        return type(self), (self.data, self.name, self.layout)
+
+    @classmethod
+    def dump(cls, obj, threshold):
+        buf = io.BytesIO()
+        pickler = _SharedMemoryPickler(buf, threshold)
+        try:
+            pickler.dump(obj)
+            data = buf.getvalue()
+            if not pickler.buffers:
+                return cls(data)
+
+            from multiprocessing.shared_memory import SharedMemory
+
+            layout = []
+            offset = 0
+            for m in pickler.buffers:
+                layout.append((offset, m.nbytes))
+                offset += m.nbytes
+            shm = SharedMemory(create=True, size=offset)
+            for (offset, size), m in zip(layout, pickler.buffers):
+                shm.buf[offset:offset + size] = m
+        finally:
+            # Release the views, so that the sent objects can be resized.
+            for m in pickler.buffers:
+                m.release()
+        layout.append(pickler.out_of_band)
+        self = cls(data, shm.name, tuple(layout))
+        self._shm = shm
+        return self
+
+    def load(self, *, unlink=False):
+        """Rebuild the object, copying it out of shared memory.
+
+        If *unlink* is true, the segment is destroyed afterwards, on behalf
+        of the process which created it.
+        """
+        if self.name is None:
+            return pickle.loads(self.data)
+
+        from multiprocessing.shared_memory import SharedMemory
+
+        shm = SharedMemory(self.name, track=False)
+        try:
+            *layout, out_of_band = self.layout
+            def view(index):
+                offset, size = layout[index]
+                return shm.buf[offset:offset + size]
+            buffers = []
+            for index in out_of_band:
+                with view(index) as m:
+                    buffers.append(bytearray(m))
+            unpickler = _SharedMemoryUnpickler(io.BytesIO(self.data), view,
+                                               buffers=buffers)
+            return unpickler.load()
+        finally:
+            shm.close()
+            if unlink:
+                from multiprocessing import resource_tracker
+
+                shm.unlink()
+                resource_tracker.unregister(shm._name, 'shared_memory')
+                self.name = None
+
+    def close(self):
+        """Close the creator's handle on the segment."""
+        if self._shm is not None:
+            self._shm.close()
+
+    def unlink(self):
+        """Destroy the segment from the process which created it."""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
 
 
 class _SafeQueue(Queue):
@@ -182,6 +382,8 @@ def _on_queue_feeder_error(self, e, obj):
             e.__cause__ = _RemoteTraceback('\n"""\n{}"""'.format(''.join(tb)))
             work_item = self.pending_work_items.pop(obj.work_id, None)
             self.thread_wakeup.wakeup()
+            if obj.payload is not None:
+                obj.payload.unlink()
             # work_item can be None if another process terminated. In this
             # case, the executor_manager_thread fails all work_items
             # with BrokenProcessPool
@@ -203,19 +405,93 @@ def _process_chunk(fn, chunk):
     return [fn(*args) for args in chunk]
 
 
+def _process_timed_chunk(fn, chunk):
+    """ Processes a chunk of an iterable passed to map(chunksize=None).
+
+    Same as _process_chunk(), but also returns the time spent on the chunk.
+
+    This function is run in a separate process.
+
+    """
+    start = time.perf_counter()
+    results = [fn(*args) for args in chunk]
+    return time.perf_counter() - start, results
+
+
+class _AdaptiveChunker(object):
+    """Chooses the size of map() chunks from the cost of the previous ones.
+
+    The time spent per item is measured in the worker processes, and the
+    pickled size of an item is sampled on the first item of each chunk.
+    """
+
+    def __init__(self, target_time=_ADAPTIVE_CHUNK_TIME,
+                 target_bytes=_ADAPTIVE_CHUNK_BYTES):
+        self.target_time = target_time
+        self.target_bytes = target_bytes
+        self.item_time = None
+        self.item_bytes = None
+        self.chunksize = 1
+
+    def _smooth(self, old, new):
+        return new if old is None else (old + new) / 2
+
+    def sample(self, args):
+        try:
+            size = len(ForkingPickler.dumps(args))
+        except Exception:
+            # The error will be reported when the chunk is submitted.
+            return
+        self.item_bytes = self._smooth(self.item_bytes, size)
+
+    def record(self, future, n):
+        # Done callback of the future of a chunk of n items.
+        if future.cancelled() or future.exception() is not None:
+            return
+        elapsed, _ = future.result()
+        self.item_time = self._smooth(self.item_time, elapsed / n)
+
+    def next_chunksize(self):
+        if self.item_time is None:
+            # Nothing measured yet: keep the chunks small.
+            return self.chunksize
+        size = self.chunksize * 2
+        if self.item_time > 0:
+            size = min(size, int(self.target_time / self.item_time))
+        if self.item_bytes:
+            size = min(size, int(self.target_bytes / self.item_bytes))
+        self.chunksize = max(1, size)
+        return self.chunksize
+
+
 def _sendback_result(result_queue, work_id, result=None, exception=None,
-                     exit_pid=None):
+                     exit_pid=None, shm_threshold=None, run_time=None):
     """Safely send back the given result or exception"""
+    payload = None
     try:
-        result_queue.put(_ResultItem(work_id, result=result,
-                                     exception=exception, exit_pid=exit_pid))
+        if shm_threshold is not None and exception is None:
+            payload = result = _SharedMemoryPayload.dump(result, shm_threshold)
+        result_item = _ResultItem(work_id, result=result,
+                                  exception=exception, exit_pid=exit_pid)
+        if run_time is not None:
+            result_item.run_time = run_time
+        result_queue.put(result_item)
     except BaseException as e:
+        if payload is not None:
+            payload.unlink()
         exc = _ExceptionWithTraceback(e, e.__traceback__)
-        result_queue.put(_ResultItem(work_id, exception=exc,
-                                     exit_pid=exit_pid))
-
-
-def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=None):
+        result_item = _ResultItem(work_id, exception=exc, exit_pid=exit_pid)
+        if run_time is not None:
+            result_item.run_time = run_time
+        result_queue.put(result_item)
+    else:
+        if payload is not None:
+            # The receiver unlinks the segment.
+            payload.close()
+
+
+def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=None,
+                    shm_threshold=None):
     """Evaluates calls from call_queue and places the results in result_queue.
 
     This worker is run in a separate process.
@@ -227,6 +503,9 @@ def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=N
             to by the worker.
         initializer: A callable initializer, or None
         initargs: A tuple of args for the initializer
+        max_tasks: The maximum number of tasks to run before exiting, or None
+        shm_threshold: The size in bytes above which results are sent back
+            through shared memory, or None
     """
     if initializer is not None:
         try:
@@ -250,16 +529,29 @@ def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=N
             if num_tasks >= max_tasks:
                 exit_pid = os.getpid()
 
+        run_time = start_time = None
         try:
-            r = call_item.fn(*call_item.args, **call_item.kwargs)
+            if call_item.payload is not None:
+                fn, args, kwargs = call_item.payload.load()
+            else:
+                fn, args, kwargs = call_item.fn, call_item.args, call_item.kwargs
+            if call_item.timed:
+                start_time = time.monotonic()
+            r = fn(*args, **kwargs)
         except BaseException as e:
+            if start_time is not None:
+                run_time = time.monotonic() - start_time
             exc = _ExceptionWithTraceback(e, e.__traceback__)
             _sendback_result(result_queue, call_item.work_id, exception=exc,
-                             exit_pid=exit_pid)
+                             exit_pid=exit_pid, run_time=run_time)
         else:
+            if start_time is not None:
+                run_time = time.monotonic() - start_time
             _sendback_result(result_queue, call_item.work_id, result=r,
-                             exit_pid=exit_pid)
+                             exit_pid=exit_pid, shm_threshold=shm_threshold,
+                             run_time=run_time)
             del r
+        fn = args = kwargs = None
 
         # Liberate the resource as soon as possible, to avoid holding onto
         # open files or shared memory that is not needed anymore
@@ -304,6 +596,9 @@ def weakref_cb(_,
 
         self.executor_reference = weakref.ref(executor, weakref_cb)
 
+        # The multiprocessing context, which may own a fork server.
+        self.mp_context = executor._mp_context
+
         # A list of the ctx.Process instances used as workers.
         self.processes = executor._processes
 
@@ -321,6 +616,10 @@ def weakref_cb(_,
         # exiting safely
         self.max_tasks_per_child = executor._max_tasks_per_child
 
+        # Size in bytes above which buffers are sent to the worker processes
+        # through shared memory, or None to always pickle them inline.
+        self.shm_threshold = executor._shared_memory_threshold
+
         # A dict mapping work ids to _WorkItems e.g.
         #     {5: <_WorkItem...>, 6: <_WorkItem...>, ...}
         self.pending_work_items = executor._pending_work_items
@@ -393,15 +692,42 @@ def add_call_item_to_queue(self):
                 work_item = self.pending_work_items[work_id]
 
                 if work_item.future.set_running_or_notify_cancel():
-                    self.call_queue.put(_CallItem(work_id,
-                                                  work_item.fn,
-                                                  work_item.args,
-                                                  work_item.kwargs),
-                                        block=True)
+                    if self.shm_threshold is not None:
+                        call_item = self.shared_call_item(work_id, work_item)
+                        if call_item is None:
+                            continue
+                    else:
+                        call_item = _CallItem(work_id,
+                                              work_item.fn,
+                                              work_item.args,
+                                              work_item.kwargs)
+                    if work_item.metrics is not None:
+                        # The call is counted as started once it is handed
+                        # over to the worker processes.
+                        work_item.start_time = work_item.metrics._task_started(
+                            work_item.future)
+                        call_item.timed = True
+                    self.call_queue.put(call_item, block=True)
                 else:
+                    if work_item.metrics is not None:
+                        work_item.metrics._task_cancelled()
                     del self.pending_work_items[work_id]
                     continue
 
+    def shared_call_item(self, work_id, work_item):
+        # Build a _CallItem whose large buffers are stored in shared memory.
+        # The segment is unlinked once the result has been received.
+        try:
+            payload = _SharedMemoryPayload.dump(
+                (work_item.fn, work_item.args, work_item.kwargs),
+                self.shm_threshold)
+        except BaseException as exc:
+            del self.pending_work_items[work_id]
+            work_item.future.set_exception(exc)
+            return None
+        work_item.payload = payload
+        return _CallItem(work_id, None, None, None, payload)
+
     def wait_result_broken_or_wakeup(self):
         # Wait for a result to be ready in the result_queue while checking
         # that all worker processes are still running, or for a wake up
@@ -438,12 +764,29 @@ def process_result_item(self, result_item):
 
         # Received a _ResultItem so mark the future as completed.
         work_item = self.pending_work_items.pop(result_item.work_id, None)
+        result = result_item.result
+        if isinstance(result, _SharedMemoryPayload):
+            try:
+                result = result.load(unlink=True)
+            except BaseException as exc:
+                result_item.exception = exc
         # work_item can be None if another process terminated (see above)
         if work_item is not None:
+            if work_item.payload is not None:
+                work_item.payload.unlink()
+            if work_item.metrics is not None:
+                run_time = result_item.run_time
+                if run_time is None:
+                    run_time = time.monotonic() - work_item.start_time
+                work_item.metrics._task_stopped(
+                    work_item.future,
+                    work_item.start_time - work_item.submit_time,
+                    run_time,
+                    failed=result_item.exception is not None)
             if result_item.exception is not None:
                 work_item.future.set_exception(result_item.exception)
             else:
-                work_item.future.set_result(result_item.result)
+                work_item.future.set_result(result)
 
     def is_shutting_down(self):
         # Check whether we should start shutting down the executor.
@@ -494,6 +837,18 @@ def _terminate_broken(self, cause):
 
         # Mark pending tasks as failed.
         for work_id, work_item in self.pending_work_items.items():
+            if work_item.payload is not None:
+                work_item.payload.unlink()
+            if work_item.metrics is not None:
+                if work_item.future.running():
+                    # The call was handed over to a worker process.
+                    work_item.metrics._task_stopped(
+                        work_item.future,
+                        work_item.start_time - work_item.submit_time,
+                        time.monotonic() - work_item.start_time,
+                        failed=True)
+                else:
+                    work_item.metrics._task_cancelled()
             try:
                 work_item.future.set_exception(bpe)
             except _base.InvalidStateError:
@@ -534,6 +889,8 @@ def flag_executor_shutting_down(self):
                 for work_id, work_item in self.pending_work_items.items():
                     if not work_item.future.cancel():
                         new_pending_work_items[work_id] = work_item
+                    elif work_item.metrics is not None:
+                        work_item.metrics._task_cancelled()
                 self.pending_work_items = new_pending_work_items
                 # Drain work_ids_queue since we no longer need to
                 # add items to the call queue.
@@ -581,6 +938,11 @@ def _join_executor_internals(self, broken=False):
                 p.terminate()
             p.join()
 
+        # The workers have exited: stop the executor's own fork server, if
+        # any, whether shutdown() waits or not.
+        if hasattr(self.mp_context, '_stop_forkserver'):
+            self.mp_context._stop_forkserver()
+
     def get_n_children_alive(self):
         # This is an upper bound on the number of children alive.
         return sum(p.is_alive() for p in self.processes.values())
@@ -651,7 +1013,9 @@ class BrokenProcessPool(_base.BrokenExecutor):
 
 class ProcessPoolExecutor(_base.Executor):
     def __init__(self, max_workers=None, mp_context=None,
-                 initializer=None, initargs=(), *, max_tasks_per_child=None):
+                 initializer=None, initargs=(), *, max_tasks_per_child=None,
+                 shared_memory_threshold=None, forkserver_preload=None,
+                 forkserver_warmup=None):
         """Initializes a new ProcessPoolExecutor instance.
 
         Args:
@@ -669,6 +1033,18 @@ def __init__(self, max_workers=None, mp_context=None,
                 live as long as the executor. Requires a non-'fork' mp_context
                 start method. When given, we default to using 'spawn' if no
                 mp_context is supplied.
+            shared_memory_threshold: If not None, bytes, bytearray,
+                memoryview and array.array objects and out-of-band pickle
+                buffers of at least this many bytes in arguments and results
+                are transferred through shared memory segments rather than
+                pickled through the queues.
+            forkserver_preload: A list of module names to import in a fork
+                server dedicated to this executor. Requires the 'forkserver'
+                mp_context start method, which is used by default when
+                given.
+            forkserver_warmup: A callable run once in the dedicated fork
+                server after forkserver_preload has been imported. Worker
+                processes inherit the state it prepared.
         """
         _check_system_limits()
 
@@ -687,11 +1063,18 @@ def __init__(self, max_workers=None, mp_context=None,
 
             self._max_workers = max_workers
 
+        preload = (forkserver_preload is not None
+                   or forkserver_warmup is not None)
         if mp_context is None:
-            if max_tasks_per_child is not None:
+            if preload:
+                mp_context = mp.get_context("forkserver")
+            elif max_tasks_per_child is not None:
                 mp_context = mp.get_context("spawn")
             else:
                 mp_context = mp.get_context()
+        if preload:
+            mp_context = mp_context._with_forkserver_preload(
+                forkserver_preload or (), forkserver_warmup)
         self._mp_context = mp_context
 
         # https://github.com/python/cpython/issues/90622
@@ -715,6 +1098,13 @@ def __init__(self, max_workers=None, mp_context=None,
                                  " supply a different mp_context.")
         self._max_tasks_per_child = max_tasks_per_child
 
+        if shared_memory_threshold is not None:
+            if not isinstance(shared_memory_threshold, int):
+                raise TypeError("shared_memory_threshold must be an integer")
+            elif shared_memory_threshold <= 0:
+                raise ValueError("shared_memory_threshold must be >= 1")
+        self._shared_memory_threshold = shared_memory_threshold
+
         # Management thread
         self._executor_manager_thread = None
 
@@ -797,13 +1187,27 @@ def _launch_processes(self):
             self._spawn_process()
 
     def _spawn_process(self):
+        shm_threshold = self._shared_memory_threshold
+        if shm_threshold is not None:
+            from multiprocessing import resource_tracker
+            from multiprocessing.shared_memory import _USE_POSIX
+            if _USE_POSIX:
+                # Segments created by a worker are unlinked by this process:
+                # make sure both use the same resource tracker, even with
+                # the 'fork' start method.
+                resource_tracker.ensure_running()
+            else:
+                # Named shared memory is destroyed on Windows as soon as
+                # the worker closes it, so results are always pickled.
+                shm_threshold = None
         p = self._mp_context.Process(
             target=_process_worker,
             args=(self._call_queue,
                   self._result_queue,
                   self._initializer,
                   self._initargs,
-                  self._max_tasks_per_child))
+                  self._max_tasks_per_child,
+                  shm_threshold))
         p.start()
         self._processes[p.pid] = p
 
@@ -819,6 +1223,11 @@ def submit(self, fn, /, *args, **kwargs):
 
             f = _base.Future()
             w = _WorkItem(f, fn, args, kwargs)
+            metrics = self._metrics
+            if metrics is not None:
+                metrics._submitted += 1
+                w.metrics = metrics
+                w.submit_time = time.monotonic()
 
             self._pending_work_items[self._queue_count] = w
             self._work_ids.put(self._queue_count)
@@ -843,11 +1252,15 @@ def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None):
             chunksize: If greater than one, the iterables will be chopped into
                 chunks of size chunksize and submitted to the process pool.
                 If set to one, the items in the list will be sent one at a time.
+                If None, the size of the chunks is adapted to the measured
+                cost of the previous chunks, and the iterables are consumed
+                lazily.
             buffersize: The number of submitted tasks whose results have not
                 yet been yielded. If the buffer is full, iteration over the
                 iterables pauses until a result is yielded from the buffer.
                 If None, all input elements are eagerly collected, and a task is
-                submitted for each.
+                submitted for each.  If chunksize is None, this defaults to
+                twice the number of worker processes.
 
         Returns:
             An iterator equivalent to: map(func, *iterables) but the calls may
@@ -858,6 +1271,8 @@ def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None):
                 before the given timeout.
             Exception: If fn(*args) raises for any values.
         """
+        if chunksize is None:
+            return self._adaptive_map(fn, iterables, timeout, buffersize)
         if chunksize < 1:
             raise ValueError("chunksize must be >= 1.")
 
@@ -867,6 +1282,55 @@ def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None):
                               buffersize=buffersize)
         return _chain_from_iterable_of_lists(results)
 
+    def _adaptive_map(self, fn, iterables, timeout, buffersize):
+        if buffersize is None:
+            buffersize = 2 * self._max_workers
+        elif not isinstance(buffersize, int):
+            raise TypeError("buffersize must be an integer or None")
+        elif buffersize < 1:
+            raise ValueError("buffersize must be None or > 0")
+
+        if timeout is not None:
+            end_time = timeout + time.monotonic()
+
+        zipped_iterables = zip(*iterables)
+        chunker = _AdaptiveChunker()
+
+        def submit_chunk(executor):
+            chunk = list(itertools.islice(zipped_iterables,
+                                          chunker.next_chunksize()))
+            if not chunk:
+                return None
+            chunker.sample(chunk[0])
+            f = executor.submit(_process_timed_chunk, fn, chunk)
+            f.add_done_callback(partial(chunker.record, n=len(chunk)))
+            return f
+
+        fs = collections.deque()
+        # Submit the first chunks before the first result is required.
+        while len(fs) < buffersize and (f := submit_chunk(self)) is not None:
+            fs.append(f)
+        executor_weakref = weakref.ref(self)
+
+        def result_iterator():
+            try:
+                while fs:
+                    # Careful not to keep a reference to the popped future
+                    if timeout is None:
+                        _, results = _base._result_or_cancel(fs.popleft())
+                    else:
+                        _, results = _base._result_or_cancel(
+                            fs.popleft(), end_time - time.monotonic())
+                    if (executor := executor_weakref()) is not None:
+                        if (f := submit_chunk(executor)) is not None:
+                            fs.append(f)
+                        del executor, f
+                    yield results
+            finally:
+                for future in fs:
+                    future.cancel()
+        return _chain_from_iterable_of_lists(result_iterator())
+
     def shutdown(self, wait=True, *, cancel_futures=False):
         with self._shutdown_lock:
             self._cancel_pending_futures = cancel_futures
@@ -6,9 +6,11 @@
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 
 from concurrent.futures import _base
+import collections
 import itertools
 import queue
 import threading
+import time
 import types
 import weakref
 import os
@@ -74,6 +76,9 @@ def run(self, task):
 
 
 class _WorkItem:
+    # The ExecutorMetrics to update, if the executor collects metrics.
+    metrics = None
+
     def __init__(self, future, task):
         self.future = future
         self.task = task
@@ -94,6 +99,161 @@ def run(self, ctx):
     __class_getitem__ = classmethod(types.GenericAlias)
 
 
+class _MeasuredWorkItem(_WorkItem):
+    """A work item which updates the executor metrics when it runs."""
+
+    def __init__(self, future, task, metrics):
+        super().__init__(future, task)
+        self.metrics = metrics
+        self.submit_time = time.monotonic()
+
+    def run(self, ctx):
+        metrics = self.metrics
+        if not self.future.set_running_or_notify_cancel():
+            metrics._task_cancelled()
+            return
+
+        start_time = metrics._task_started(self.future)
+        try:
+            result = ctx.run(self.task)
+        except BaseException as exc:
+            metrics._task_stopped(self.future,
+                                  start_time - self.submit_time,
+                                  time.monotonic() - start_time,
+                                  failed=True)
+            self.future.set_exception(exc)
+            # Break a reference cycle with the exception 'exc'
+            self = None
+        else:
+            metrics._task_stopped(self.future,
+                                  start_time - self.submit_time,
+                                  time.monotonic() - start_time)
+            self.future.set_result(result)
+
+
+class _WorkStealingQueue:
+    """A work queue made of one local deque per worker thread.
+
+    Work items submitted from inside a worker thread are pushed onto that
+    worker's own deque, everything else goes to a shared injection deque.
+    A worker takes work from its own deque first (newest first), then from
+    the injection deque, and finally steals the oldest item from the deque
+    of another worker.  Only workers which have run out of work touch the
+    condition variable, so busy workers never contend on a shared lock.
+
+    The interface mirrors the subset of queue.SimpleQueue used by
+    ThreadPoolExecutor, so that shutdown and failure handling can drain it
+    in the same way.
+    """
+
+    def __init__(self):
+        self._injector = collections.deque()
+        self._deques = []
+        self._local = threading.local()
+        self._not_empty = threading.Condition(threading.Lock())
+        self._sleepers = 0
+
+    def worker_queue(self):
+        """Return a new queue view for a worker thread."""
+        view = _WorkerQueue(self, collections.deque())
+        with self._not_empty:
+            # Replace rather than mutate the list so that stealers can
+            # iterate over it without holding the lock.
+            self._deques = self._deques + [view._deque]
+        return view
+
+    def put(self, item):
+        if item is None:
+            # Shutdown sentinels must be visible to every worker.
+            self._injector.append(item)
+        else:
+            local = getattr(self._local, 'deque', None)
+            if local is not None:
+                local.append(item)
+            else:
+                self._injector.append(item)
+        if self._sleepers:
+            with self._not_empty:
+                self._not_empty.notify()
+
+    def get_nowait(self):
+        # Used to drain the queue: take items from every deque.
+        try:
+            return self._injector.popleft()
+        except IndexError:
+            pass
+        for d in self._deques:
+            try:
+                return d.popleft()
+            except IndexError:
+                pass
+        raise queue.Empty
+
+    def _steal(self, own, start):
+        deques = self._deques
+        n = len(deques)
+        for i in range(n):
+            d = deques[(start + i) % n]
+            if d is own:
+                continue
+            try:
+                return d.popleft()
+            except IndexError:
+                pass
+        raise queue.Empty
+
+
+class _WorkerQueue:
+    """The view of a _WorkStealingQueue owned by a single worker thread."""
+
+    def __init__(self, owner, deque):
+        self._owner = owner
+        self._deque = deque
+        self._bound = False
+        self._next_victim = 0
+
+    def put(self, item):
+        self._owner.put(item)
+
+    def get_nowait(self):
+        if not self._bound:
+            # Route submissions made from this worker thread to its deque.
+            self._owner._local.deque = self._deque
+            self._bound = True
+        try:
+            return self._deque.pop()
+        except IndexError:
+            pass
+        owner = self._owner
+        try:
+            return owner._injector.popleft()
+        except IndexError:
+            pass
+        self._next_victim += 1
+        return owner._steal(self._deque, self._next_victim)
+
+    def get(self, block=True):
+        if not block:
+            return self.get_nowait()
+        owner = self._owner
+        while True:
+            try:
+                return self.get_nowait()
+            except queue.Empty:
+                pass
+            with owner._not_empty:
+                owner._sleepers += 1
+                try:
+                    # Check again now that producers will notify us.
+                    try:
+                        return self.get_nowait()
+                    except queue.Empty:
+                        pass
+                    owner._not_empty.wait()
+                finally:
+                    owner._sleepers -= 1
+
+
 def _worker(executor_reference, ctx, work_queue):
     try:
         ctx.initialize()
@@ -159,7 +319,8 @@ def prepare_context(cls, initializer, initargs):
         return WorkerContext.prepare(initializer, initargs)
 
     def __init__(self, max_workers=None, thread_name_prefix='',
-                 initializer=None, initargs=(), **ctxkwargs):
+                 initializer=None, initargs=(), *, work_stealing=False,
+                 **ctxkwargs):
         """Initializes a new ThreadPoolExecutor instance.
 
         Args:
@@ -168,6 +329,9 @@ def __init__(self, max_workers=None, thread_name_prefix='',
             thread_name_prefix: An optional name prefix to give our threads.
             initializer: A callable used to initialize worker threads.
             initargs: A tuple of arguments to pass to the initializer.
+            work_stealing: If true, give each worker thread its own work
+                queue and let idle workers steal work from busy ones,
+                instead of sharing a single queue between all workers.
             ctxkwargs: Additional arguments to cls.prepare_context().
         """
         if max_workers is None:
@@ -187,7 +351,10 @@ def __init__(self, max_workers=None, thread_name_prefix='',
          ) = type(self).prepare_context(initializer, initargs, **ctxkwargs)
 
         self._max_workers = max_workers
-        self._work_queue = queue.SimpleQueue()
+        if work_stealing:
+            self._work_queue = _WorkStealingQueue()
+        else:
+            self._work_queue = queue.SimpleQueue()
         self._idle_semaphore = threading.Semaphore(0)
         self._threads = set()
         self._broken = False
@@ -209,7 +376,12 @@ def submit(self, fn, /, *args, **kwargs):
 
             f = _base.Future()
             task = self._resolve_work_item_task(fn, args, kwargs)
-            w = _WorkItem(f, task)
+            metrics = self._metrics
+            if metrics is None:
+                w = _WorkItem(f, task)
+            else:
+                metrics._submitted += 1
+                w = _MeasuredWorkItem(f, task, metrics)
 
             self._work_queue.put(w)
             self._adjust_thread_count()
@@ -230,10 +402,14 @@ def weakref_cb(_, q=self._work_queue):
         if num_threads < self._max_workers:
             thread_name = '%s_%d' % (self._thread_name_prefix or self,
                                      num_threads)
+            if isinstance(self._work_queue, _WorkStealingQueue):
+                work_queue = self._work_queue.worker_queue()
+            else:
+                work_queue = self._work_queue
             t = threading.Thread(name=thread_name, target=_worker,
                                  args=(weakref.ref(self, weakref_cb),
                                        self._create_worker_context(),
-                                       self._work_queue))
+                                       work_queue))
             t.start()
             self._threads.add(t)
             _threads_queues[t] = self._work_queue
@@ -250,6 +426,8 @@ def _initializer_failed(self):
                     break
                 if work_item is not None:
                     work_item.future.set_exception(self.BROKEN(self._broken))
+                    if work_item.metrics is not None:
+                        work_item.metrics._task_cancelled()
 
     def shutdown(self, wait=True, *, cancel_futures=False):
         with self._shutdown_lock:
@@ -264,6 +442,8 @@ def shutdown(self, wait=True, *, cancel_futures=False):
                         break
                     if work_item is not None:
                         work_item.future.cancel()
+                        if work_item.metrics is not None:
+                            work_item.metrics._task_cancelled()
 
             # Send a wake-up to prevent threads calling
             # _work_queue.get(block=True) from permanently blocking.
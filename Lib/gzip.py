@@ -5,6 +5,7 @@
 
 # based on Andrew Kuchling's minigzip.py distributed with the zlib module
 
+import bisect
 import builtins
 import io
 import os
@@ -28,10 +29,17 @@
 
 READ_BUFFER_SIZE = 128 * 1024
 _WRITE_BUFFER_SIZE = 4 * io.DEFAULT_BUFFER_SIZE
+# Size of the blocks compressed concurrently when threads > 1
+_PARALLEL_BLOCK_SIZE = 1024 * 1024
+# Size of the deflate window, used as dictionary for the next block
+_WINDOW_SIZE = 32 * 1024
+# Default distance between the access points of an index
+_INDEX_SPACING = 4 * 1024 * 1024
+_INDEX_MAGIC = b'PyGzIdx1'
 
 
 def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_TRADEOFF,
-         encoding=None, errors=None, newline=None):
+         encoding=None, errors=None, newline=None, *, threads=1):
     """Open a gzip-compressed file in binary or text mode.
 
     The filename argument can be an actual filename (a str or bytes object), or
@@ -42,8 +50,8 @@ def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_TRADEOFF,
     "rb", and the default compresslevel is 9.
 
     For binary mode, this function is equivalent to the GzipFile constructor:
-    GzipFile(filename, mode, compresslevel). In this case, the encoding, errors
-    and newline arguments must not be provided.
+    GzipFile(filename, mode, compresslevel, threads=threads). In this case, the
+    encoding, errors and newline arguments must not be provided.
 
     For text mode, a GzipFile object is created, and wrapped in an
     io.TextIOWrapper instance with the specified encoding, error handling
@@ -63,9 +71,11 @@ def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_TRADEOFF,
 
     gz_mode = mode.replace("t", "")
     if isinstance(filename, (str, bytes, os.PathLike)):
-        binary_file = GzipFile(filename, gz_mode, compresslevel)
+        binary_file = GzipFile(filename, gz_mode, compresslevel,
+                               threads=threads)
     elif hasattr(filename, "read") or hasattr(filename, "write"):
-        binary_file = GzipFile(None, gz_mode, compresslevel, filename)
+        binary_file = GzipFile(None, gz_mode, compresslevel, filename,
+                               threads=threads)
     else:
         raise TypeError("filename must be a str or bytes object, or a file")
 
@@ -144,6 +154,82 @@ def writable(self):
         return True
 
 
+def _compress_block(level, data, zdict, mode):
+    if zdict:
+        compress = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS,
+                                    zlib.DEF_MEM_LEVEL, 0, zdict)
+    else:
+        compress = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS,
+                                    zlib.DEF_MEM_LEVEL, 0)
+    return compress.compress(data) + compress.flush(mode)
+
+
+class _ParallelCompress:
+    """Raw deflate compressor using several threads.
+
+    The data is split into blocks which are compressed concurrently, each
+    using the end of the previous block as dictionary, and flushed to a byte
+    boundary so that the compressed blocks can be concatenated into a
+    single deflate stream.  It has the compress() and flush() methods of
+    zlib compression objects.
+    """
+
+    def __init__(self, level, threads):
+        from concurrent.futures import ThreadPoolExecutor
+        self._level = level
+        self._threads = threads
+        self._executor = ThreadPoolExecutor(threads,
+                                            thread_name_prefix='gzip')
+        self._pending = bytearray()
+        self._zdict = b''
+        # Futures of the compressed blocks, in order
+        self._blocks = []
+
+    def _submit(self, data, mode):
+        self._blocks.append(self._executor.submit(
+            _compress_block, self._level, data, self._zdict, mode))
+        self._zdict = data[-_WINDOW_SIZE:]
+
+    def _collect(self, wait):
+        # Return the blocks compressed so far.  Wait until all blocks are
+        # compressed if wait is true, or until at most twice as many blocks
+        # as threads remain to bound the memory usage.
+        blocks = self._blocks
+        limit = 0 if wait else 2 * self._threads
+        i = 0
+        while i < len(blocks) and (len(blocks) - i > limit
+                                   or blocks[i].done()):
+            i += 1
+        output = b''.join([future.result() for future in blocks[:i]])
+        del blocks[:i]
+        return output
+
+    def compress(self, data):
+        pending = self._pending
+        pending += data
+        while len(pending) >= _PARALLEL_BLOCK_SIZE:
+            self._submit(bytes(pending[:_PARALLEL_BLOCK_SIZE]),
+                         zlib.Z_SYNC_FLUSH)
+            del pending[:_PARALLEL_BLOCK_SIZE]
+        return self._collect(False)
+
+    def flush(self, mode=zlib.Z_FINISH):
+        if mode == zlib.Z_NO_FLUSH:
+            return b''
+        if self._pending or mode == zlib.Z_FINISH:
+            self._submit(bytes(self._pending),
+                         zlib.Z_FINISH if mode == zlib.Z_FINISH
+                         else zlib.Z_SYNC_FLUSH)
+            self._pending.clear()
+        if mode == zlib.Z_FULL_FLUSH:
+            # Do not refer to data before the flush point.
+            self._zdict = b''
+        return self._collect(True)
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
 class GzipFile(_streams.BaseStream):
     """The GzipFile class simulates most of the methods of a file object with
     the exception of the truncate() method.
@@ -158,7 +244,8 @@ class GzipFile(_streams.BaseStream):
     myfileobj = None
 
     def __init__(self, filename=None, mode=None,
-                 compresslevel=_COMPRESS_LEVEL_TRADEOFF, fileobj=None, mtime=None):
+                 compresslevel=_COMPRESS_LEVEL_TRADEOFF, fileobj=None, mtime=None,
+                 *, threads=1):
         """Constructor for the GzipFile class.
 
         At least one of fileobj and filename must be given a
@@ -191,6 +278,11 @@ def __init__(self, filename=None, mode=None,
         If mtime is omitted or None, the current time is used. Use mtime = 0
         to generate a compressed stream that does not depend on creation time.
 
+        The threads argument is the number of threads used to compress the
+        data when writing.  If it is greater than 1, the data is split into
+        blocks of 1 MiB which are compressed concurrently, producing a
+        slightly larger gzip stream.  It must be 1 in read mode.
+
         """
 
         # Ensure attributes exist at __del__
@@ -202,6 +294,8 @@ def __init__(self, filename=None, mode=None,
             raise ValueError("Invalid mode: {!r}".format(mode))
         if mode and 'b' not in mode:
             mode += 'b'
+        if threads < 1:
+            raise ValueError("threads must be at least 1")
 
         try:
             if fileobj is None:
@@ -218,6 +312,8 @@ def __init__(self, filename=None, mode=None,
 
 
             if mode.startswith('r'):
+                if threads != 1:
+                    raise TypeError("threads is illegal in read mode")
                 self.mode = READ
                 raw = _GzipReader(fileobj)
                 self._buffer = io.BufferedReader(raw)
@@ -233,11 +329,14 @@ def __init__(self, filename=None, mode=None,
                         FutureWarning, 2)
                 self.mode = WRITE
                 self._init_write(filename)
-                self.compress = zlib.compressobj(compresslevel,
-                                                 zlib.DEFLATED,
-                                                 -zlib.MAX_WBITS,
-                                                 zlib.DEF_MEM_LEVEL,
-                                                 0)
+                if threads > 1:
+                    self.compress = _ParallelCompress(compresslevel, threads)
+                else:
+                    self.compress = zlib.compressobj(compresslevel,
+                                                     zlib.DEFLATED,
+                                                     -zlib.MAX_WBITS,
+                                                     zlib.DEF_MEM_LEVEL,
+                                                     0)
                 self._write_mtime = mtime
                 self._buffer_size = _WRITE_BUFFER_SIZE
                 self._buffer = io.BufferedWriter(_WriteBufferStream(self),
@@ -396,6 +495,9 @@ def close(self):
 
     def _close(self):
         self.fileobj = None
+        compress = getattr(self, 'compress', None)
+        if isinstance(compress, _ParallelCompress):
+            compress.close()
         myfileobj = self.myfileobj
         if myfileobj is not None:
             self.myfileobj = None
@@ -424,6 +526,62 @@ def rewind(self):
             raise OSError("Can't rewind in write mode")
         self._buffer.seek(0)
 
+    def build_index(self, spacing=_INDEX_SPACING):
+        '''Build an index of access points to make seek() fast.
+
+        The whole file is decompressed once, recording an access point
+        every *spacing* bytes of uncompressed data.
+        '''
+        self._check_not_closed()
+        self._check_read("build_index")
+        if spacing <= 0:
+            raise ValueError("spacing must be positive")
+        raw = self._buffer.raw
+        pos = self.fileobj.tell()
+        try:
+            index = _GzipIndex.build(self.fileobj, spacing, raw._start)
+        finally:
+            self.fileobj.seek(pos)
+        raw._index = index
+
+    def save_index(self, file):
+        '''Write the index built by build_index() to file.
+
+        file can be a file name or a binary file object.
+        '''
+        self._check_not_closed()
+        self._check_read("save_index")
+        index = self._buffer.raw._index
+        if index is None:
+            raise ValueError("no index has been built")
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with builtins.open(file, 'wb') as f:
+                index.save(f)
+        else:
+            index.save(file)
+
+    def load_index(self, file):
+        '''Load an index previously written by save_index().
+
+        file can be a file name or a binary file object.
+        '''
+        self._check_not_closed()
+        self._check_read("load_index")
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with builtins.open(file, 'rb') as f:
+                index = _GzipIndex.load(f)
+        else:
+            index = _GzipIndex.load(file)
+        raw = self._buffer.raw
+        pos = self.fileobj.tell()
+        try:
+            compressed_size = self.fileobj.seek(0, io.SEEK_END) - raw._start
+        finally:
+            self.fileobj.seek(pos)
+        if index.compressed_size != compressed_size:
+            raise ValueError("index does not match the file")
+        raw._index = index
+
     def readable(self):
         return self.mode == READ
 
@@ -521,6 +679,105 @@ def _read_gzip_header(fp):
     return last_mtime
 
 
+class _GzipIndex:
+    """Access points into a gzip file.
+
+    Each access point is a tuple (offset, in_offset, bits, window): the
+    decompression can resume at the uncompressed position offset, from the
+    deflate block starting bits bits before the compressed position
+    in_offset, with the compressed window (the previous 32 KiB of output of
+    the member) as dictionary.  Compressed positions and sizes are relative
+    to the start of the gzip stream in the file.
+    """
+
+    def __init__(self, compressed_size, size, points):
+        self.compressed_size = compressed_size
+        self.size = size
+        self.points = points
+        self._offsets = [point[0] for point in points]
+
+    @classmethod
+    def build(cls, fp, spacing, start=0):
+        """Decompress the seekable file fp from the position start,
+        recording an access point every spacing bytes of uncompressed
+        data."""
+        points = []
+        in_pos = start
+        offset = last = 0
+        while True:
+            fp.seek(in_pos)
+            if _read_gzip_header(fp) is None:
+                break
+            member_start = fp.tell()
+            decompressor = zlib._ZlibDecompressor(wbits=-zlib.MAX_WBITS)
+            crc = zlib.crc32(b"")
+            member_size = 0
+            window = b""
+            while not decompressor.eof:
+                if decompressor.needs_input:
+                    data = fp.read(READ_BUFFER_SIZE)
+                    if not data:
+                        raise EOFError("Compressed file ended before the "
+                                       "end-of-stream marker was reached")
+                else:
+                    data = b""
+                out, total_in, bits = decompressor._decompress_block(data)
+                if out:
+                    crc = zlib.crc32(out, crc)
+                    member_size += len(out)
+                    offset += len(out)
+                    if len(out) >= _WINDOW_SIZE:
+                        window = out[-_WINDOW_SIZE:]
+                    else:
+                        window = window[len(out) - _WINDOW_SIZE:] + out
+                if bits >= 0 and offset - last >= spacing:
+                    points.append((offset, member_start + total_in - start,
+                                   bits, zlib.compress(window, 1)))
+                    last = offset
+            fp.seek(member_start + total_in)
+            crc32, isize = struct.unpack("<II", _read_exact(fp, 8))
+            if crc32 != crc:
+                raise BadGzipFile("CRC check failed %s != %s" % (hex(crc32),
+                                                                 hex(crc)))
+            elif isize != (member_size & 0xffffffff):
+                raise BadGzipFile("Incorrect length of data produced")
+            # Skip the zero padding.
+            in_pos = fp.tell()
+            while fp.read(1) == b"\x00":
+                in_pos += 1
+        compressed_size = fp.seek(0, io.SEEK_END) - start
+        return cls(compressed_size, offset, points)
+
+    def find(self, offset):
+        """Return the last access point at or before offset, or None."""
+        i = bisect.bisect_right(self._offsets, offset)
+        return self.points[i - 1] if i else None
+
+    def save(self, fp):
+        fp.write(struct.pack("<8sQQQ", _INDEX_MAGIC, self.compressed_size,
+                             self.size, len(self.points)))
+        for offset, in_offset, bits, window in self.points:
+            fp.write(struct.pack("<QQBI", offset, in_offset, bits,
+                                 len(window)))
+            fp.write(window)
+
+    @classmethod
+    def load(cls, fp):
+        try:
+            magic, compressed_size, size, count = struct.unpack(
+                "<8sQQQ", _read_exact(fp, 32))
+            if magic != _INDEX_MAGIC:
+                raise ValueError("not a gzip index file")
+            points = []
+            for i in range(count):
+                point = struct.unpack("<QQBI", _read_exact(fp, 21))
+                window = _read_exact(fp, point[3])
+                points.append((*point[:3], window))
+        except EOFError:
+            raise ValueError("truncated gzip index file") from None
+        return cls(compressed_size, size, points)
+
+
 class _GzipReader(_streams.DecompressReader):
     def __init__(self, fp):
         super().__init__(_PaddedFile(fp), zlib._ZlibDecompressor,
@@ -528,10 +785,19 @@ def __init__(self, fp):
         # Set flag indicating start of a new member
         self._new_member = True
         self._last_mtime = None
+        self._index = None
+        # The gzip stream can start after the beginning of the file, for
+        # example when it is embedded in another file.
+        try:
+            self._start = fp.tell()
+        except (AttributeError, OSError):
+            self._start = 0
 
     def _init_read(self):
         self._crc = zlib.crc32(b"")
         self._stream_size = 0  # Decompressed size of unconcatenated stream
+        # False if the member was not read from its start
+        self._check_member = True
 
     def _read_gzip_header(self):
         last_mtime = _read_gzip_header(self._fp)
@@ -599,7 +865,9 @@ def _read_eof(self):
         # uncompressed data matches the stored values.  Note that the size
         # stored is the true file size mod 2**32.
         crc32, isize = struct.unpack("<II", _read_exact(self._fp, 8))
-        if crc32 != self._crc:
+        if not self._check_member:
+            pass
+        elif crc32 != self._crc:
             raise BadGzipFile("CRC check failed %s != %s" % (hex(crc32),
                                                              hex(self._crc)))
         elif isize != (self._stream_size & 0xffffffff):
@@ -616,16 +884,55 @@ def _read_eof(self):
 
     def _rewind(self):
         super()._rewind()
+        if self._start:
+            self._fp.seek(self._start)
         self._new_member = True
 
+    def _seek_point(self, point):
+        offset, in_offset, bits, window = point
+        self._fp.seek(self._start + in_offset - (1 if bits else 0))
+        self._decompressor = zlib._ZlibDecompressor(
+            wbits=-zlib.MAX_WBITS, zdict=zlib.decompress(window))
+        if bits:
+            self._decompressor._prime(bits, self._fp.read(1)[0] >> (8 - bits))
+        self._new_member = False
+        self._init_read()
+        self._check_member = False
+        self._eof = False
+        self._pos = offset
 
-def compress(data, compresslevel=_COMPRESS_LEVEL_TRADEOFF, *, mtime=0):
+    def seek(self, offset, whence=io.SEEK_SET):
+        index = self._index
+        if index is not None:
+            if whence == io.SEEK_CUR:
+                offset, whence = self._pos + offset, io.SEEK_SET
+            elif whence == io.SEEK_END:
+                offset, whence = index.size + offset, io.SEEK_SET
+            if whence == io.SEEK_SET:
+                # Resume from the nearest access point, unless it is behind
+                # the current position.
+                point = index.find(offset)
+                if point is not None and (offset < self._pos or
+                                          point[0] > self._pos):
+                    self._seek_point(point)
+        return super().seek(offset, whence)
+
+
+def compress(data, compresslevel=_COMPRESS_LEVEL_TRADEOFF, *, mtime=0,
+             threads=1):
     """Compress data in one shot and return the compressed string.
 
     compresslevel sets the compression level in range of 0-9.
     mtime can be used to set the modification time.
     The modification time is set to 0 by default, for reproducibility.
+    threads sets the number of threads used to compress the data.
     """
+    if threads != 1:
+        buf = io.BytesIO()
+        with GzipFile(fileobj=buf, mode='wb', compresslevel=compresslevel,
+                      mtime=mtime, threads=threads) as f:
+            f.write(data)
+        return buf.getvalue()
     # Wbits=31 automatically includes a gzip header and trailer.
     gzip_data = zlib.compress(data, level=compresslevel, wbits=31)
     if mtime is None:
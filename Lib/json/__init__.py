@@ -96,13 +96,13 @@
     Expecting property name enclosed in double quotes: line 1 column 3 (char 2)
 """
 __all__ = [
-    'dump', 'dumps', 'load', 'loads',
+    'dump', 'dumps', 'load', 'loads', 'iterload',
     'JSONDecoder', 'JSONDecodeError', 'JSONEncoder',
 ]
 
 __author__ = 'Bob Ippolito <bob@redivi.com>'
 
-from .decoder import JSONDecoder, JSONDecodeError
+from .decoder import JSONDecoder, JSONDecodeError, _IterDecoder
 from .encoder import JSONEncoder
 import codecs
 
@@ -118,10 +118,13 @@
 
 def dump(obj, fp, *, skipkeys=False, ensure_ascii=True, check_circular=True,
         allow_nan=True, cls=None, indent=None, separators=None,
-        default=None, sort_keys=False, **kw):
+        default=None, sort_keys=False, binary=False, **kw):
     """Serialize ``obj`` as a JSON formatted stream to ``fp`` (a
     ``.write()``-supporting file-like object).
 
+    If ``binary`` is true, ``fp`` is a binary file and the JSON document is
+    written to it encoded in UTF-8.
+
     If ``skipkeys`` is true then ``dict`` keys that are not basic types
     (``str``, ``int``, ``float``, ``bool``, ``None``) will be skipped
     instead of raising a ``TypeError``.
@@ -167,18 +170,17 @@ def dump(obj, fp, *, skipkeys=False, ensure_ascii=True, check_circular=True,
         check_circular and allow_nan and
         cls is None and indent is None and separators is None and
         default is None and not sort_keys and not kw):
-        iterable = _default_encoder.iterencode(obj)
+        encoder = _default_encoder
     else:
         if cls is None:
             cls = JSONEncoder
-        iterable = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
+        encoder = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
             check_circular=check_circular, allow_nan=allow_nan, indent=indent,
             separators=separators,
-            default=default, sort_keys=sort_keys, **kw).iterencode(obj)
-    # could accelerate with writelines in some versions of Python, at
-    # a debuggability cost
-    for chunk in iterable:
-        fp.write(chunk)
+            default=default, sort_keys=sort_keys, **kw)
+    # The output is written in large blocks, without building the whole
+    # document in memory.
+    encoder._dump(obj, fp.write, binary=binary)
 
 
 def dumps(obj, *, skipkeys=False, ensure_ascii=True, check_circular=True,
@@ -300,6 +302,85 @@ def load(fp, *, cls=None, object_hook=None, parse_float=None,
         parse_constant=parse_constant, object_pairs_hook=object_pairs_hook, **kw)
 
 
+def iterload(fp, *, lines=False, cls=None, object_hook=None,
+        parse_float=None, parse_int=None, parse_constant=None,
+        object_pairs_hook=None, **kw):
+    """Incrementally deserialize ``fp`` (a ``.read()``-supporting file-like
+    object) and return an iterator over the Python objects it contains.
+
+    If ``lines`` is false, ``fp`` contains a JSON array and the iterator
+    yields its elements.  If ``lines`` is true, ``fp`` contains JSON values
+    separated by whitespace, such as JSON Lines, and the iterator yields
+    these values.
+
+    ``fp`` is read in chunks, and only the chunks which contain the value
+    being decoded are kept in memory.  If ``fp.read()`` returns ``bytes``,
+    they are decoded incrementally, with the encoding detected as for
+    ``loads()``.
+
+    The other arguments have the same meaning as in ``loads()``.
+    """
+    decoder = _get_decoder(cls, object_hook, parse_float, parse_int,
+                           parse_constant, object_pairs_hook, kw)
+    it = _IterDecoder(decoder, _read_chunks(fp))
+    if lines:
+        return it.itervalues()
+    return it.iterarray()
+
+
+def _read_chunks(fp, size=65536):
+    # Yield the content of fp as non-empty str chunks.
+    chunk = fp.read(size)
+    if isinstance(chunk, str):
+        if chunk.startswith('\ufeff'):
+            raise JSONDecodeError("Unexpected UTF-8 BOM (decode using utf-8-sig)",
+                                  chunk, 0)
+        while chunk:
+            yield chunk
+            chunk = fp.read(size)
+        return
+    if not isinstance(chunk, (bytes, bytearray)):
+        raise TypeError(f'the JSON object must be str, bytes or bytearray, '
+                        f'not {chunk.__class__.__name__}')
+    # Up to 4 bytes are needed to detect the encoding.
+    while len(chunk) < 4:
+        data = fp.read(size)
+        if not data:
+            break
+        chunk += data
+    decoder = codecs.getincrementaldecoder(detect_encoding(chunk))(
+        'surrogatepass')
+    while chunk:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+        chunk = fp.read(size)
+    text = decoder.decode(b'', True)
+    if text:
+        yield text
+
+
+def _get_decoder(cls, object_hook, parse_float, parse_int, parse_constant,
+                 object_pairs_hook, kw):
+    if (cls is None and object_hook is None and
+            parse_int is None and parse_float is None and
+            parse_constant is None and object_pairs_hook is None and not kw):
+        return _default_decoder
+    if cls is None:
+        cls = JSONDecoder
+    if object_hook is not None:
+        kw['object_hook'] = object_hook
+    if object_pairs_hook is not None:
+        kw['object_pairs_hook'] = object_pairs_hook
+    if parse_float is not None:
+        kw['parse_float'] = parse_float
+    if parse_int is not None:
+        kw['parse_int'] = parse_int
+    if parse_constant is not None:
+        kw['parse_constant'] = parse_constant
+    return cls(**kw)
+
+
 def loads(s, *, cls=None, object_hook=None, parse_float=None,
         parse_int=None, parse_constant=None, object_pairs_hook=None, **kw):
     """Deserialize ``s`` (a ``str``, ``bytes`` or ``bytearray`` instance
@@ -345,23 +426,9 @@ def loads(s, *, cls=None, object_hook=None, parse_float=None,
                             f'not {s.__class__.__name__}')
         s = s.decode(detect_encoding(s), 'surrogatepass')
 
-    if (cls is None and object_hook is None and
-            parse_int is None and parse_float is None and
-            parse_constant is None and object_pairs_hook is None and not kw):
-        return _default_decoder.decode(s)
-    if cls is None:
-        cls = JSONDecoder
-    if object_hook is not None:
-        kw['object_hook'] = object_hook
-    if object_pairs_hook is not None:
-        kw['object_pairs_hook'] = object_pairs_hook
-    if parse_float is not None:
-        kw['parse_float'] = parse_float
-    if parse_int is not None:
-        kw['parse_int'] = parse_int
-    if parse_constant is not None:
-        kw['parse_constant'] = parse_constant
-    return cls(**kw).decode(s)
+    decoder = _get_decoder(cls, object_hook, parse_float, parse_int,
+                           parse_constant, object_pairs_hook, kw)
+    return decoder.decode(s)
 
 
 def __getattr__(name):
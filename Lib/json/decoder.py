@@ -135,7 +135,8 @@ def py_scanstring(s, end, strict=True,
 
 
 def JSONObject(s_and_end, strict, scan_once, object_hook, object_pairs_hook,
-               memo=None, _w=WHITESPACE.match, _ws=WHITESPACE_STR):
+               memo=None, _w=WHITESPACE.match, _ws=WHITESPACE_STR,
+               object_factory=None):
     s, end = s_and_end
     pairs = []
     pairs_append = pairs.append
@@ -153,6 +154,10 @@ def JSONObject(s_and_end, strict, scan_once, object_hook, object_pairs_hook,
             nextchar = s[end:end + 1]
         # Trivial empty object
         if nextchar == '}':
+            if object_factory is not None:
+                factory = object_factory(())
+                if factory is not None:
+                    return factory(), end + 1
             if object_pairs_hook is not None:
                 result = object_pairs_hook(pairs)
                 return result, end + 1
@@ -210,6 +215,10 @@ def JSONObject(s_and_end, strict, scan_once, object_hook, object_pairs_hook,
                 raise JSONDecodeError("Illegal trailing comma before end of object", s, comma_idx)
             raise JSONDecodeError(
                 "Expecting property name enclosed in double quotes", s, end - 1)
+    if object_factory is not None:
+        factory = object_factory(tuple([key for key, _ in pairs]))
+        if factory is not None:
+            return factory(*[value for _, value in pairs]), end
     if object_pairs_hook is not None:
         result = object_pairs_hook(pairs)
         return result, end
@@ -291,7 +300,7 @@ class JSONDecoder(object):
 
     def __init__(self, *, object_hook=None, parse_float=None,
             parse_int=None, parse_constant=None, strict=True,
-            object_pairs_hook=None):
+            object_pairs_hook=None, object_factory=None):
         """``object_hook``, if specified, will be called with the result
         of every JSON object decoded and its return value will be used in
         place of the given ``dict``.  This can be used to provide custom
@@ -304,6 +313,17 @@ def __init__(self, *, object_hook=None, parse_float=None,
         If ``object_hook`` is also defined, the ``object_pairs_hook`` takes
         priority.
 
+        ``object_factory``, if specified, will be called with the tuple of
+        the keys of a JSON object, the first time a JSON object with these
+        keys (in this order) is decoded.  It should return a callable, such
+        as a named tuple class, which will be called with the values of
+        every JSON object with these keys as positional arguments, and
+        whose return value will be used instead of the ``dict``.  If it
+        returns None, these objects are decoded as if ``object_factory``
+        was not specified.  The callables are cached for at most 256
+        tuples of keys.  It takes priority over ``object_pairs_hook`` and
+        ``object_hook``.
+
         ``parse_float``, if specified, will be called with the string
         of every JSON float to be decoded. By default this is equivalent to
         float(num_str). This can be used to use another datatype or parser
@@ -330,6 +350,7 @@ def __init__(self, *, object_hook=None, parse_float=None,
         self.parse_constant = parse_constant or _CONSTANTS.__getitem__
         self.strict = strict
         self.object_pairs_hook = object_pairs_hook
+        self.object_factory = object_factory
         self.parse_object = JSONObject
         self.parse_array = JSONArray
         self.parse_string = scanstring
@@ -362,3 +383,153 @@ def raw_decode(self, s, idx=0):
         except StopIteration as err:
             raise JSONDecodeError("Expecting value", s, err.value) from None
         return obj, end
+
+
+NUMBER_TAIL = re.compile(r'[0-9.eE+-]*\Z', FLAGS)
+# Errors farther than this from the end of the buffer cannot be caused by
+# a truncated token (the longest ones are "-Infinity" and a \uXXXX escape
+# of a surrogate pair).
+_TRUNCATION_MARGIN = 16
+
+
+class _IterDecoder:
+    """Decode a sequence of JSON values from an iterable of str chunks.
+
+    Only the chunks which contain the value being decoded are kept in
+    memory.  A value is decoded again from its start when the chunk which
+    contains its end is read; the buffer at least doubles on each attempt,
+    so that the total work stays linear in the size of the value.
+    """
+
+    def __init__(self, decoder, chunks):
+        self.decoder = decoder
+        self.chunks = iter(chunks)
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        # Position in the input of the start of the buffer.
+        self.offset = 0
+        self.lineno = 1
+        self.colno = 1
+
+    def iterarray(self):
+        """Yield the elements of a JSON array."""
+        idx = self._peek(self.pos)
+        if idx < 0:
+            raise self._error("Expecting value", len(self.buf))
+        if self.buf[idx] != '[':
+            raise self._error("Expecting '['", idx)
+        idx = self._peek(idx + 1)
+        if idx < 0:
+            raise self._error("Expecting value", len(self.buf))
+        if self.buf[idx] == ']':
+            self.pos = idx + 1
+        else:
+            self.pos = idx
+            while True:
+                yield self._decode()
+                idx = self._peek(self.pos)
+                if idx < 0:
+                    raise self._error("Expecting ',' delimiter",
+                                      len(self.buf))
+                nextchar = self.buf[idx]
+                if nextchar == ']':
+                    self.pos = idx + 1
+                    break
+                if nextchar != ',':
+                    raise self._error("Expecting ',' delimiter", idx)
+                # Keep the comma in the buffer for the error message.
+                self.pos = idx
+                idx = self._peek(idx + 1)
+                if idx < 0:
+                    raise self._error("Expecting value", len(self.buf))
+                if self.buf[idx] == ']':
+                    raise self._error("Illegal trailing comma before end of "
+                                      "array", self.pos)
+                self.pos = idx
+        idx = self._peek(self.pos)
+        if idx >= 0:
+            raise self._error("Extra data", idx)
+
+    def itervalues(self):
+        """Yield the JSON values separated by whitespace."""
+        while (idx := self._peek(self.pos)) >= 0:
+            self.pos = idx
+            yield self._decode()
+
+    def _peek(self, idx, _w=WHITESPACE.match):
+        # Return the index of the first non-whitespace character from idx,
+        # or -1 at the end of the input.  Reading more input keeps the
+        # buffer from self.pos.
+        while True:
+            idx = _w(self.buf, idx).end()
+            if idx < len(self.buf):
+                return idx
+            idx -= self.pos
+            if not self._fill():
+                return -1
+
+    def _decode(self, _number_tail=NUMBER_TAIL.match):
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buf, self.pos)
+            except JSONDecodeError as err:
+                # The value may be truncated only if the error is close to
+                # the end of the buffer, or if a string is unterminated.
+                # Otherwise, reading more input cannot fix it.
+                if (self.eof or
+                        err.pos < len(self.buf) - _TRUNCATION_MARGIN and
+                        not err.msg.startswith('Unterminated string')):
+                    raise self._adjust(err) from None
+                self._fill()
+                continue
+            # A number at the end of the buffer may be truncated, in which
+            # case only a prefix of it may have been decoded.
+            if not self.eof and _number_tail(self.buf, end):
+                self._fill()
+                continue
+            self.pos = end
+            return obj
+
+    def _fill(self):
+        # Discard the consumed input and read at least as much as is left
+        # in the buffer.  Return whether some input was read.
+        if self.eof:
+            return False
+        buf = self.buf
+        pos = self.pos
+        if pos:
+            newlines = buf.count('\n', 0, pos)
+            if newlines:
+                self.lineno += newlines
+                self.colno = pos - buf.rfind('\n', 0, pos)
+            else:
+                self.colno += pos
+            self.offset += pos
+        parts = [buf[pos:]]
+        size = len(parts[0])
+        read = 0
+        while not read or read < size:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                self.eof = True
+                break
+            parts.append(chunk)
+            read += len(chunk)
+        self.buf = ''.join(parts)
+        self.pos = 0
+        return read > 0
+
+    def _error(self, msg, pos):
+        return self._adjust(JSONDecodeError(msg, self.buf, pos))
+
+    def _adjust(self, err):
+        # Make the position of the error relative to the whole input rather
+        # than to the buffer.  The doc attribute is the buffer.
+        if err.lineno == 1:
+            err.colno += self.colno - 1
+        err.lineno += self.lineno - 1
+        err.pos += self.offset
+        err.args = ('%s: line %d column %d (char %d)'
+                    % (err.msg, err.lineno, err.colno, err.pos),)
+        return err
@@ -262,6 +262,49 @@ def floatstr(o, allow_nan=self.allow_nan,
                 self.skipkeys, _one_shot)
         return _iterencode(o, 0)
 
+    def _dump(self, o, write, binary=False, chunk_size=65536):
+        """Encode the given object and pass its JSON representation to
+        *write* in blocks of about *chunk_size* characters.
+
+        The blocks are UTF-8 encoded if *binary* is true.  Unless
+        iterencode() is overridden, the C encoder is used if available.
+        """
+        if (c_make_encoder is not None
+                and type(self).iterencode is JSONEncoder.iterencode):
+            if self.check_circular:
+                markers = {}
+            else:
+                markers = None
+            if self.ensure_ascii:
+                _encoder = encode_basestring_ascii
+            else:
+                _encoder = encode_basestring
+            if self.indent is None or isinstance(self.indent, str):
+                indent = self.indent
+            else:
+                indent = ' ' * self.indent
+            _iterencode = c_make_encoder(
+                markers, self.default, _encoder, indent,
+                self.key_separator, self.item_separator, self.sort_keys,
+                self.skipkeys, self.allow_nan)
+            _iterencode(o, 0, _write=write, _chunk_size=chunk_size,
+                        _binary=binary)
+            return
+
+        chunks = []
+        size = 0
+        for chunk in self.iterencode(o):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= chunk_size:
+                data = ''.join(chunks)
+                write(data.encode('utf-8') if binary else data)
+                chunks.clear()
+                size = 0
+        if chunks:
+            data = ''.join(chunks)
+            write(data.encode('utf-8') if binary else data)
+
 def _make_iterencode(markers, _default, _encoder, _indent, _floatstr,
         _key_separator, _item_separator, _sort_keys, _skipkeys, _one_shot,
     ):
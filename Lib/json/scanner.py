@@ -8,6 +8,10 @@
 
 __all__ = ['make_scanner']
 
+# Maximum number of tuples of keys for which the result of object_factory
+# is kept, like in _json.
+SHAPES_CACHE_SIZE = 256
+
 NUMBER_RE = re.compile(
     r'(-?(?:0|[1-9][0-9]*))(\.[0-9]+)?([eE][-+]?[0-9]+)?',
     (re.VERBOSE | re.MULTILINE | re.DOTALL))
@@ -24,6 +28,23 @@ def py_make_scanner(context):
     object_hook = context.object_hook
     object_pairs_hook = context.object_pairs_hook
     memo = context.memo
+    # Optional for backward compatibility with custom contexts
+    object_factory = getattr(context, 'object_factory', None)
+    if object_factory is not None:
+        # Map a tuple of keys to the result of object_factory(keys).
+        shapes = {}
+        def shape_factory(keys):
+            try:
+                return shapes[keys]
+            except KeyError:
+                pass
+            factory = object_factory(keys)
+            if len(shapes) >= SHAPES_CACHE_SIZE:
+                # Forget the tuple of keys which was added first.
+                shapes.pop(next(iter(shapes)), None)
+            return shapes.setdefault(keys, factory)
+    else:
+        shape_factory = None
 
     def _scan_once(string, idx):
         try:
@@ -34,6 +55,10 @@ def _scan_once(string, idx):
         if nextchar == '"':
             return parse_string(string, idx + 1, strict)
         elif nextchar == '{':
+            if shape_factory is not None:
+                return parse_object((string, idx + 1), strict,
+                    _scan_once, object_hook, object_pairs_hook, memo,
+                    object_factory=shape_factory)
             return parse_object((string, idx + 1), strict,
                 _scan_once, object_hook, object_pairs_hook, memo)
         elif nextchar == '[':
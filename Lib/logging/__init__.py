@@ -24,6 +24,7 @@
 """
 
 import sys, os, time, io, re, traceback, warnings, weakref, collections.abc
+import functools, operator
 
 from types import GenericAlias
 from string import Template
@@ -193,11 +194,23 @@ def currentframe():
 # using a stacklevel value greater than one.
 def _is_internal_frame(frame):
     """Signal whether the frame is a CPython or logging module internal."""
-    filename = os.path.normcase(frame.f_code.co_filename)
-    return filename == _srcfile or (
+    return _is_internal_filename(frame.f_code.co_filename, _srcfile)
+
+# The checks are cached per source file, since findCaller() goes through
+# the same few code locations for every logging call.
+@functools.lru_cache(maxsize=512)
+def _is_internal_filename(filename, srcfile):
+    filename = os.path.normcase(filename)
+    return filename == srcfile or (
         "importlib" in filename and "_bootstrap" in filename
     )
 
+@functools.lru_cache(maxsize=512)
+def _split_pathname(pathname):
+    """Return the filename and module name of a source path."""
+    filename = os.path.basename(pathname)
+    return filename, os.path.splitext(filename)[0]
+
 
 def _checkLevel(level):
     if isinstance(level, int):
@@ -326,8 +339,7 @@ def __init__(self, name, level, pathname, lineno,
         self.levelno = level
         self.pathname = pathname
         try:
-            self.filename = os.path.basename(pathname)
-            self.module = os.path.splitext(self.filename)[0]
+            self.filename, self.module = _split_pathname(pathname)
         except (TypeError, ValueError, AttributeError):
             self.filename = pathname
             self.module = "Unknown module"
@@ -438,20 +450,67 @@ def makeLogRecord(dict):
 del StrFormatter
 
 
+def _make_renderer(fmt, fields):
+    """
+    Return a function interpolating the positional %-format fmt with the
+    values of the given keys of a mapping.
+    """
+    if not fields:
+        return lambda values: fmt % ()
+    getter = operator.itemgetter(*fields)
+    if len(fields) == 1:
+        return lambda values: fmt % (getter(values),)
+    return lambda values: fmt % getter(values)
+
 class PercentStyle(object):
 
     default_format = '%(message)s'
     asctime_format = '%(asctime)s'
     asctime_search = '%(asctime)'
     validation_pattern = re.compile(r'%\(\w+\)[#0+ -]*(\*|\d+)?(\.(\*|\d+))?[diouxefgcrsa%]', re.I)
+    field_pattern = re.compile(r'%(?:%|\((\w+)\)([#0+ -]*\d*(?:\.\d+)?[diouxXeEfFgGcrsa]))')
 
     def __init__(self, fmt, *, defaults=None):
         self._fmt = fmt or self.default_format
         self._defaults = defaults
+        # The format the renderer and the usesTime() result were computed
+        # for, so that they are recomputed if _fmt is changed.
+        self._compiled_fmt = None
+        self._renderer = None
+        self._uses_time = False
+
+    def _compile(self):
+        """
+        Compile the format string into a function interpolating the values
+        of the fields it uses, or None if it cannot be compiled.
+        """
+        fields = []
+        def replace(m):
+            if m[1] is None:
+                return '%%'
+            fields.append(m[1])
+            return '%' + m[2]
+        fmt = self._fmt
+        if '%' in self.field_pattern.sub('', fmt):
+            # Other uses of '%', such as '*' widths, are left to the
+            # generic code.
+            return None
+        return _make_renderer(self.field_pattern.sub(replace, fmt), fields)
 
-    def usesTime(self):
+    def _update(self):
+        fmt = self._fmt
+        self._renderer = self._compile()
+        self._uses_time = self._usesTime()
+        self._compiled_fmt = fmt
+
+    def _usesTime(self):
         return self._fmt.find(self.asctime_search) >= 0
 
+    def usesTime(self):
+        if self._compiled_fmt is not self._fmt:
+            self._update()
+        return self._uses_time
+
     def validate(self):
         """Validate the input format, ensure it matches the correct style"""
         if not self.validation_pattern.search(self._fmt):
@@ -462,6 +521,10 @@ def _format(self, record):
             values = defaults | record.__dict__
         else:
             values = record.__dict__
+        if self._compiled_fmt is not self._fmt:
+            self._update()
+        if self._renderer is not None:
+            return self._renderer(values)
         return self._fmt % values
 
     def format(self, record):
@@ -479,12 +542,16 @@ class StrFormatStyle(PercentStyle):
     fmt_spec = re.compile(r'^(.?[<>=^])?[+ -]?#?0?(\d+|{\w+})?[,_]?(\.(\d+|{\w+}))?[bcdefgnosx%]?$', re.I)
     field_spec = re.compile(r'^(\d+|\w+)(\.\w+|\[[^]]+\])*$')
 
+    def _compile(self):
+        # str.format_map() is already a single call: no renderer is needed.
+        return None
+
     def _format(self, record):
         if defaults := self._defaults:
             values = defaults | record.__dict__
         else:
             values = record.__dict__
-        return self._fmt.format(**values)
+        return self._fmt.format_map(values)
 
     def validate(self):
         """Validate the input format, ensure it is the correct string formatting style"""
@@ -514,10 +581,35 @@ def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._tpl = Template(self._fmt)
 
-    def usesTime(self):
+    def _usesTime(self):
         fmt = self._fmt
         return fmt.find('$asctime') >= 0 or fmt.find(self.asctime_search) >= 0
 
+    def _compile(self):
+        # Translate the template into a positional %-format: '%s' converts
+        # the values with str(), like string.Template.
+        tpl = self._tpl
+        template = tpl.template
+        fields = []
+        parts = []
+        pos = 0
+        for m in tpl.pattern.finditer(template):
+            parts.append(template[pos:m.start()])
+            name = m['named'] or m['braced']
+            if name is not None:
+                fields.append(name)
+                parts.append(None)
+            elif m['escaped'] is not None:
+                parts.append(tpl.delimiter)
+            else:
+                # Let substitute() report the invalid placeholder.
+                return None
+            pos = m.end()
+        parts.append(template[pos:])
+        fmt = ''.join('%s' if part is None else part.replace('%', '%%')
+                      for part in parts)
+        return _make_renderer(fmt, fields)
+
     def validate(self):
         pattern = Template.pattern
         fields = set()
@@ -537,7 +629,11 @@ def _format(self, record):
             values = defaults | record.__dict__
         else:
             values = record.__dict__
-        return self._tpl.substitute(**values)
+        if self._compiled_fmt is not self._fmt:
+            self._update()
+        if self._renderer is not None:
+            return self._renderer(values)
+        return self._tpl.substitute(values)
 
 
 BASIC_FORMAT = "%(levelname)s:%(name)s:%(message)s"
@@ -1024,6 +1120,40 @@ def handle(self, record):
                 self.emit(record)
         return rv
 
+    def handle_batch(self, records):
+        """
+        Conditionally emit a sequence of logging records.
+
+        Filters are applied to each record as in handle(), then the records
+        which passed them are emitted together by emit_batch(), within a
+        single acquisition of the I/O thread lock. If a subclass overrides
+        handle(), it is called for each record instead.
+
+        Returns the list of the records that were emitted.
+        """
+        override = type(self).handle is not Handler.handle
+        emitted = []
+        for record in records:
+            rv = self.handle(record) if override else self.filter(record)
+            if isinstance(rv, LogRecord):
+                record = rv
+            if rv:
+                emitted.append(record)
+        if emitted and not override:
+            with self.lock:
+                self.emit_batch(emitted)
+        return emitted
+
+    def emit_batch(self, records):
+        """
+        Emit a sequence of logging records.
+
+        This version calls emit() for each record. Subclasses may override
+        it to output the records more efficiently.
+        """
+        for record in records:
+            self.emit(record)
+
     def setFormatter(self, fmt):
         """
         Set the formatter for this handler.
@@ -1155,6 +1285,38 @@ def emit(self, record):
         except Exception:
             self.handleError(record)
 
+    def emit_batch(self, records):
+        """
+        Emit a sequence of records.
+
+        The formatted records are written to the stream with a single write
+        and the stream is flushed once. If a subclass overrides emit(), it
+        is called for each record instead.
+        """
+        if type(self).emit is not StreamHandler.emit:
+            Handler.emit_batch(self, records)
+        else:
+            self._write_batch(records)
+
+    def _write_batch(self, records):
+        msgs = []
+        for record in records:
+            try:
+                msgs.append(self.format(record) + self.terminator)
+            except RecursionError:
+                raise
+            except Exception:
+                self.handleError(record)
+        if not msgs:
+            return
+        try:
+            self.stream.write(''.join(msgs))
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(records[-1])
+
     def setStream(self, stream):
         """
         Sets the StreamHandler's stream to the specified value,
@@ -1261,6 +1423,23 @@ def emit(self, record):
         if self.stream:
             StreamHandler.emit(self, record)
 
+    def emit_batch(self, records):
+        """
+        Emit a sequence of records.
+
+        The stream is opened as in emit(), then the formatted records are
+        written with a single write. If a subclass overrides emit(), it is
+        called for each record instead.
+        """
+        if type(self).emit is not FileHandler.emit:
+            Handler.emit_batch(self, records)
+            return
+        if self.stream is None:
+            if self.mode != 'w' or not self._closed:
+                self.stream = self._open()
+        if self.stream:
+            self._write_batch(records)
+
     def __repr__(self):
         level = getLevelName(self.level)
         return '<%s %s (%s)>' % (self.__class__.__name__, self.baseFilename, level)
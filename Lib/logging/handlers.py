@@ -1539,15 +1539,22 @@ class QueueListener(object):
     """
     _sentinel = None
 
-    def __init__(self, queue, *handlers, respect_handler_level=False):
+    def __init__(self, queue, *handlers, respect_handler_level=False,
+                 batch_size=None):
         """
         Initialise an instance with the specified queue and
         handlers.
+
+        If batch_size is not None, up to that many records are taken from
+        the queue at each wakeup and passed to handle_batch().
         """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be at least 1 or None")
         self.queue = queue
         self.handlers = handlers
         self._thread = None
         self.respect_handler_level = respect_handler_level
+        self.batch_size = batch_size
 
     def __enter__(self):
         """
@@ -1611,6 +1618,29 @@ def handle(self, record):
             if process:
                 handler.handle(record)
 
+    def handle_batch(self, records):
+        """
+        Handle a sequence of records.
+
+        This prepares the records, then passes them to the handle_batch()
+        method of each handler, so that handlers can emit them together.
+        """
+        records = [self.prepare(record) for record in records]
+        for handler in self.handlers:
+            if not self.respect_handler_level:
+                batch = records
+            else:
+                batch = [record for record in records
+                         if record.levelno >= handler.level]
+            if not batch:
+                continue
+            handle_batch = getattr(handler, 'handle_batch', None)
+            if handle_batch is not None:
+                handle_batch(batch)
+            else:
+                for record in batch:
+                    handler.handle(record)
+
     def _monitor(self):
         """
         Monitor the queue for records, and ask the handler
@@ -1621,6 +1651,7 @@ def _monitor(self):
         """
         q = self.queue
         has_task_done = hasattr(q, 'task_done')
+        batch_size = self.batch_size
         while True:
             try:
                 record = self.dequeue(True)
@@ -1628,9 +1659,30 @@ def _monitor(self):
                     if has_task_done:
                         q.task_done()
                     break
-                self.handle(record)
+                if batch_size is None:
+                    self.handle(record)
+                    if has_task_done:
+                        q.task_done()
+                    continue
+                # Drain the records which are already queued, without
+                # blocking.
+                records = [record]
+                stop = False
+                while len(records) < batch_size:
+                    try:
+                        record = self.dequeue(False)
+                    except queue.Empty:
+                        break
+                    if record is self._sentinel:
+                        stop = True
+                        break
+                    records.append(record)
+                self.handle_batch(records)
                 if has_task_done:
-                    q.task_done()
+                    for _ in range(len(records) + stop):
+                        q.task_done()
+                if stop:
+                    break
             except queue.Empty:
                 break
 
@@ -113,11 +113,14 @@ def SimpleQueue(self):
         return SimpleQueue(ctx=self.get_context())
 
     def Pool(self, processes=None, initializer=None, initargs=(),
-             maxtasksperchild=None):
+             maxtasksperchild=None, *, forkserver_preload=None,
+             forkserver_warmup=None):
         '''Returns a process pool object'''
         from .pool import Pool
         return Pool(processes, initializer, initargs, maxtasksperchild,
-                    context=self.get_context())
+                    context=self.get_context(),
+                    forkserver_preload=forkserver_preload,
+                    forkserver_warmup=forkserver_warmup)
 
     def RawValue(self, typecode_or_type, *args):
         '''Returns a shared object'''
@@ -177,12 +180,27 @@ def set_executable(self, executable):
         from .spawn import set_executable
         set_executable(executable)
 
-    def set_forkserver_preload(self, module_names):
+    def set_forkserver_preload(self, module_names, *, warmup=None):
         '''Set list of module names to try to load in forkserver process.
         This is really just a hint.
+
+        If warmup is not None, it is called in the forkserver process once
+        the modules have been loaded.
         '''
         from .forkserver import set_forkserver_preload
-        set_forkserver_preload(module_names)
+        set_forkserver_preload(module_names, warmup=warmup)
+
+    def _with_forkserver_preload(self, module_names, warmup=None):
+        '''Return a context using a fork server of its own, which preloads
+        the given modules and runs warmup once before forking workers.
+        '''
+        if self.get_start_method() != 'forkserver':
+            raise ValueError("preloading requires the 'forkserver' start "
+                             "method; supply a different context.")
+        from .forkserver import ForkServer
+        server = ForkServer()
+        server.set_forkserver_preload(list(module_names), warmup=warmup)
+        return _DedicatedForkServerContext(server)
 
     def get_context(self, method=None):
         if method is None:
@@ -294,6 +312,8 @@ def _after_fork():
 
     class ForkServerProcess(process.BaseProcess):
         _start_method = 'forkserver'
+        # The fork server used to start the process, None for the global one.
+        _forkserver = None
         @staticmethod
         def _Popen(process_obj):
             from .popen_forkserver import Popen
@@ -314,6 +334,19 @@ def _check_available(self):
             if not reduction.HAVE_SEND_HANDLE:
                 raise ValueError('forkserver start method not available')
 
+    class _DedicatedForkServerContext(ForkServerContext):
+        '''Forkserver context whose processes are started by its own server.'''
+        def __init__(self, forkserver):
+            self._forkserver = forkserver
+
+        def Process(self, *args, **kwargs):
+            p = ForkServerProcess(*args, **kwargs)
+            p._forkserver = self._forkserver
+            return p
+
+        def _stop_forkserver(self):
+            self._forkserver._stop()
+
     _concrete_contexts = {
         'fork': ForkContext(),
         'spawn': SpawnContext(),
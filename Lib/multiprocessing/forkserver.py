@@ -7,6 +7,7 @@
 import struct
 import sys
 import threading
+import traceback
 import warnings
 
 from . import AuthenticationError
@@ -42,6 +43,12 @@ def __init__(self):
         self._inherited_fds = None
         self._lock = threading.Lock()
         self._preload_modules = ['__main__']
+        self._warmup = None
+
+    def __reduce__(self):
+        # A child process uses the fork server which started it, which is
+        # always the module's global fork server from its point of view.
+        return _get_forkserver, ()
 
     def _stop(self):
         # Method used by unit tests to stop the server
@@ -64,11 +71,21 @@ def _stop_unlocked(self):
         self._forkserver_address = None
         self._forkserver_authkey = None
 
-    def set_forkserver_preload(self, modules_names):
-        '''Set list of module names to try to load in forkserver process.'''
+    def set_forkserver_preload(self, modules_names, *, warmup=None):
+        '''Set list of module names to try to load in forkserver process.
+
+        If warmup is not None, it must be a picklable callable which is
+        called without arguments in the forkserver process once the
+        modules have been loaded.  Every process forked afterwards
+        inherits the state it prepared.  A RuntimeWarning is emitted
+        when the fork server is started if warmup fails.
+        '''
         if not all(type(mod) is str for mod in modules_names):
             raise TypeError('module_names must be a list of strings')
+        if warmup is not None and not callable(warmup):
+            raise TypeError('warmup must be a callable')
         self._preload_modules = modules_names
+        self._warmup = warmup
 
     def get_inherited_fds(self):
         '''Return list of fds inherited from parent process.
@@ -146,7 +163,10 @@ def ensure_running(self):
                    'main(%d, %d, %r, **%r)')
 
             main_kws = {}
-            if self._preload_modules:
+            if self._warmup is not None:
+                main_kws['warmup'] = bytes(
+                    reduction.ForkingPickler.dumps(self._warmup))
+            if self._preload_modules or self._warmup is not None:
                 data = spawn.get_preparation_data('ignore')
                 if 'sys_path' in data:
                     main_kws['sys_path'] = data['sys_path']
@@ -167,8 +187,16 @@ def ensure_running(self):
                 alive_r, alive_w = os.pipe()
                 # A short lived pipe to initialize the forkserver authkey.
                 authkey_r, authkey_w = os.pipe()
+                # A pipe to report a failure of the warmup, closed by the
+                # server once it has run the warmup.
+                status_r = status_w = None
+                if self._warmup is not None:
+                    status_r, status_w = os.pipe()
+                    main_kws['status_w'] = status_w
                 try:
                     fds_to_pass = [listener.fileno(), alive_r, authkey_r]
+                    if status_w is not None:
+                        fds_to_pass.append(status_w)
                     main_kws['authkey_r'] = authkey_r
                     cmd %= (listener.fileno(), alive_r, self._preload_modules,
                             main_kws)
@@ -179,10 +207,14 @@ def ensure_running(self):
                 except:
                     os.close(alive_w)
                     os.close(authkey_w)
+                    if status_r is not None:
+                        os.close(status_r)
                     raise
                 finally:
                     os.close(alive_r)
                     os.close(authkey_r)
+                    if status_w is not None:
+                        os.close(status_w)
                 # Authenticate our control socket to prevent access from
                 # processes we have not shared this key with.
                 try:
@@ -194,12 +226,23 @@ def ensure_running(self):
                 self._forkserver_alive_fd = alive_w
                 self._forkserver_pid = pid
 
+            if status_r is not None:
+                # Wait for the warmup: the first child would be forked
+                # only once it has been run anyway.
+                with open(status_r, 'rb') as f:
+                    error = f.read()
+                if error:
+                    warnings.warn('forkserver: the warmup failed, child '
+                                  'processes will not inherit its state\n'
+                                  + error.decode('utf-8', 'replace'),
+                                  RuntimeWarning)
+
 #
 #
 #
 
 def main(listener_fd, alive_r, preload, main_path=None, sys_path=None,
-         *, sys_argv=None, authkey_r=None):
+         *, sys_argv=None, authkey_r=None, warmup=None, status_w=None):
     """Run forkserver."""
     if authkey_r is not None:
         try:
@@ -210,12 +253,14 @@ def main(listener_fd, alive_r, preload, main_path=None, sys_path=None,
     else:
         authkey = b''
 
-    if preload:
+    if preload or warmup is not None:
         if sys_argv is not None:
             sys.argv[:] = sys_argv
         if sys_path is not None:
             sys.path[:] = sys_path
-        if '__main__' in preload and main_path is not None:
+        # The warmup is usually defined in the main module.
+        if (('__main__' in preload or warmup is not None)
+                and main_path is not None):
             process.current_process()._inheriting = True
             try:
                 spawn.import_main_path(main_path)
@@ -226,6 +271,20 @@ def main(listener_fd, alive_r, preload, main_path=None, sys_path=None,
                 __import__(modname)
             except ImportError:
                 pass
+        if warmup is not None:
+            error = b''
+            try:
+                reduction.ForkingPickler.loads(warmup)()
+            except Exception:
+                # Children are still usable, they will just be cold: report
+                # the error to the process which launched the server.
+                if status_w is None:
+                    sys.excepthook(*sys.exc_info())
+                else:
+                    error = traceback.format_exc().encode('utf-8', 'replace')
+            if status_w is not None:
+                with open(status_w, 'wb') as f:
+                    f.write(error)
 
         # gh-135335: flush stdout/stderr in case any of the preloaded modules
         # wrote to them, otherwise children might inherit buffered data
@@ -414,6 +473,10 @@ def write_signed(fd, n):
 #
 
 _forkserver = ForkServer()
+
+def _get_forkserver():
+    return _forkserver
+
 ensure_running = _forkserver.ensure_running
 get_inherited_fds = _forkserver.get_inherited_fds
 connect_to_new_process = _forkserver.connect_to_new_process
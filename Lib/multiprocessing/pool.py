@@ -181,13 +181,17 @@ def Process(ctx, *args, **kwds):
         return ctx.Process(*args, **kwds)
 
     def __init__(self, processes=None, initializer=None, initargs=(),
-                 maxtasksperchild=None, context=None):
+                 maxtasksperchild=None, context=None, *,
+                 forkserver_preload=None, forkserver_warmup=None):
         # Attributes initialized early to make sure that they exist in
         # __del__() if __init__() raises an exception
         self._pool = []
         self._state = INIT
 
         self._ctx = context or get_context()
+        if forkserver_preload is not None or forkserver_warmup is not None:
+            self._ctx = self._ctx._with_forkserver_preload(
+                forkserver_preload or (), forkserver_warmup)
         self._setup_queues()
         self._taskqueue = queue.SimpleQueue()
         # The _change_notifier queue exist to wake up self._handle_workers()
@@ -256,7 +260,7 @@ def __init__(self, processes=None, initializer=None, initargs=(),
             self, self._terminate_pool,
             args=(self._taskqueue, self._inqueue, self._outqueue, self._pool,
                   self._change_notifier, self._worker_handler, self._task_handler,
-                  self._result_handler, self._cache),
+                  self._result_handler, self._cache, self._ctx),
             exitpriority=15
             )
         self._state = RUN
@@ -667,6 +671,8 @@ def join(self):
         self._result_handler.join()
         for p in self._pool:
             p.join()
+        if hasattr(self._ctx, '_stop_forkserver'):
+            self._ctx._stop_forkserver()
 
     @staticmethod
     def _help_stuff_finish(inqueue, task_handler, size):
@@ -679,7 +685,8 @@ def _help_stuff_finish(inqueue, task_handler, size):
 
     @classmethod
     def _terminate_pool(cls, taskqueue, inqueue, outqueue, pool, change_notifier,
-                        worker_handler, task_handler, result_handler, cache):
+                        worker_handler, task_handler, result_handler, cache,
+                        ctx=None):
         # this is guaranteed to only be called once
         util.debug('finalizing pool')
 
@@ -731,6 +738,11 @@ def _terminate_pool(cls, taskqueue, inqueue, outqueue, pool, change_notifier,
                     util.debug('cleaning up worker %d' % p.pid)
                     p.join()
 
+        # The workers have exited: stop the pool's own fork server, if any.
+        if hasattr(ctx, '_stop_forkserver'):
+            util.debug('stopping fork server')
+            ctx._stop_forkserver()
+
     def __enter__(self):
         self._check_running()
         return self
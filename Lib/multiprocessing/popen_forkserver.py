@@ -48,7 +48,8 @@ def _launch(self, process_obj):
         finally:
             set_spawning_popen(None)
 
-        self.sentinel, w = forkserver.connect_to_new_process(self._fds)
+        server = getattr(process_obj, '_forkserver', None) or forkserver._forkserver
+        self.sentinel, w = server.connect_to_new_process(self._fds)
         # Keep a duplicate of the data pipe's write end as a sentinel of the
         # parent process used by the child process.
         _parent_w = os.dup(w)
@@ -257,6 +257,16 @@ def copyfileobj(src, dst, length=None, exception=OSError, bufsize=None):
         dst.write(buf)
     return
 
+# The TarInfo attributes stored in an index written by TarFile.save_index().
+_INDEX_FIELDS = ("name", "mode", "uid", "gid", "size", "mtime", "chksum",
+                 "type", "linkname", "uname", "gname", "devmajor", "devminor",
+                 "offset", "offset_data", "pax_headers", "sparse")
+_INDEX_VERSION = 1
+
+# Regular files up to this size are written by the worker threads of
+# TarFile.extractall(), larger ones directly.
+_PARALLEL_MAX_SIZE = 1024 * 1024
+
 def _safe_print(s):
     encoding = getattr(sys.stdout, 'encoding', None)
     if encoding is not None:
@@ -1694,6 +1704,121 @@ def isdev(self):
         return self.type in (CHRTYPE, BLKTYPE, FIFOTYPE)
 # class TarInfo
 
+class _ParallelWriter:
+    """Write the regular files extracted by TarFile.extractall() in a
+       thread pool. Members are still filtered and read from the archive
+       in order by the calling thread; before a member which could depend
+       on files still being written is extracted, these writes are waited
+       for, so the result is the same as a sequential extraction.
+    """
+
+    def __init__(self, tarfile, executor, threads, path, numeric_owner):
+        self.tarfile = tarfile
+        self.executor = executor
+        self.path = path
+        self.numeric_owner = numeric_owner
+        self.max_pending = 4 * threads
+        self.pending = []       # (future, key, parent keys)
+        self.files = set()      # keys of the files being written
+        self.dirs = {}          # keys of their parents -> number of files
+        self.realdirs = {}      # target directories -> resolved paths
+
+    def submit(self, tarinfo):
+        """Submit the filtered TarInfo object tarinfo to the pool and
+           return True, or wait for the writes it depends on and return
+           False, in which case the caller must extract it.
+        """
+        if (not (tarinfo.isreg() or tarinfo.isdir())
+                or tarinfo.sparse is not None):
+            # Links can refer to any file, and change how paths resolve.
+            self.wait()
+            self.realdirs.clear()
+            return False
+
+        targetpath = os.path.join(self.path, tarinfo.name)
+        targetpath = targetpath.rstrip("/").replace("/", os.sep)
+        key = self._key(targetpath)
+        parents = []
+        parent = os.path.dirname(key)
+        while parent and parent not in parents:
+            parents.append(parent)
+            parent = os.path.dirname(parent)
+        if (key in self.files or key in self.dirs
+                or any(parent in self.files for parent in parents)):
+            self.wait()
+        if tarinfo.isdir() or tarinfo.size > _PARALLEL_MAX_SIZE:
+            return False
+
+        fileobj = self.tarfile.fileobj
+        fileobj.seek(tarinfo.offset_data)
+        data = fileobj.read(tarinfo.size)
+        if len(data) < tarinfo.size:
+            raise ReadError("unexpected end of data")
+        if len(self.pending) >= self.max_pending:
+            self._pop()
+        future = self.executor.submit(self._write, tarinfo, targetpath, data)
+        self.pending.append((future, key, parents))
+        self.files.add(key)
+        for parent in parents:
+            self.dirs[parent] = self.dirs.get(parent, 0) + 1
+        return True
+
+    def _key(self, targetpath):
+        # Different names can refer to the same file, e.g. "a/../b" and
+        # "b", or names going through a symlink already on disk, so the
+        # key is the resolved path.  Resolving the parent directory is
+        # enough unless the name itself is "." or ".." or a symlink.
+        head, tail = os.path.split(targetpath)
+        if tail in (os.curdir, os.pardir) or os.path.islink(targetpath):
+            path = os.path.realpath(targetpath)
+        else:
+            real = self.realdirs.get(head)
+            if real is None:
+                real = self.realdirs[head] = os.path.realpath(head)
+            path = os.path.join(real, tail)
+        # Paths are compared case-insensitively, to be safe on
+        # case-insensitive file systems.
+        return os.path.normcase(path).casefold()
+
+    def _pop(self):
+        future, key, parents = self.pending.pop(0)
+        self.files.discard(key)
+        for parent in parents:
+            self.dirs[parent] -= 1
+            if not self.dirs[parent]:
+                del self.dirs[parent]
+        future.result()
+
+    def wait(self):
+        """Wait for all the pending writes."""
+        while self.pending:
+            self._pop()
+
+    def close(self):
+        try:
+            self.wait()
+        finally:
+            self.executor.shutdown()
+
+    def _write(self, tarinfo, targetpath, data):
+        # Like TarFile._extract_one() for a regular file read in advance.
+        tarfile = self.tarfile
+        try:
+            upperdirs = os.path.dirname(targetpath)
+            if upperdirs and not os.path.exists(upperdirs):
+                os.makedirs(upperdirs, exist_ok=True)
+            tarfile._dbg(1, tarinfo.name)
+            with bltn_open(targetpath, "wb") as target:
+                target.write(data)
+            tarfile.chown(tarinfo, targetpath, self.numeric_owner)
+            tarfile.chmod(tarinfo, targetpath)
+            tarfile.utime(tarinfo, targetpath)
+        except (OSError, UnicodeEncodeError) as e:
+            tarfile._handle_fatal_error(e)
+        except ExtractError as e:
+            tarfile._handle_nonfatal_error(e)
+
+
 class TarFile(object):
     """The TarFile Class provides an interface to tar archives.
     """
@@ -2138,6 +2263,89 @@ def getnames(self):
         """
         return [tarinfo.name for tarinfo in self.getmembers()]
 
+    def save_index(self, file):
+        """Write an index of the members of the archive to 'file', a file
+           name or a binary file object. Loading it with load_index()
+           avoids scanning the whole archive when it is opened again.
+        """
+        self._check("r")
+        if self.stream:
+            raise StreamError("members of a stream are not kept")
+        members = []
+        for tarinfo in self.getmembers():
+            row = [getattr(tarinfo, field) for field in _INDEX_FIELDS]
+            row[_INDEX_FIELDS.index("type")] = tarinfo.type.decode("latin-1")
+            members.append(row)
+        index = {"version": _INDEX_VERSION, "end": self.offset,
+                 "members": members}
+
+        import json
+        data = json.dumps(index, separators=(",", ":")).encode("ascii")
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with bltn_open(file, "wb") as f:
+                f.write(data)
+        else:
+            file.write(data)
+
+    def load_index(self, file):
+        """Load the members of the archive from an index written by
+           save_index() to 'file', a file name or a binary file object,
+           instead of scanning the archive. ValueError is raised if the
+           index does not match the archive.
+        """
+        self._check("r")
+        if self.stream or isinstance(self.fileobj, _Stream):
+            raise StreamError("cannot load the index of a stream")
+        import json
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with bltn_open(file, "rb") as f:
+                data = f.read()
+        else:
+            data = file.read()
+        try:
+            index = json.loads(data)
+            if index["version"] != _INDEX_VERSION:
+                raise ValueError("unsupported index version")
+            members = []
+            for row in index["members"]:
+                tarinfo = self.tarinfo()
+                for field, value in zip(_INDEX_FIELDS, row, strict=True):
+                    setattr(tarinfo, field, value)
+                tarinfo.type = tarinfo.type.encode("latin-1")
+                if tarinfo.sparse is not None:
+                    tarinfo.sparse = [tuple(item) for item in tarinfo.sparse]
+                members.append(tarinfo)
+            end = index["end"]
+        except (KeyError, TypeError, ValueError, UnicodeError) as e:
+            raise ValueError(f"invalid tar index: {e}") from None
+
+        # Check the first and the last header against the archive.
+        first = self.members[0] if self.members else None
+        if (first is None) != (not members):
+            raise ValueError("index does not match the archive")
+        if members:
+            if (first.offset, first.chksum, first.name) != (
+                    members[0].offset, members[0].chksum, members[0].name):
+                raise ValueError("index does not match the archive")
+            last = members[-1]
+            offset = self.offset
+            try:
+                self.fileobj.seek(last.offset)
+                tarinfo = self.tarinfo.fromtarfile(self)
+            except (HeaderError, OSError, EOFError):
+                tarinfo = None
+            finally:
+                self.offset = offset
+            if tarinfo is None or (
+                    tarinfo.chksum, tarinfo.offset_data, tarinfo.name) != (
+                    last.chksum, last.offset_data, last.name):
+                raise ValueError("index does not match the archive")
+
+        self.members = members
+        self.firstmember = None
+        self.offset = end
+        self._loaded = True
+
     def gettarinfo(self, name=None, arcname=None, fileobj=None):
         """Create a TarInfo object from the result of os.stat or equivalent
            on an existing file. The file is either named by 'name', or
@@ -2385,7 +2593,7 @@ def _get_filter_function(self, filter):
             raise ValueError(f"filter {filter!r} not found") from None
 
     def extractall(self, path=".", members=None, *, numeric_owner=False,
-                   filter=None):
+                   filter=None, threads=1):
         """Extract all members from the archive to the current working
            directory and set owner, modification time and permissions on
            directories afterwards. 'path' specifies a different directory
@@ -2397,26 +2605,48 @@ def extractall(self, path=".", members=None, *, numeric_owner=False,
            before extraction.
            It can return a changed TarInfo or None to skip the member.
            String names of common filters are accepted.
+
+           If 'threads' is greater than 1, regular files are written to
+           disk by that many threads.
         """
+        if threads < 1:
+            raise ValueError("threads must be at least 1")
         directories = []
 
         filter_function = self._get_filter_function(filter)
         if members is None:
             members = self
 
-        for member in members:
-            tarinfo, unfiltered = self._get_extract_tarinfo(
-                member, filter_function, path)
-            if tarinfo is None:
-                continue
-            if tarinfo.isdir():
-                # For directories, delay setting attributes until later,
-                # since permissions can interfere with extraction and
-                # extracting contents can reset mtime.
-                directories.append(unfiltered)
-            self._extract_one(tarinfo, path, set_attrs=not tarinfo.isdir(),
-                              numeric_owner=numeric_owner,
-                              filter_function=filter_function)
+        # Writing regular files in worker threads bypasses makefile() and
+        # _extract_member(), so it is disabled if a subclass overrides them.
+        cls = type(self)
+        if (threads > 1 and cls.makefile is TarFile.makefile
+                and cls._extract_member is TarFile._extract_member):
+            from concurrent.futures import ThreadPoolExecutor
+            writer = _ParallelWriter(self, ThreadPoolExecutor(threads),
+                                     threads, path, numeric_owner)
+        else:
+            writer = None
+
+        try:
+            for member in members:
+                tarinfo, unfiltered = self._get_extract_tarinfo(
+                    member, filter_function, path)
+                if tarinfo is None:
+                    continue
+                if writer is not None and writer.submit(tarinfo):
+                    continue
+                if tarinfo.isdir():
+                    # For directories, delay setting attributes until later,
+                    # since permissions can interfere with extraction and
+                    # extracting contents can reset mtime.
+                    directories.append(unfiltered)
+                self._extract_one(tarinfo, path, set_attrs=not tarinfo.isdir(),
+                                  numeric_owner=numeric_owner,
+                                  filter_function=filter_function)
+        finally:
+            if writer is not None:
+                writer.close()
 
         # Reverse sort directories.
         directories.sort(key=lambda a: a.name, reverse=True)
@@ -6046,6 +6046,48 @@ def test_get_all_start_methods(self):
                 # forkserver vs spawn when available.
                 self.assertNotIn('forkserver', methods)
 
+    @staticmethod
+    def _forkserver_warmup():
+        os.environ['MP_TEST_FORKSERVER_WARM'] = '1'
+
+    @staticmethod
+    def _forkserver_worker_state():
+        return (os.environ.get('MP_TEST_FORKSERVER_WARM'),
+                'colorsys' in sys.modules)
+
+    def test_pool_forkserver_preload(self):
+        try:
+            ctx = multiprocessing.get_context('forkserver')
+        except ValueError:
+            raise unittest.SkipTest('forkserver should be available')
+        with ctx.Pool(2, forkserver_preload=['colorsys'],
+                      forkserver_warmup=self._forkserver_warmup) as pool:
+            states = [pool.apply(self._forkserver_worker_state)
+                      for _ in range(4)]
+            server = pool._ctx._forkserver
+        pool.join()
+        self.assertEqual(states, [('1', True)] * 4)
+        self.assertIsNone(server._forkserver_pid)
+        self.assertNotIn('MP_TEST_FORKSERVER_WARM', os.environ)
+
+        # Leaving the with block terminates the pool and stops its server.
+        for _ in range(3):
+            with ctx.Pool(2, forkserver_preload=['colorsys']) as pool:
+                pool.apply(self._forkserver_worker_state)
+                server = pool._ctx._forkserver
+                pid = server._forkserver_pid
+                self.assertIsNotNone(pid)
+            self.assertIsNone(server._forkserver_pid)
+            # The server process has been reaped.
+            self.assertRaises(ProcessLookupError, os.kill, pid, 0)
+            self.assertEqual(multiprocessing.active_children(), [])
+
+        with self.assertRaisesRegex(ValueError, 'forkserver'):
+            multiprocessing.get_context('spawn').Pool(
+                1, forkserver_preload=['colorsys'])
+        with self.assertRaisesRegex(TypeError, 'warmup must be a callable'):
+            ctx.Pool(1, forkserver_warmup=42)
+
     def test_preload_resources(self):
         if multiprocessing.get_start_method() != 'forkserver':
             self.skipTest("test only relevant for 'forkserver' method")
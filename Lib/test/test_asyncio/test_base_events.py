@@ -419,6 +419,71 @@ def test__run_once(self):
         self.assertEqual([h2], self.loop._scheduled)
         self.assertTrue(self.loop._process_events.called)
 
+    def test_set_timer_wheel_invalid(self):
+        self.assertIsNone(self.loop.get_timer_wheel())
+        for resolution in (0, -1.0, float('inf'), float('nan')):
+            with self.assertRaises(ValueError):
+                self.loop.set_timer_wheel(resolution)
+        for resolution in ('1', True):
+            with self.assertRaises(TypeError):
+                self.loop.set_timer_wheel(resolution)
+        self.assertIsNone(self.loop.get_timer_wheel())
+
+    def test_timer_wheel_call_later(self):
+        def cb():
+            pass
+
+        self.loop.set_timer_wheel(1.0)
+        self.assertEqual(self.loop.get_timer_wheel(), 1.0)
+        soon = self.loop.call_later(0.5, cb)
+        later = self.loop.call_later(100.0, cb)
+        # Only the timer due far ahead goes to the timer wheel.
+        self.assertEqual([soon], self.loop._scheduled)
+        self.assertEqual(len(self.loop._timer_wheel), 1)
+
+        later.cancel()
+        self.assertEqual(len(self.loop._timer_wheel), 0)
+        self.assertEqual(self.loop._timer_cancelled_count, 0)
+
+        later = self.loop.call_later(100.0, cb)
+        self.loop.set_timer_wheel(None)
+        self.assertIsNone(self.loop.get_timer_wheel())
+        self.assertEqual(sorted([soon, later]), sorted(self.loop._scheduled))
+        self.assertTrue(later._scheduled)
+
+    def test_timer_wheel__run_once_timeout(self):
+        self.loop._process_events = mock.Mock()
+        self.loop.set_timer_wheel(1.0)
+        self.loop.call_later(10.0, lambda: None)
+        self.assertEqual(self.loop._scheduled, [])
+        self.loop._run_once()
+
+        # The loop wakes up one slot before the timer is due to move it to
+        # the heap.
+        t = self.loop._selector.select.call_args[0][0]
+        self.assertTrue(7.5 < t < 9.5, t)
+
+    def test_timer_wheel_ordering(self):
+        calls = []
+
+        def cb(arg):
+            calls.append(arg)
+            if len(calls) == 4:
+                self.loop.stop()
+
+        self.loop._process_events = mock.Mock()
+        self.loop.set_timer_wheel(0.05)
+        t0 = self.loop.time()
+        handles = [self.loop.call_at(t0 + delay, cb, delay)
+                   for delay in (0.4, 0.01, 0.3, 0.2, 0.25)]
+        handles[-1].cancel()
+        self.assertGreater(len(self.loop._timer_wheel), 0)
+        self.loop.run_forever()
+
+        self.assertEqual(calls, [0.01, 0.2, 0.3, 0.4])
+        self.assertGreaterEqual(self.loop.time(), t0 + 0.4)
+        self.assertEqual(len(self.loop._timer_wheel), 0)
+
     def test_set_debug(self):
         self.loop.set_debug(True)
         self.assertTrue(self.loop.get_debug())
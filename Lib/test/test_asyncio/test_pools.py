@@ -0,0 +1,202 @@
+"""Tests for asyncio/pools.py"""
+
+import asyncio
+import unittest
+from test.support import socket_helper
+
+
+def tearDownModule():
+    asyncio.events._set_event_loop_policy(None)
+
+
+class ConnectionPoolTests(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.accepted = 0
+        self.server_writers = []
+
+        async def echo(reader, writer):
+            self.accepted += 1
+            self.server_writers.append(writer)
+            try:
+                while data := await reader.readline():
+                    writer.write(data)
+                    await writer.drain()
+            finally:
+                writer.close()
+
+        self.server = await asyncio.start_server(echo, socket_helper.HOSTv4, 0)
+        self.addAsyncCleanup(self.close_server)
+        self.host, self.port = self.server.sockets[0].getsockname()[:2]
+
+    async def close_server(self):
+        self.server.close()
+        self.server.close_clients()
+        await self.server.wait_closed()
+
+    async def echo(self, reader, writer, data=b'ping\n'):
+        writer.write(data)
+        await writer.drain()
+        self.assertEqual(await reader.readline(), data)
+
+    async def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            asyncio.ConnectionPool(max_per_key=0)
+        with self.assertRaises(ValueError):
+            asyncio.ConnectionPool(idle_timeout=-1)
+        with self.assertRaises(TypeError):
+            asyncio.ConnectionPool(health_check=1)
+
+    async def test_reuse(self):
+        async with asyncio.ConnectionPool() as pool:
+            for _ in range(3):
+                reader, writer = await pool.acquire(self.host, self.port)
+                await self.echo(reader, writer)
+                pool.release(writer)
+            self.assertEqual(self.accepted, 1)
+
+            async with pool.connection(self.host, self.port) as (reader, writer):
+                await self.echo(reader, writer)
+            self.assertEqual(self.accepted, 1)
+            with self.assertRaises(ValueError):
+                pool.release(writer)
+
+    async def test_discard(self):
+        async with asyncio.ConnectionPool() as pool:
+            reader, writer = await pool.acquire(self.host, self.port)
+            pool.release(writer, discard=True)
+            self.assertTrue(writer.is_closing())
+
+            with self.assertRaises(ZeroDivisionError):
+                async with pool.connection(self.host, self.port) as conn:
+                    writer = conn[1]
+                    1/0
+            self.assertTrue(writer.is_closing())
+
+            reader, writer = await pool.acquire(self.host, self.port)
+            pool.release(writer)
+            self.assertEqual(self.accepted, 3)
+
+    async def test_closed_by_peer(self):
+        async with asyncio.ConnectionPool() as pool:
+            reader, writer = await pool.acquire(self.host, self.port)
+            await self.echo(reader, writer)
+            pool.release(writer)
+            self.server_writers[0].close()
+            await self.server_writers[0].wait_closed()
+            self.assertEqual(await reader.read(), b'')
+
+            # The health check rejects the connection at end of file.
+            reader, writer = await pool.acquire(self.host, self.port)
+            await self.echo(reader, writer)
+            pool.release(writer)
+            self.assertEqual(self.accepted, 2)
+
+    async def test_health_check(self):
+        checked = []
+
+        async def health_check(reader, writer):
+            checked.append(writer)
+            return len(checked) > 1
+
+        async with asyncio.ConnectionPool(health_check=health_check) as pool:
+            reader, writer1 = await pool.acquire(self.host, self.port)
+            pool.release(writer1)
+            reader, writer2 = await pool.acquire(self.host, self.port)
+            self.assertEqual(checked, [writer1])
+            self.assertTrue(writer1.is_closing())
+            pool.release(writer2)
+            reader, writer3 = await pool.acquire(self.host, self.port)
+            self.assertIs(writer3, writer2)
+            pool.release(writer3)
+            self.assertEqual(self.accepted, 2)
+
+    async def test_idle_timeout(self):
+        async with asyncio.ConnectionPool(idle_timeout=0.01) as pool:
+            reader, writer1 = await pool.acquire(self.host, self.port)
+            pool.release(writer1)
+            await asyncio.sleep(0.05)
+            self.assertTrue(writer1.is_closing())
+            reader, writer2 = await pool.acquire(self.host, self.port)
+            self.assertIsNot(writer2, writer1)
+            pool.release(writer2)
+
+    async def test_max_per_key_fifo(self):
+        order = []
+
+        async with asyncio.ConnectionPool(max_per_key=1) as pool:
+            reader, writer = await pool.acquire(self.host, self.port)
+
+            async def waiter(i):
+                reader, writer = await pool.acquire(self.host, self.port)
+                order.append(i)
+                await self.echo(reader, writer)
+                pool.release(writer)
+
+            tasks = [asyncio.create_task(waiter(i)) for i in range(5)]
+            await asyncio.sleep(0)
+            # A cancelled waiter does not hold up the others.
+            tasks[1].cancel()
+            await asyncio.sleep(0)
+            pool.release(writer)
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.assertEqual(order, [0, 2, 3, 4])
+            self.assertEqual(self.accepted, 1)
+            self.assertEqual(pool._waiters, {})
+
+    async def test_keys_removed(self):
+        # The state kept per key is removed when it becomes empty, so that
+        # it does not grow with every address ever used.
+        async with asyncio.ConnectionPool(max_per_key=1,
+                                          idle_timeout=0.01) as pool:
+            reader, writer = await pool.acquire(self.host, self.port)
+            task = asyncio.create_task(pool.acquire(self.host, self.port))
+            await asyncio.sleep(0)
+            self.assertEqual(len(pool._waiters), 1)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            self.assertEqual(pool._waiters, {})
+
+            pool.release(writer)
+            self.assertEqual(len(pool._idle), 1)
+            reader, writer = await pool.acquire(self.host, self.port)
+            self.assertEqual(pool._idle, {})
+            pool.release(writer)
+            await asyncio.sleep(0.05)
+            self.assertTrue(writer.is_closing())
+            self.assertEqual(pool._idle, {})
+            self.assertEqual(pool._count, {})
+
+    async def test_discard_hands_over_slot(self):
+        async with asyncio.ConnectionPool(max_per_key=1) as pool:
+            reader, writer = await pool.acquire(self.host, self.port)
+            task = asyncio.create_task(pool.acquire(self.host, self.port))
+            await asyncio.sleep(0)
+            self.assertFalse(task.done())
+            pool.release(writer, discard=True)
+            reader, writer = await task
+            await self.echo(reader, writer)
+            pool.release(writer)
+            self.assertEqual(self.accepted, 2)
+
+    async def test_close(self):
+        pool = asyncio.ConnectionPool(max_per_key=1)
+        reader, writer1 = await pool.acquire(self.host, self.port)
+        task = asyncio.create_task(pool.acquire(self.host, self.port))
+        await asyncio.sleep(0)
+        await pool.close()
+        with self.assertRaises(RuntimeError):
+            await task
+        self.assertEqual(pool._waiters, {})
+        self.assertEqual(pool._idle, {})
+        with self.assertRaises(RuntimeError):
+            await pool.acquire(self.host, self.port)
+        # Connections in use are closed when released.
+        self.assertFalse(writer1.is_closing())
+        pool.release(writer1)
+        self.assertTrue(writer1.is_closing())
+
+
+if __name__ == '__main__':
+    unittest.main()
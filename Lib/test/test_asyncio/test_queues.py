@@ -721,5 +721,127 @@ class PriorityQueueShutdownTests(
     q_class = asyncio.PriorityQueue
 
 
+class _QueueBatchTestMixin:
+    q_class = None
+
+    def order(self, items):
+        # Return the items in the order they are got from the queue.
+        return list(items)
+
+    def test_put_many_get_many_nowait(self):
+        q = self.q_class()
+        q.put_many_nowait([3, 1, 2])
+        self.assertEqual(q.qsize(), 3)
+        self.assertEqual(q._unfinished_tasks, 3)
+        expected = self.order([3, 1, 2])
+        self.assertEqual(q.get_many_nowait(2), expected[:2])
+        self.assertEqual(q.get_many_nowait(), expected[2:])
+        self.assertTrue(q.empty())
+        self.assertRaises(asyncio.QueueEmpty, q.get_many_nowait)
+
+    def test_put_many_nowait_empty(self):
+        q = self.q_class()
+        q.put_many_nowait([])
+        self.assertTrue(q.empty())
+        self.assertEqual(q._unfinished_tasks, 0)
+
+    def test_put_many_nowait_full(self):
+        q = self.q_class(maxsize=3)
+        q.put_nowait(1)
+        self.assertRaises(asyncio.QueueFull, q.put_many_nowait, [2, 3, 4])
+        self.assertEqual(q.qsize(), 1)
+        q.put_many_nowait(iter([2, 3]))
+        self.assertTrue(q.full())
+
+    def test_get_many_invalid_max_items(self):
+        q = self.q_class()
+        q.put_nowait(1)
+        self.assertRaises(ValueError, q.get_many_nowait, 0)
+        self.assertRaises(ValueError, q.get_many_nowait, -1)
+        self.assertEqual(q.qsize(), 1)
+
+    async def test_get_many_waits_for_item(self):
+        q = self.q_class()
+        getter = asyncio.create_task(q.get_many())
+        await asyncio.sleep(0)
+        self.assertFalse(getter.done())
+        q.put_many_nowait([2, 3, 1])
+        self.assertEqual(await getter, self.order([2, 3, 1]))
+
+    async def test_put_many_wakes_getters(self):
+        q = self.q_class()
+        getters = [asyncio.create_task(q.get()) for _ in range(3)]
+        await asyncio.sleep(0)
+        q.put_many_nowait([1, 2, 3])
+        self.assertEqual(len(q._getters), 0)
+        self.assertEqual(sorted(await asyncio.gather(*getters)), [1, 2, 3])
+
+    async def test_put_many_waits_for_free_slots(self):
+        q = self.q_class(maxsize=2)
+        putter = asyncio.create_task(q.put_many(range(5)))
+        await asyncio.sleep(0)
+        self.assertFalse(putter.done())
+        self.assertTrue(q.full())
+        items = []
+        while len(items) < 5:
+            items.extend(await q.get_many())
+        await putter
+        self.assertEqual(sorted(items), list(range(5)))
+        self.assertEqual(q._unfinished_tasks, 5)
+
+    async def test_get_many_wakes_putters(self):
+        q = self.q_class(maxsize=2)
+        q.put_many_nowait([1, 2])
+        putters = [asyncio.create_task(q.put(i)) for i in (3, 4)]
+        await asyncio.sleep(0)
+        q.get_many_nowait()
+        self.assertEqual(len(q._putters), 0)
+        await asyncio.gather(*putters)
+        self.assertEqual(sorted(q.get_many_nowait()), [3, 4])
+
+    async def test_get_many_cancelled(self):
+        q = self.q_class()
+        getter = asyncio.create_task(q.get_many())
+        await asyncio.sleep(0)
+        getter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await getter
+        self.assertEqual(len(q._getters), 0)
+
+    async def test_shutdown(self):
+        q = self.q_class(maxsize=1)
+        q.put_nowait(1)
+        putter = asyncio.create_task(q.put_many([2, 3]))
+        await asyncio.sleep(0)
+        q.shutdown()
+        with self.assertRaises(asyncio.QueueShutDown):
+            await putter
+        with self.assertRaises(asyncio.QueueShutDown):
+            q.put_many_nowait([4])
+        self.assertEqual(await q.get_many(), [1])
+        with self.assertRaises(asyncio.QueueShutDown):
+            await q.get_many()
+        with self.assertRaises(asyncio.QueueShutDown):
+            q.get_many_nowait()
+
+
+class QueueBatchTests(_QueueBatchTestMixin, unittest.IsolatedAsyncioTestCase):
+    q_class = asyncio.Queue
+
+
+class LifoQueueBatchTests(_QueueBatchTestMixin, unittest.IsolatedAsyncioTestCase):
+    q_class = asyncio.LifoQueue
+
+    def order(self, items):
+        return list(reversed(items))
+
+
+class PriorityQueueBatchTests(_QueueBatchTestMixin, unittest.IsolatedAsyncioTestCase):
+    q_class = asyncio.PriorityQueue
+
+    def order(self, items):
+        return sorted(items)
+
+
 if __name__ == '__main__':
     unittest.main()
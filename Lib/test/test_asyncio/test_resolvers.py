@@ -0,0 +1,197 @@
+"""Tests for asyncio/resolvers.py"""
+
+import asyncio
+import socket
+import unittest
+from unittest import mock
+
+
+def tearDownModule():
+    asyncio.events._set_event_loop_policy(None)
+
+
+ADDRINFO = [(socket.AF_INET, socket.SOCK_STREAM, 6, '',
+             ('127.0.0.1', 80))]
+
+
+class StubResolver:
+
+    def __init__(self, result=ADDRINFO, exc=None):
+        self.result = result
+        self.exc = exc
+        self.calls = []
+        self.event = asyncio.Event()
+        self.event.set()
+
+    async def __call__(self, host, port, *, family, type, proto, flags):
+        self.calls.append((host, port, family, type, proto, flags))
+        await self.event.wait()
+        if self.exc is not None:
+            raise self.exc
+        return self.result
+
+
+class ResolverCacheTests(unittest.IsolatedAsyncioTestCase):
+
+    async def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            asyncio.ResolverCache(ttl=-1)
+        with self.assertRaises(ValueError):
+            asyncio.ResolverCache(negative_ttl=-1)
+        with self.assertRaises(ValueError):
+            asyncio.ResolverCache(maxsize=0)
+        with self.assertRaises(TypeError):
+            asyncio.ResolverCache(resolver=1)
+
+    async def test_hit(self):
+        resolver = StubResolver()
+        cache = asyncio.ResolverCache(resolver=resolver)
+        self.assertEqual(await cache.getaddrinfo('example.org', 80), ADDRINFO)
+        result = await cache.getaddrinfo('example.org', 80)
+        self.assertEqual(result, ADDRINFO)
+        # The caller gets its own copy of the result.
+        result.clear()
+        self.assertEqual(await cache.getaddrinfo('example.org', 80), ADDRINFO)
+        self.assertEqual(resolver.calls, [('example.org', 80, 0, 0, 0, 0)])
+        self.assertEqual(cache.cache_info(),
+                         (2, 1, 0, 1024, 1))
+
+        # Lookups with other parameters are cached separately.
+        await cache.getaddrinfo('example.org', 80, type=socket.SOCK_STREAM)
+        self.assertEqual(len(resolver.calls), 2)
+
+    async def test_expiration(self):
+        resolver = StubResolver()
+        cache = asyncio.ResolverCache(ttl=0.01, resolver=resolver)
+        await cache.getaddrinfo('example.org', 80)
+        await asyncio.sleep(0.05)
+        await cache.getaddrinfo('example.org', 80)
+        self.assertEqual(len(resolver.calls), 2)
+        self.assertEqual(cache.cache_info().hits, 0)
+
+    async def test_zero_ttl(self):
+        resolver = StubResolver()
+        cache = asyncio.ResolverCache(ttl=0, resolver=resolver)
+        await cache.getaddrinfo('example.org', 80)
+        await cache.getaddrinfo('example.org', 80)
+        self.assertEqual(len(resolver.calls), 2)
+        self.assertEqual(cache.cache_info().currsize, 0)
+
+    async def test_negative_caching(self):
+        resolver = StubResolver(exc=socket.gaierror(socket.EAI_NONAME, 'no'))
+        cache = asyncio.ResolverCache(negative_ttl=0.01, resolver=resolver)
+        for _ in range(2):
+            with self.assertRaises(socket.gaierror):
+                await cache.getaddrinfo('invalid.', 80)
+        self.assertEqual(len(resolver.calls), 1)
+        await asyncio.sleep(0.05)
+        with self.assertRaises(socket.gaierror):
+            await cache.getaddrinfo('invalid.', 80)
+        self.assertEqual(len(resolver.calls), 2)
+
+        # Other errors are not cached.
+        resolver.exc = ValueError()
+        cache = asyncio.ResolverCache(resolver=resolver)
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                await cache.getaddrinfo('invalid.', 80)
+        self.assertEqual(len(resolver.calls), 4)
+
+    async def test_negative_caching_new_exception(self):
+        # Every hit raises a new exception: callers do not share the
+        # traceback and context of the cached one.
+        resolver = StubResolver(exc=socket.gaierror(socket.EAI_NONAME, 'no'))
+        cache = asyncio.ResolverCache(resolver=resolver)
+        errors = []
+        for _ in range(3):
+            try:
+                try:
+                    raise KeyError
+                except KeyError:
+                    await cache.getaddrinfo('invalid.', 80)
+            except socket.gaierror as exc:
+                errors.append(exc)
+        self.assertEqual(len(resolver.calls), 1)
+        first, second, third = errors
+        self.assertIsNot(second, first)
+        self.assertIsNot(third, second)
+        for exc in second, third:
+            self.assertIs(type(exc), socket.gaierror)
+            self.assertEqual(exc.args, (socket.EAI_NONAME, 'no'))
+            self.assertEqual(exc.errno, socket.EAI_NONAME)
+            self.assertIsInstance(exc.__context__, KeyError)
+            self.assertIsNot(exc.__context__, first.__context__)
+
+    async def test_coalescing(self):
+        resolver = StubResolver()
+        resolver.event.clear()
+        cache = asyncio.ResolverCache(resolver=resolver)
+        tasks = [asyncio.create_task(cache.getaddrinfo('example.org', 80))
+                 for _ in range(10)]
+        await asyncio.sleep(0)
+        # Cancelling a caller does not cancel the shared lookup.
+        tasks[0].cancel()
+        await asyncio.sleep(0)
+        resolver.event.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        self.assertIsInstance(results[0], asyncio.CancelledError)
+        self.assertEqual(results[1:], [ADDRINFO] * 9)
+        self.assertEqual(len(resolver.calls), 1)
+        self.assertEqual(cache.cache_info(), (0, 1, 9, 1024, 1))
+
+    async def test_lru_eviction(self):
+        resolver = StubResolver()
+        cache = asyncio.ResolverCache(maxsize=2, resolver=resolver)
+        await cache.getaddrinfo('a', 80)
+        await cache.getaddrinfo('b', 80)
+        await cache.getaddrinfo('a', 80)
+        await cache.getaddrinfo('c', 80)
+        self.assertEqual(cache.cache_info().currsize, 2)
+        # 'b' was the least recently used entry.
+        await cache.getaddrinfo('a', 80)
+        await cache.getaddrinfo('b', 80)
+        self.assertEqual([call[0] for call in resolver.calls],
+                         ['a', 'b', 'c', 'b'])
+
+    async def test_cache_clear(self):
+        resolver = StubResolver()
+        cache = asyncio.ResolverCache(resolver=resolver)
+        await cache.getaddrinfo('example.org', 80)
+        await cache.getaddrinfo('example.org', 80)
+        cache.cache_clear()
+        self.assertEqual(cache.cache_info(), (0, 0, 0, 1024, 0))
+        await cache.getaddrinfo('example.org', 80)
+        self.assertEqual(len(resolver.calls), 2)
+
+    async def test_loop_resolver_cache(self):
+        loop = asyncio.get_running_loop()
+        self.assertIsNone(loop.get_resolver_cache())
+        with self.assertRaises(TypeError):
+            loop.set_resolver_cache(object())
+
+        resolver = StubResolver()
+        cache = asyncio.ResolverCache(resolver=resolver)
+        loop.set_resolver_cache(cache)
+        try:
+            self.assertIs(loop.get_resolver_cache(), cache)
+            for _ in range(3):
+                infos = await loop.getaddrinfo('example.org', 80,
+                                               type=socket.SOCK_STREAM)
+                self.assertEqual(infos, ADDRINFO)
+        finally:
+            loop.set_resolver_cache(None)
+        self.assertEqual(len(resolver.calls), 1)
+        self.assertEqual(cache.cache_info().hits, 2)
+
+    async def test_default_resolver(self):
+        cache = asyncio.ResolverCache()
+        with mock.patch('socket.getaddrinfo',
+                        return_value=ADDRINFO) as m_getaddrinfo:
+            for _ in range(2):
+                infos = await cache.getaddrinfo('example.org', 80)
+                self.assertEqual(infos, ADDRINFO)
+        m_getaddrinfo.assert_called_once_with('example.org', 80, 0, 0, 0, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
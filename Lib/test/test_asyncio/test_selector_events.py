@@ -822,6 +822,46 @@ def test_writelines_sendmsg_partial(self):
         self.assertTrue(self.sock.sendmsg.called)
         self.assertTrue(self.loop.writers)
 
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_writelines_sendmsg_single_call(self):
+        data = [b'data1', bytearray(b'data2'), memoryview(b'data3')]
+        sent = []
+        def sendmsg(buffers):
+            sent.append([bytes(b) for b in buffers])
+            return 12
+        self.sock.sendmsg = mock.Mock(side_effect=sendmsg)
+
+        transport = self.socket_transport(sendmsg=True)
+        transport.writelines(data)
+        self.assertEqual(sent, [[b'data1', b'data2', b'data3']])
+        self.assertEqual(transport._write_calls, 1)
+        self.assertEqual(transport._buffers_written, 2)
+        self.assertEqual(list_to_buffer([b'ta3']), transport._buffer)
+        self.loop.assert_writer(7, transport._write_ready)
+
+        self.sock.sendmsg.side_effect = None
+        self.sock.sendmsg.return_value = 3
+        transport._write_ready()
+        self.assertEqual(transport._write_calls, 2)
+        self.assertEqual(transport._buffers_written, 3)
+        self.assertFalse(self.loop.writers)
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_writelines_while_writing(self):
+        self.sock.sendmsg = mock.Mock()
+        self.sock.sendmsg.return_value = 0
+
+        transport = self.socket_transport(sendmsg=True)
+        transport._buffer.append(memoryview(b'data1'))
+        self.loop._add_writer(7, transport._write_ready)
+        transport.writelines([b'data2', b'data3'])
+        # The data is queued without trying to send it.
+        self.assertFalse(self.sock.sendmsg.called)
+        self.assertEqual(list_to_buffer([b'data1', b'data2', b'data3']),
+                         transport._buffer)
+        for b in transport._buffer:
+            self.assertIsInstance(b, memoryview)
+
     def test_writelines_send_full(self):
         data = memoryview(b'data')
         self.sock.send.return_value = len(data)
@@ -1,5 +1,6 @@
 """Tests for streams.py."""
 
+import array
 import gc
 import queue
 import pickle
@@ -583,6 +584,81 @@ def test_readexactly_exception(self):
         self.assertRaises(
             ValueError, self.loop.run_until_complete, stream.readexactly(2))
 
+    def test_readinto(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(self.DATA)
+
+        buf = bytearray(5)
+        n = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(n, 5)
+        self.assertEqual(buf, self.DATA[:5])
+        self.assertEqual(self.DATA[5:], stream._buffer)
+
+        # Only the available bytes are read.
+        buf = bytearray(100)
+        n = self.loop.run_until_complete(stream.readinto(memoryview(buf)[10:]))
+        self.assertEqual(n, len(self.DATA) - 5)
+        self.assertEqual(buf[10:10 + n], self.DATA[5:])
+        self.assertEqual(b'', stream._buffer)
+
+    def test_readinto_waits_for_data(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        buf = array.array('i', [0, 0])
+        read_task = self.loop.create_task(stream.readinto(buf))
+
+        def cb():
+            stream.feed_data(b'\x01' * 10)
+        self.loop.call_soon(cb)
+
+        n = self.loop.run_until_complete(read_task)
+        self.assertEqual(n, 8)
+        self.assertEqual(buf.tobytes(), b'\x01' * 8)
+        self.assertEqual(b'\x01' * 2, stream._buffer)
+
+    def test_readinto_eof(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        read_task = self.loop.create_task(stream.readinto(bytearray(10)))
+
+        def cb():
+            stream.feed_eof()
+        self.loop.call_soon(cb)
+
+        self.assertEqual(self.loop.run_until_complete(read_task), 0)
+
+    def test_readinto_empty_buffer(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        n = self.loop.run_until_complete(stream.readinto(bytearray()))
+        self.assertEqual(n, 0)
+
+    def test_readinto_readonly(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(self.DATA)
+        with self.assertRaises(TypeError):
+            self.loop.run_until_complete(stream.readinto(b'12345'))
+        self.assertEqual(self.DATA, stream._buffer)
+
+    def test_readinto_resumes_transport(self):
+        stream = asyncio.StreamReader(limit=1, loop=self.loop)
+        transport = mock.Mock()
+        stream.set_transport(transport)
+        stream.feed_data(b'data')
+        self.assertTrue(stream._paused)
+
+        buf = bytearray(2)
+        self.loop.run_until_complete(stream.readinto(buf))
+        self.assertTrue(stream._paused)
+        self.loop.run_until_complete(stream.readinto(buf))
+        self.assertFalse(stream._paused)
+        transport.resume_reading.assert_called_once_with()
+
+    def test_readinto_exception(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'line\n')
+        stream.set_exception(ValueError())
+        self.assertRaises(
+            ValueError, self.loop.run_until_complete,
+            stream.readinto(bytearray(2)))
+
     def test_exception(self):
         stream = asyncio.StreamReader(loop=self.loop)
         self.assertIsNone(stream.exception())
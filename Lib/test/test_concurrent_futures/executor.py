@@ -247,3 +247,46 @@ def test_swallows_falsey_exceptions(self):
         msg = 'lenlen'
         with self.assertRaisesRegex(FalseyLenException, msg):
             self.executor.submit(raiser, FalseyLenException, msg).result()
+
+    @warnings_helper.ignore_fork_in_thread_deprecation_warnings()
+    def test_metrics(self):
+        started = []
+        stopped = []
+        metrics = self.executor.enable_metrics(
+            on_task_start=started.append,
+            on_task_stop=lambda *args: stopped.append(args))
+        self.assertIsInstance(metrics, futures.ExecutorMetrics)
+
+        fs = [self.executor.submit(mul, i, 2) for i in range(5)]
+        fs.append(self.executor.submit(raiser, ValueError))
+        futures.wait(fs)
+        self.executor.disable_metrics()
+        self.executor.submit(mul, 1, 2).result()
+
+        self.assertEqual(metrics.submitted, 6)
+        self.assertEqual(metrics.started, 6)
+        self.assertEqual(metrics.completed, 6)
+        self.assertEqual(metrics.failed, 1)
+        self.assertEqual(metrics.cancelled, 0)
+        self.assertEqual(metrics.queued, 0)
+        self.assertEqual(metrics.running, 0)
+        self.assertGreaterEqual(metrics.wait_time, 0)
+        self.assertGreaterEqual(metrics.run_time, 0)
+        self.assertEqual(sum(metrics.wait_time_histogram()), 6)
+        self.assertEqual(sum(metrics.run_time_histogram()), 6)
+        self.assertEqual(len(metrics.run_time_histogram()),
+                         len(futures.ExecutorMetrics.BUCKETS) + 1)
+        self.assertIn('completed=6', repr(metrics))
+
+        self.assertCountEqual(started, fs)
+        self.assertCountEqual([args[0] for args in stopped], fs)
+        for future, wait_time, run_time in stopped:
+            self.assertGreaterEqual(wait_time, 0)
+            self.assertGreaterEqual(run_time, 0)
+
+    def test_metrics_invalid_hooks(self):
+        with self.assertRaises(TypeError):
+            self.executor.enable_metrics(on_task_start=1)
+        with self.assertRaises(TypeError):
+            self.executor.enable_metrics(on_task_stop=1)
+        self.assertIsNone(self.executor._metrics)
@@ -8,6 +8,8 @@
 import textwrap
 import time
 import unittest
+from unittest import mock
+from concurrent.futures import interpreter
 from concurrent.futures.interpreter import BrokenInterpreterPool
 from concurrent import interpreters
 from concurrent.interpreters import _queues as queues
@@ -443,6 +445,53 @@ def test_idle_thread_reuse(self):
         self.assertEqual(len(executor._threads), 1)
         executor.shutdown(wait=True)
 
+    def test_work_stealing(self):
+        with self.executor_type(2, work_stealing=True) as executor:
+            fs = [executor.submit(mul, i, 2) for i in range(10)]
+            self.assertEqual([f.result() for f in fs],
+                             [i * 2 for i in range(10)])
+
+    def test_map_chunksize(self):
+        run = interpreter.WorkerContext.run
+        with mock.patch.object(interpreter.WorkerContext, 'run',
+                               autospec=True, side_effect=run) as m:
+            with self.executor_type(2) as executor:
+                results = list(executor.map(mul, range(10), range(10),
+                                            chunksize=4))
+        self.assertEqual(results, [i * i for i in range(10)])
+        # One call into a worker interpreter per chunk.
+        self.assertEqual(m.call_count, 3)
+
+    def test_map_chunksize_shareable_results(self):
+        with self.executor_type(2) as executor:
+            results = list(executor.map(get_current_interpid,
+                                        [b'spam'] * 5, ['eggs'] * 5,
+                                        chunksize=2))
+        main, _ = _interpreters.get_current()
+        for interpid, data, text in results:
+            self.assertNotEqual(interpid, main)
+            self.assertEqual(data, b'spam')
+            self.assertEqual(text, 'eggs')
+
+    def test_map_chunksize_buffersize(self):
+        with self.executor_type(2) as executor:
+            results = executor.map(mul, range(100), range(100),
+                                   chunksize=7, buffersize=2)
+            self.assertEqual(list(results), [i * i for i in range(100)])
+
+    def test_map_chunksize_exception(self):
+        with self.executor_type(2) as executor:
+            results = executor.map(divmod, [1, 2, 3, 4], [1, 1, 0, 1],
+                                   chunksize=2)
+            self.assertEqual(next(results), (1, 0))
+            self.assertEqual(next(results), (2, 0))
+            with self.assertRaises(ZeroDivisionError):
+                next(results)
+
+    def test_map_invalid_chunksize(self):
+        with self.assertRaisesRegex(ValueError, "chunksize must be >= 1."):
+            self.executor.map(mul, [1], [2], chunksize=0)
+
     def test_pickle_errors_propagate(self):
         # GH-125864: Pickle errors happen before the script tries to execute,
         # so the queue used to wait infinitely.
@@ -1,15 +1,21 @@
+import array
+import itertools
+import multiprocessing
 import os
+import pickle
 import queue
 import sys
+import textwrap
 import threading
 import time
 import unittest
 import unittest.mock
 from concurrent import futures
-from concurrent.futures.process import BrokenProcessPool
+from concurrent.futures.process import BrokenProcessPool, _AdaptiveChunker
 
 from test import support
-from test.support import hashlib_helper, warnings_helper
+from test.support import hashlib_helper, os_helper, warnings_helper
+from test.support import script_helper
 from test.test_importlib.metadata.fixtures import parameterize
 
 from .executor import ExecutorTest, mul
@@ -41,6 +47,41 @@ def _put_wait_put(queue, event):
     queue.put('finished')
 
 
+class OutOfBandBuffer:
+    """Object exposing its data as an out-of-band pickle buffer."""
+    def __init__(self, data):
+        self.data = data
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return type(self)._reconstruct, (pickle.PickleBuffer(self.data),)
+        return type(self)._reconstruct, (bytearray(self.data),)
+
+    @classmethod
+    def _reconstruct(cls, obj):
+        with memoryview(obj) as m:
+            return cls(bytearray(m))
+
+def _describe(*args, **kwargs):
+    # Return the arguments along with their types, as seen by the worker.
+    return ([(type(a), a) for a in args],
+            {k: (type(v), v) for k, v in kwargs.items()})
+
+def _make_payload(size):
+    return [bytes(size), bytearray(b'x' * size), array.array('d', [1.5] * size),
+            memoryview(bytearray(size)).cast('i'), OutOfBandBuffer(b'y' * size),
+            b'small']
+
+_warm = False
+
+def _warmup():
+    global _warm
+    _warm = True
+
+def _worker_state():
+    return _warm, 'colorsys' in sys.modules, os.getppid()
+
+
 class ProcessPoolExecutorTest(ExecutorTest):
 
     @unittest.skipUnless(sys.platform=='win32', 'Windows-only process limit')
@@ -79,6 +120,45 @@ def bad_map():
             ref)
         self.assertRaises(ValueError, bad_map)
 
+    def test_map_adaptive_chunksize(self):
+        ref = list(map(pow, range(500), range(500)))
+        self.assertEqual(
+            list(self.executor.map(pow, range(500), range(500),
+                                   chunksize=None)),
+            ref)
+        self.assertEqual(
+            list(self.executor.map(pow, range(500), range(500),
+                                   chunksize=None, buffersize=1)),
+            ref)
+        self.assertEqual(list(self.executor.map(pow, [], chunksize=None)), [])
+
+    def test_map_adaptive_chunksize_lazy(self):
+        consumed = 0
+        def gen():
+            nonlocal consumed
+            for i in itertools.count():
+                consumed = i + 1
+                yield i
+        results = self.executor.map(abs, gen(), chunksize=None, buffersize=2)
+        self.assertEqual(consumed, 2)
+        self.assertEqual(list(itertools.islice(results, 100)), list(range(100)))
+        # Only a bounded number of chunks are submitted ahead.
+        self.assertLess(consumed, 1000)
+        results.close()
+
+    def test_map_adaptive_chunksize_exception(self):
+        results = self.executor.map(divmod, [1, 1, 1], [1, 0, 1],
+                                    chunksize=None)
+        self.assertEqual(next(results), (1, 0))
+        with self.assertRaises(ZeroDivisionError):
+            next(results)
+
+    def test_map_adaptive_chunksize_buffersize_validation(self):
+        with self.assertRaisesRegex(TypeError, "buffersize"):
+            self.executor.map(str, range(4), chunksize=None, buffersize=2.0)
+        with self.assertRaisesRegex(ValueError, "buffersize"):
+            self.executor.map(str, range(4), chunksize=None, buffersize=0)
+
     @classmethod
     def _test_traceback(cls):
         raise RuntimeError(123) # some comment
@@ -207,6 +287,89 @@ def test_max_tasks_per_child(self):
 
         executor.shutdown()
 
+    def test_forkserver_preload(self):
+        context = self.get_context()
+        if context.get_start_method(allow_none=False) != "forkserver":
+            with self.assertRaises(ValueError):
+                self.executor_type(1, mp_context=context,
+                                   forkserver_preload=['colorsys'])
+            return
+        executor = self.executor_type(
+            2, mp_context=context, forkserver_preload=['colorsys'],
+            forkserver_warmup=_warmup)
+        fs = [executor.submit(_worker_state) for _ in range(4)]
+        states = [f.result() for f in fs]
+        server = executor._mp_context._forkserver
+        executor.shutdown()
+        for warm, preloaded, ppid in states:
+            self.assertTrue(warm)
+            self.assertTrue(preloaded)
+            # The workers were forked by the executor's own fork server.
+            self.assertNotEqual(ppid, os.getpid())
+        self.assertIsNone(server._forkserver_pid)
+        self.assertFalse(_warm)
+
+        # The server is also stopped without waiting for the shutdown.
+        executor = self.executor_type(
+            2, mp_context=context, forkserver_preload=['colorsys'])
+        executor.submit(_worker_state).result()
+        server = executor._mp_context._forkserver
+        pid = server._forkserver_pid
+        self.assertIsNotNone(pid)
+        manager_thread = executor._executor_manager_thread
+        executor.shutdown(wait=False)
+        manager_thread.join(support.SHORT_TIMEOUT)
+        self.assertIsNone(server._forkserver_pid)
+        self.assertRaises(ProcessLookupError, os.kill, pid, 0)
+
+    def test_forkserver_preload_defaults_to_forkserver_context(self):
+        if 'forkserver' not in multiprocessing.get_all_start_methods():
+            self.skipTest('requires the forkserver start method')
+        executor = self.executor_type(1, forkserver_warmup=_warmup)
+        self.assertEqual(executor._mp_context.get_start_method(), "forkserver")
+        executor.shutdown()
+
+    def test_forkserver_warmup_in_main(self):
+        # The warmup is usually defined in the main script.
+        context = self.get_context()
+        if context.get_start_method(allow_none=False) != "forkserver":
+            self.skipTest("test only relevant for the forkserver method")
+        script = textwrap.dedent("""
+            import os
+            import warnings
+            from concurrent.futures import ProcessPoolExecutor
+            from multiprocessing import get_context
+
+            def warm():
+                os.environ['WARMED_UP'] = 'yes'
+
+            def fail():
+                raise ZeroDivisionError('warmup failure')
+
+            def state():
+                return os.environ.get('WARMED_UP')
+
+            if __name__ == '__main__':
+                ctx = get_context('forkserver')
+                with ProcessPoolExecutor(2, mp_context=ctx,
+                                         forkserver_warmup=warm) as executor:
+                    print(executor.submit(state).result())
+                with warnings.catch_warnings(record=True) as w:
+                    warnings.simplefilter('always')
+                    with ProcessPoolExecutor(
+                            2, mp_context=ctx,
+                            forkserver_warmup=fail) as executor:
+                        print(executor.submit(state).result())
+                print([str(x.category.__name__) for x in w])
+                print('ZeroDivisionError: warmup failure' in str(w[0].message))
+            """)
+        with os_helper.temp_dir() as script_dir:
+            name = script_helper.make_script(script_dir, 'warmup_main',
+                                             script)
+            rc, out, err = script_helper.assert_python_ok(name)
+        self.assertEqual(out.decode().split('\n'),
+                         ['yes', 'None', "['RuntimeWarning']", 'True', ''])
+
     def test_max_tasks_per_child_defaults_to_spawn_context(self):
         # not using self.executor as we need to control construction.
         # arguably this could go in another class w/o that mixin.
@@ -360,11 +523,120 @@ def test_force_shutdown_workers_stops_pool(self, function_name):
                     break
 
 
+class AdaptiveChunkerTest(unittest.TestCase):
+    def record(self, chunker, n, elapsed):
+        f = futures.Future()
+        f.set_result((elapsed, [None] * n))
+        chunker.record(f, n)
+
+    def test_no_measurement(self):
+        chunker = _AdaptiveChunker()
+        self.assertEqual([chunker.next_chunksize() for _ in range(5)],
+                         [1] * 5)
+
+    def test_grows_geometrically(self):
+        chunker = _AdaptiveChunker(target_time=1.0)
+        self.record(chunker, 1, 1e-6)
+        sizes = [chunker.next_chunksize() for _ in range(5)]
+        self.assertEqual(sizes, [2, 4, 8, 16, 32])
+
+    def test_target_time(self):
+        chunker = _AdaptiveChunker(target_time=0.1)
+        self.record(chunker, 1, 0.01)
+        sizes = [chunker.next_chunksize() for _ in range(5)]
+        self.assertEqual(sizes, [2, 4, 8, 10, 10])
+        # Slower items shrink the chunks.
+        self.record(chunker, 10, 1.9)
+        self.assertEqual(chunker.next_chunksize(), 1)
+
+    def test_target_bytes(self):
+        chunker = _AdaptiveChunker(target_time=1.0, target_bytes=10_000)
+        self.record(chunker, 1, 1e-6)
+        chunker.sample((b'x' * 2000,))
+        sizes = [chunker.next_chunksize() for _ in range(5)]
+        self.assertEqual(sizes, [2, 4, 4, 4, 4])
+
+    def test_failed_chunks_ignored(self):
+        chunker = _AdaptiveChunker()
+        f = futures.Future()
+        f.set_exception(ZeroDivisionError())
+        chunker.record(f, 3)
+        self.assertIsNone(chunker.item_time)
+        chunker.sample((lambda: 0,))
+        self.assertIsNone(chunker.item_bytes)
+
+
+class ProcessPoolSharedMemoryTest:
+    worker_count = 2
+    executor_kwargs = {'shared_memory_threshold': 1024}
+
+    def shm_segments(self):
+        try:
+            names = os.listdir('/dev/shm')
+        except OSError:
+            self.skipTest('requires /dev/shm')
+        # Ignore semaphores and segments which are not ours.
+        return {name for name in names if name.startswith('psm_')}
+
+    def test_invalid_threshold(self):
+        context = self.get_context()
+        with self.assertRaises(TypeError):
+            self.executor_type(1, mp_context=context,
+                               shared_memory_threshold=1.5)
+        with self.assertRaises(ValueError):
+            self.executor_type(1, mp_context=context,
+                               shared_memory_threshold=0)
+
+    def test_arguments(self):
+        big = bytes(range(256)) * 16
+        data = [big, bytearray(big), array.array('i', range(1024)),
+                memoryview(bytearray(big)).cast('H', [64, 32]), b'small']
+        args_types, kwargs_types = self.executor.submit(
+            _describe, *data, key=bytearray(big)).result()
+        self.assertEqual(args_types, [(type(a), a) for a in data])
+        self.assertEqual(kwargs_types, {'key': (bytearray, bytearray(big))})
+
+    def test_results(self):
+        size = 4096
+        result = self.executor.submit(_make_payload, size).result()
+        expected = _make_payload(size)
+        self.assertEqual(len(result), len(expected))
+        for got, exp in zip(result, expected):
+            self.assertIs(type(got), type(exp))
+            if isinstance(exp, OutOfBandBuffer):
+                self.assertEqual(got.data, exp.data)
+            else:
+                self.assertEqual(got, exp)
+        self.assertEqual(result[3].format, 'i')
+
+    def test_map(self):
+        items = [bytes([i]) * 2048 for i in range(10)]
+        self.assertEqual(list(self.executor.map(bytes, items, chunksize=3)),
+                         items)
+
+    def test_segments_unlinked(self):
+        before = self.shm_segments()
+        fs = [self.executor.submit(bytearray, b'z' * 10_000)
+              for _ in range(10)]
+        for f in fs:
+            self.assertEqual(f.result(), b'z' * 10_000)
+        # Unpicklable arguments are reported through the future.
+        with self.assertRaises(pickle.PicklingError):
+            self.executor.submit(id, (b'z' * 10_000, lambda: 0)).result()
+        self.executor.shutdown(wait=True)
+        self.assertEqual(self.shm_segments() - before, set())
+
+
 create_executor_tests(globals(), ProcessPoolExecutorTest,
                       executor_mixins=(ProcessPoolForkMixin,
                                        ProcessPoolForkserverMixin,
                                        ProcessPoolSpawnMixin))
 
+create_executor_tests(globals(), ProcessPoolSharedMemoryTest,
+                      executor_mixins=(ProcessPoolForkMixin,
+                                       ProcessPoolForkserverMixin,
+                                       ProcessPoolSpawnMixin))
+
 
 def setUpModule():
     setup_module()
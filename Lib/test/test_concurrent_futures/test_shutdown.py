@@ -110,6 +110,21 @@ def test_cancel_futures(self):
         # one finished.
         self.assertGreater(len(others), 0)
 
+    @warnings_helper.ignore_fork_in_thread_deprecation_warnings()
+    def test_cancel_futures_metrics(self):
+        assert self.worker_count <= 5, "test needs few workers"
+        metrics = self.executor.enable_metrics()
+        fs = [self.executor.submit(time.sleep, .1) for _ in range(50)]
+        self.executor.shutdown(cancel_futures=True)
+        cancelled = [fut for fut in fs if fut.cancelled()]
+        self.assertGreater(len(cancelled), 20)
+        # Every cancelled call is counted, none is left queued.
+        self.assertEqual(metrics.submitted, 50)
+        self.assertEqual(metrics.cancelled, len(cancelled))
+        self.assertEqual(metrics.completed, 50 - len(cancelled))
+        self.assertEqual(metrics.queued, 0)
+        self.assertEqual(metrics.running, 0)
+
     def test_hang_gh83386(self):
         """shutdown(wait=False) doesn't hang at exit with running futures.
 
@@ -115,6 +115,113 @@ def log_n_wait(ident):
         # ident='third' is cancelled because it remained in the collection of futures
         self.assertListEqual(log, ["ident='first' started", "ident='first' stopped"])
 
+    def test_metrics_queued_and_cancelled(self):
+        event = threading.Event()
+        with self.executor_type(max_workers=1) as pool:
+            metrics = pool.enable_metrics()
+            blocker = pool.submit(event.wait)
+            pending = [pool.submit(mul, i, 2) for i in range(3)]
+            for _ in support.sleeping_retry(support.SHORT_TIMEOUT):
+                if metrics.running == 1:
+                    break
+            self.assertEqual(metrics.queued, 3)
+            self.assertTrue(pending[0].cancel())
+            event.set()
+            blocker.result()
+        self.assertEqual(metrics.submitted, 4)
+        self.assertEqual(metrics.completed, 3)
+        self.assertEqual(metrics.cancelled, 1)
+        self.assertEqual(metrics.queued, 0)
+        self.assertEqual(metrics.running, 0)
+
+    def test_metrics_shutdown_cancel_futures(self):
+        event = threading.Event()
+        with self.executor_type(max_workers=1) as pool:
+            metrics = pool.enable_metrics()
+            blocker = pool.submit(event.wait)
+            try:
+                pending = [pool.submit(mul, i, 2) for i in range(5)]
+                for _ in support.sleeping_retry(support.SHORT_TIMEOUT):
+                    if metrics.running == 1:
+                        break
+                self.assertEqual(metrics.queued, 5)
+                pool.shutdown(wait=False, cancel_futures=True)
+                self.assertTrue(all(f.cancelled() for f in pending))
+                self.assertEqual(metrics.cancelled, 5)
+                self.assertEqual(metrics.queued, 0)
+            finally:
+                event.set()
+            blocker.result()
+        self.assertEqual(metrics.completed, 1)
+        self.assertEqual(metrics.running, 0)
+
+    def test_metrics_broken(self):
+        def init_fail():
+            raise ValueError('error in initializer')
+        pool = self.executor_type(max_workers=1, initializer=init_fail)
+        metrics = pool.enable_metrics()
+        with self.assertLogs('concurrent.futures', level='CRITICAL'):
+            f = pool.submit(mul, 1, 2)
+            with self.assertRaises(futures.thread.BrokenThreadPool):
+                f.result()
+        pool.shutdown()
+        self.assertEqual(metrics.submitted, 1)
+        self.assertEqual(metrics.cancelled, 1)
+        self.assertEqual(metrics.queued, 0)
+
+
+class WorkStealingThreadPoolExecutorTest(ThreadPoolMixin, ExecutorTest,
+                                         BaseTestCase):
+    executor_kwargs = {'work_stealing': True}
+
+    def test_nested_submit_uses_local_queue(self):
+        def inner(n):
+            return threading.current_thread(), n
+        def outer():
+            # Items submitted from a worker go to that worker's deque.
+            fs = [self.executor.submit(inner, i) for i in range(10)]
+            local = self.executor._work_queue._local.deque
+            return local, fs
+
+        local, fs = self.executor.submit(outer).result()
+        self.assertIn(local, self.executor._work_queue._deques)
+        self.assertEqual(sorted(f.result()[1] for f in fs), list(range(10)))
+
+    def test_idle_workers_steal(self):
+        barrier = threading.Barrier(3)
+        def task():
+            barrier.wait(timeout=support.SHORT_TIMEOUT)
+            return threading.current_thread()
+        def spawner():
+            fs = [executor.submit(task) for _ in range(3)]
+            return [f.result(timeout=support.SHORT_TIMEOUT) for f in fs]
+
+        # The spawner blocks on its subtasks, which all sit in its own
+        # deque: they can only complete if the other workers steal them,
+        # and the barrier requires them to run on three distinct threads.
+        with self.executor_type(4, work_stealing=True) as executor:
+            fut = executor.submit(spawner)
+            threads = fut.result(timeout=support.SHORT_TIMEOUT)
+        self.assertEqual(len(set(threads)), 3)
+        self.assertNotIn(threading.current_thread(), threads)
+
+    def test_cancel_futures_drains_local_queues(self):
+        executor = self.executor_type(1, work_stealing=True)
+        submitted = threading.Event()
+        release = threading.Event()
+        def outer():
+            fs = [executor.submit(mul, i, 2) for i in range(5)]
+            submitted.set()
+            release.wait(timeout=support.SHORT_TIMEOUT)
+            return fs
+
+        fut = executor.submit(outer)
+        self.assertTrue(submitted.wait(timeout=support.SHORT_TIMEOUT))
+        executor.shutdown(wait=False, cancel_futures=True)
+        release.set()
+        fs = fut.result(timeout=support.SHORT_TIMEOUT)
+        executor.shutdown(wait=True)
+        self.assertTrue(all(f.cancelled() for f in fs))
 
 def setUpModule():
     setup_module()
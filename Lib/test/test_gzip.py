@@ -12,7 +12,7 @@
 from subprocess import PIPE, Popen
 from test.support import catch_unraisable_exception
 from test.support import force_not_colorized_test_class, import_helper
-from test.support import os_helper
+from test.support import os_helper, threading_helper
 from test.support import _4G, bigmemtest, requires_subprocess
 from test.support.script_helper import assert_python_ok, assert_python_failure
 
@@ -892,6 +892,128 @@ def test_write_seek_write(self):
         data = b.getvalue()
         self.assertEqual(gzip.decompress(data), message * 2)
 
+    @threading_helper.requires_working_threading()
+    def test_threads(self):
+        data = b''.join(b'%d %s\n' % (i, data1 if i % 7 else data2)
+                        for i in range(20000))
+        self.assertGreater(len(data), 2 * gzip._PARALLEL_BLOCK_SIZE)
+        b = io.BytesIO()
+        with gzip.GzipFile(fileobj=b, mode='wb', threads=3) as f:
+            f.write(data[:1000])
+            f.flush()
+            partial_data = b.getvalue()
+            for i in range(1000, len(data), 300000):
+                f.write(memoryview(data)[i:i + 300000])
+            f.flush(zlib.Z_FULL_FLUSH)
+            f.write(data1)
+        # The output is a single gzip member.
+        d = zlib.decompressobj(wbits=31)
+        self.assertEqual(d.decompress(b.getvalue()), data + data1)
+        self.assertTrue(d.eof)
+        self.assertEqual(d.unused_data, b'')
+        d = zlib.decompressobj(wbits=-zlib.MAX_WBITS)
+        f = io.BytesIO(partial_data)
+        gzip._read_gzip_header(f)
+        self.assertEqual(d.decompress(f.read()), data[:1000])
+
+        for compresslevel in (0, 1, 9):
+            datac = gzip.compress(data, compresslevel, mtime=42, threads=2)
+            self.assertEqual(gzip.decompress(datac), data)
+            self.assertEqual(struct.unpack('<4sLxB', datac[:10]),
+                             (b'\x1f\x8b\x08\x00', 42, 255))
+        self.assertEqual(gzip.decompress(gzip.compress(b'', threads=2)), b'')
+
+        self.assertRaises(ValueError, gzip.compress, data1, threads=0)
+        with self.assertRaises(ValueError):
+            gzip.GzipFile(fileobj=io.BytesIO(), mode='wb', threads=0)
+
+    def test_threads_read_mode(self):
+        data = gzip.compress(data1)
+        with self.assertRaises(TypeError):
+            gzip.GzipFile(fileobj=io.BytesIO(data), mode='rb', threads=2)
+        with self.assertRaises(TypeError):
+            gzip.open(io.BytesIO(data), 'rt', threads=2)
+        with open(self.filename, 'wb') as f:
+            f.write(data)
+        with open(self.filename, 'rb') as f:
+            with self.assertRaises(TypeError):
+                gzip.GzipFile(fileobj=f, threads=2)
+        with self.assertRaises(TypeError):
+            gzip.GzipFile(self.filename, threads=2)
+        with gzip.GzipFile(fileobj=io.BytesIO(data), threads=1) as f:
+            self.assertEqual(f.read(), data1)
+
+    def test_index(self):
+        data = b''.join(b'%d %s\n' % (i, data1 if i % 7 else data2)
+                        for i in range(20000))
+        # Two members, separated by zero padding.
+        blob = gzip.compress(data) + b'\0' * 3 + gzip.compress(data[::-1], 1)
+        data += data[::-1]
+        with gzip.GzipFile(fileobj=io.BytesIO(blob)) as f:
+            self.assertRaises(ValueError, f.save_index, io.BytesIO())
+            self.assertRaises(ValueError, f.build_index, 0)
+            self.assertEqual(f.read(10), data[:10])
+            f.build_index(spacing=100000)
+            self.assertEqual(f.read(10), data[10:20])
+            index = f._buffer.raw._index
+            self.assertEqual(index.size, len(data))
+            self.assertGreater(len(index.points), 3)
+            for offset in (len(data) - 1, 0, 123456, len(data) // 2, 150000,
+                           len(data) // 2 + 200000, 99999):
+                self.assertEqual(f.seek(offset), offset)
+                self.assertEqual(f.read(1000), data[offset:offset + 1000])
+            self.assertEqual(f.seek(-10, io.SEEK_END), len(data) - 10)
+            self.assertEqual(f.read(), data[-10:])
+            f.save_index(self.filename)
+
+        with gzip.GzipFile(fileobj=io.BytesIO(blob)) as f:
+            f.load_index(self.filename)
+            offset = len(data) * 3 // 4
+            f.seek(offset)
+            self.assertEqual(f.read(1000), data[offset:offset + 1000])
+            f.seek(0)
+            self.assertEqual(f.read(), data)
+
+        with gzip.GzipFile(fileobj=io.BytesIO(blob[:-1] + b'\0\0')) as f:
+            self.assertRaisesRegex(ValueError, 'does not match',
+                                   f.load_index, self.filename)
+        with gzip.GzipFile(fileobj=io.BytesIO(blob)) as f:
+            self.assertRaises(ValueError, f.load_index, io.BytesIO(b'spam'))
+        with gzip.GzipFile(fileobj=io.BytesIO(blob[:-100])) as f:
+            self.assertRaises(EOFError, f.build_index)
+        with gzip.GzipFile(fileobj=io.BytesIO(), mode='wb') as f:
+            self.assertRaises(OSError, f.build_index)
+
+    def test_index_start_offset(self):
+        # The gzip stream does not start at the beginning of the file.
+        data = b''.join(b'%d %s\n' % (i, data1 if i % 7 else data2)
+                        for i in range(20000))
+        blob = gzip.compress(data)
+        fileobj = io.BytesIO(b'HEADER' + blob)
+        fileobj.seek(6)
+        with gzip.GzipFile(fileobj=fileobj) as f:
+            f.build_index(spacing=50000)
+            self.assertTrue(f._buffer.raw._index.points)
+            for offset in (len(data) - 1, 0, 123456, 99999, 10):
+                self.assertEqual(f.seek(offset), offset)
+                self.assertEqual(f.read(1000), data[offset:offset + 1000])
+            f.save_index(self.filename)
+
+        # The index does not depend on the position of the stream.
+        fileobj = io.BytesIO(b'OTHER HEADER' + blob)
+        fileobj.seek(12)
+        with gzip.GzipFile(fileobj=fileobj) as f:
+            f.load_index(self.filename)
+            offset = len(data) * 3 // 4
+            f.seek(offset)
+            self.assertEqual(f.read(1000), data[offset:offset + 1000])
+            f.seek(0)
+            self.assertEqual(f.read(), data)
+        with gzip.GzipFile(fileobj=io.BytesIO(blob)) as f:
+            f.load_index(self.filename)
+            f.seek(offset)
+            self.assertEqual(f.read(1000), data[offset:offset + 1000])
+
 
     def test_refloop_unraisable(self):
         # Ensure a GzipFile referring to a temporary fileobj deletes cleanly.
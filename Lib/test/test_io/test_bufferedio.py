@@ -511,6 +511,46 @@ def test_no_extraneous_read(self):
             self.assertEqual(rawio._extraneous_reads, 0,
                              "failed for {}: {} != 0".format(n, rawio._extraneous_reads))
 
+    def test_sequential_read_grows_buffer(self):
+        data = bytes(range(256)) * 8192
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        with self.FileIO(os_helper.TESTFN, "wb") as f:
+            f.write(data)
+        grows = self.tp is self.BufferedReader
+        # The buffer grows if its size was chosen by open().
+        with self.open(os_helper.TESTFN, self.read_mode) as bufio:
+            self.assertIs(type(bufio), self.tp)
+            size = len(bufio.read1())
+            # Seeking between reads does not grow the buffer.
+            for pos in range(0, 100000, 10000):
+                bufio.seek(pos)
+                self.assertEqual(bufio.read(5000), data[pos:pos + 5000])
+            bufio.seek(0)
+            self.assertEqual(len(bufio.read1()), size)
+
+            bufio.seek(0)
+            chunks = iter(lambda: bufio.read(1000), b"")
+            self.assertEqual(b"".join(chunks), data)
+            bufio.seek(0)
+            self.assertEqual(len(bufio.read1()),
+                             max(size, 1024 * 1024) if grows else size)
+            bufio.seek(0)
+            self.assertEqual(b"".join(bufio.readlines()), data)
+
+        # An explicit buffer size is never exceeded.
+        with self.FileIO(os_helper.TESTFN, self.read_mode) as raw:
+            bufio = self.tp(raw, 4096)
+            chunks = iter(lambda: bufio.read(1000), b"")
+            self.assertEqual(b"".join(chunks), data)
+            bufio.seek(0)
+            self.assertEqual(len(bufio.read1()), 4096)
+        with self.open(os_helper.TESTFN, self.read_mode,
+                       buffering=4096) as bufio:
+            chunks = iter(lambda: bufio.read(1000), b"")
+            self.assertEqual(b"".join(chunks), data)
+            bufio.seek(0)
+            self.assertEqual(len(bufio.read1()), 4096)
+
     def test_read_on_closed(self):
         # Issue #23796
         b = self.BufferedReader(self.BytesIO(b"12"))
@@ -801,6 +841,67 @@ def test_writelines_error(self):
         self.assertRaises(TypeError, bufio.writelines, None)
         self.assertRaises(TypeError, bufio.writelines, 'abc')
 
+    def test_writelines_iteration_error(self):
+        # The lines consumed before the error are written.
+        def gen():
+            yield b'ab'
+            yield b'cd'
+            yield b'ef'
+            raise ZeroDivisionError
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        for size in (4, 100):
+            with self.subTest(buffer_size=size):
+                with self.FileIO(os_helper.TESTFN, self.write_mode) as raw:
+                    bufio = self.tp(raw, size)
+                    self.assertRaises(ZeroDivisionError, bufio.writelines,
+                                      gen())
+                    self.assertEqual(bufio.tell(), 6)
+                    bufio.flush()
+                with self.open(os_helper.TESTFN, "rb") as f:
+                    self.assertEqual(f.read(), b'abcdef')
+
+        writer = self.MockRawIO()
+        bufio = self.tp(writer, 4)
+        self.assertRaises(ZeroDivisionError, bufio.writelines, gen())
+        bufio.flush()
+        self.assertEqual(b''.join(writer._write_stack), b'abcdef')
+
+    def test_writelines_lazy(self):
+        # The lines are written in batches while the iterable is consumed.
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        with self.FileIO(os_helper.TESTFN, self.write_mode) as raw:
+            bufio = self.tp(raw, 8)
+            def gen():
+                for i in range(5000):
+                    if i == 4000:
+                        self.assertGreater(raw.tell(), 0)
+                    yield b'x'
+            bufio.writelines(gen())
+            self.assertEqual(bufio.tell(), 5000)
+
+    def test_writelines_fileio(self):
+        # Data which does not fit in the buffer is written with a vectored
+        # FileIO.writelines().
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        with self.FileIO(os_helper.TESTFN, self.write_mode) as raw:
+            bufio = self.tp(raw, 8)
+            bufio.write(b'ab')
+            bufio.writelines([b'cd', bytearray(b'efghij'), memoryview(b'klm')])
+            self.assertEqual(bufio.tell(), 13)
+            self.assertEqual(raw.tell(), 13)
+            bufio.writelines(iter([b'n', b'o']))
+            self.assertEqual(bufio.tell(), 15)
+            self.assertEqual(raw.tell(), 13)
+            bufio.writelines([b'p' * 8])
+            self.assertEqual(raw.tell(), 23)
+            bufio.seek(1)
+            bufio.writelines([b'B', b'C' * 10])
+            self.assertEqual(bufio.tell(), 12)
+            self.assertRaises(TypeError, bufio.writelines, [b'q', 'r'])
+            bufio.flush()
+        with self.open(os_helper.TESTFN, "rb") as f:
+            self.assertEqual(f.read(), b'aB' + b'C' * 10 + b'mnopppppppp')
+
     def test_destructor(self):
         writer = self.MockRawIO()
         bufio = self.tp(writer, 8)
@@ -1229,6 +1330,22 @@ def test_read_and_write(self):
         self.assertEqual(b"ghjk", rw.read())
         self.assertEqual(b"dddeee", raw._write_stack[0])
 
+    def test_read_and_writelines_fileio(self):
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        with self.FileIO(os_helper.TESTFN, "w+b") as raw:
+            raw.write(b"0123456789abcdef")
+            raw.seek(0)
+            rw = self.tp(raw, 8)
+            self.assertEqual(rw.read(2), b"01")
+            # The read-ahead is undone before the vectored write.
+            rw.writelines([b"xx", b"yyyyyyyy"])
+            self.assertEqual(rw.tell(), 12)
+            self.assertEqual(rw.read(2), b"cd")
+            rw.writelines([b"z"])
+            self.assertEqual(rw.read(), b"f")
+        with self.open(os_helper.TESTFN, "rb") as f:
+            self.assertEqual(f.read(), b"01xxyyyyyyyycdzf")
+
     def test_seek_and_tell(self):
         raw = self.BytesIO(b"asdfghjkl")
         rw = self.tp(raw)
@@ -154,6 +154,53 @@ def testWritelinesError(self):
         self.assertRaises(TypeError, self.f.writelines, None)
         self.assertRaises(TypeError, self.f.writelines, "abc")
 
+    def testWritelinesMany(self):
+        # More buffers than a single writev() call accepts.
+        l = [bytes([i % 256]) * (i % 7) for i in range(5000)]
+        l += [bytearray(b'ab'), memoryview(b'cd'), array('b', b'ef'), b'']
+        self.f.writelines(iter(l))
+        expected = b''.join(l)
+        self.assertEqual(self.f.tell(), len(expected))
+        self.f.close()
+        self.f = self.FileIO(TESTFN, 'rb')
+        self.assertEqual(self.f.read(), expected)
+
+    def testAdvise(self):
+        self.f.write(b"hi\nbye\nabc")
+        for advice in ('normal', 'sequential', 'random', 'willneed',
+                       'dontneed', 'noreuse'):
+            self.assertIsNone(self.f.advise(advice))
+        self.assertIsNone(self.f.advise('willneed', 3, 4))
+        self.assertRaises(ValueError, self.f.advise, 'never')
+        self.assertRaises(ValueError, self.f.advise, 'random', -1)
+        self.assertRaises(ValueError, self.f.advise, 'random', 0, -1)
+        self.assertRaises(TypeError, self.f.advise, 1)
+        self.f.close()
+        self.assertRaises(ValueError, self.f.advise, 'normal')
+
+    def testWritelinesLazy(self):
+        # The lines are written in batches while the iterable is consumed.
+        def gen():
+            for i in range(5000):
+                if i == 4000:
+                    self.assertGreater(os.path.getsize(TESTFN), 0)
+                yield b'x'
+        self.f.writelines(gen())
+        self.assertEqual(self.f.tell(), 5000)
+
+    def testWritelinesIterationError(self):
+        # The lines consumed before the error are written.
+        def gen():
+            yield b'ab'
+            yield b'cd'
+            yield b'ef'
+            raise ZeroDivisionError
+        self.assertRaises(ZeroDivisionError, self.f.writelines, gen())
+        self.assertRaises(TypeError, self.f.writelines, [b'gh', 'ij'])
+        self.f.close()
+        self.f = self.FileIO(TESTFN, 'rb')
+        self.assertEqual(self.f.read(), b'abcdefgh')
+
     def test_none_args(self):
         self.f.write(b"hi\nbye\nabc")
         self.f.close()
@@ -730,6 +777,22 @@ def __setattr__(self, name, value):
         self.assertRaises(MyException, MyFileIO, fd)
         os.close(fd)  # should not raise OSError(EBADF)
 
+    @unittest.skipUnless(hasattr(os, 'set_blocking'),
+                         'requires os.set_blocking()')
+    def testWritelinesNonBlocking(self):
+        r, w = os.pipe()
+        self.addCleanup(os.close, r)
+        os.set_blocking(w, False)
+        data = [b'x' * 1000] * 10000
+        with self.FileIO(w, 'wb') as f:
+            with self.assertRaises(BlockingIOError) as cm:
+                f.writelines(data)
+        written = cm.exception.characters_written
+        self.assertGreater(written, 0)
+        self.assertLess(written, 1000 * 10000)
+        with self.FileIO(r, 'rb', closefd=False) as f:
+            self.assertEqual(f.readall(), b'x' * written)
+
 
 class COtherFileTests(OtherFileTests, unittest.TestCase):
     FileIO = _io.FileIO
@@ -1,6 +1,6 @@
 import decimal
 from io import StringIO
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
 from test.test_json import PyTest, CTest
 from test import support
 
@@ -69,6 +69,77 @@ def test_object_pairs_hook(self):
                                     object_pairs_hook=OrderedDict),
                          OrderedDict([('empty', OrderedDict())]))
 
+    def test_object_factory(self):
+        s = ('[{"a": 1, "b": {"a": 2, "b": []}}, {"b": 3, "a": 4}, '
+             '{"a": 5, "b": 6}, {}]')
+        shapes = []
+        def object_factory(keys):
+            shapes.append(keys)
+            return namedtuple('Record', keys)
+        rval = self.loads(s, object_factory=object_factory)
+        self.assertEqual(shapes, [('a', 'b'), ('b', 'a'), ()])
+        self.assertEqual([x._asdict() for x in rval[:3]],
+                         [{'a': 1, 'b': (2, [])}, {'a': 4, 'b': 3},
+                          {'a': 5, 'b': 6}])
+        self.assertIs(type(rval[0]), type(rval[0].b))
+        self.assertIs(type(rval[0]), type(rval[2]))
+        self.assertEqual(rval[3], ())
+
+        # The factory is cached by the decoder.
+        decoder = self.json.JSONDecoder(object_factory=object_factory)
+        shapes.clear()
+        decoder.decode('{"x": 1}')
+        decoder.decode('{"x": 2}')
+        self.assertEqual(shapes, [('x',)])
+
+    def test_object_factory_cache_size(self):
+        shapes = []
+        def object_factory(keys):
+            shapes.append(keys)
+            return namedtuple('Record', keys)
+        decoder = self.json.JSONDecoder(object_factory=object_factory)
+        size = self.json.scanner.SHAPES_CACHE_SIZE
+        docs = ['{"k%d": %d}' % (i, i) for i in range(size + 1)]
+        for doc in docs:
+            decoder.decode(doc)
+        self.assertEqual(len(shapes), size + 1)
+        # The first tuple of keys was evicted, the last ones are kept.
+        decoder.decode(docs[-1])
+        decoder.decode(docs[2])
+        self.assertEqual(len(shapes), size + 1)
+        decoder.decode(docs[0])
+        self.assertEqual(len(shapes), size + 2)
+        self.assertEqual(shapes[-1], ('k0',))
+
+    def test_object_factory_fallback(self):
+        s = '[{"a": 1}, {"b": 2}, {"a": 3}, {"b": 4, "b": 5}]'
+        def object_factory(keys):
+            return (lambda *values: values) if 'a' in keys else None
+        self.assertEqual(self.loads(s, object_factory=object_factory),
+                         [(1,), {'b': 2}, (3,), {'b': 5}])
+        # The object_factory takes priority over the other hooks.
+        self.assertEqual(self.loads(s, object_factory=object_factory,
+                                    object_pairs_hook=OrderedDict),
+                         [(1,), OrderedDict(b=2), (3,), OrderedDict(b=5)])
+        self.assertEqual(self.loads(s, object_factory=object_factory,
+                                    object_hook=len),
+                         [(1,), 1, (3,), 1])
+        # Keys are passed in order, including duplicates.
+        self.assertEqual(self.loads('{"b": 4, "b": 5}',
+                                    object_factory=lambda keys: lambda *v:
+                                        (keys, v)),
+                         (('b', 'b'), (4, 5)))
+
+    def test_object_factory_errors(self):
+        def object_factory(keys):
+            raise ValueError(keys)
+        with self.assertRaisesRegex(ValueError, "'a'"):
+            self.loads('[{"a": 1}]', object_factory=object_factory)
+        with self.assertRaises(TypeError):
+            self.loads('{"a": 1}', object_factory=lambda keys: len)
+        with self.assertRaises(TypeError):
+            self.loads('{"a": 1}', object_factory=lambda keys: 1)
+
     def test_decoder_optimizations(self):
         # Several optimizations were made that skip over calls to
         # the whitespace regex, so this test is designed to try and
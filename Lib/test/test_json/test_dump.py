@@ -1,4 +1,4 @@
-from io import StringIO
+from io import BytesIO, StringIO
 from test.test_json import PyTest, CTest
 
 from test.support import bigmemtest, _1G
@@ -12,6 +12,89 @@ def test_dump(self):
     def test_dumps(self):
         self.assertEqual(self.dumps({}), '{}')
 
+    def test_dump_binary(self):
+        bio = BytesIO()
+        self.json.dump({'a': [1, 'b']}, bio, binary=True)
+        self.assertEqual(bio.getvalue(), b'{"a": [1, "b"]}')
+
+        obj = {'\xe9t\xe9': ['\u20ac', '\U0001f40d'], 'ascii': 'x'}
+        for ensure_ascii in (True, False):
+            with self.subTest(ensure_ascii=ensure_ascii):
+                bio = BytesIO()
+                self.json.dump(obj, bio, ensure_ascii=ensure_ascii,
+                               binary=True)
+                expected = self.dumps(obj, ensure_ascii=ensure_ascii)
+                self.assertEqual(bio.getvalue(), expected.encode('utf-8'))
+
+    def test_dump_large(self):
+        # The output is written in several blocks.
+        obj = {'key%d' % i: ['\xe9' * (i % 7), i, i / 3, None]
+               for i in range(20000)}
+        obj['nested'] = [[list(range(10))] * 10] * 100
+        for binary, io in ((False, StringIO), (True, BytesIO)):
+            for indent in (None, 2):
+                with self.subTest(binary=binary, indent=indent):
+                    writes = []
+                    f = io()
+                    def write(data, write=f.write):
+                        writes.append(len(data))
+                        return write(data)
+                    f.write = write
+                    self.json.dump(obj, f, indent=indent,
+                                   ensure_ascii=False, binary=binary)
+                    expected = self.dumps(obj, indent=indent,
+                                          ensure_ascii=False)
+                    if binary:
+                        expected = expected.encode('utf-8')
+                    self.assertEqual(f.getvalue(), expected)
+                    self.assertGreater(len(writes), 2)
+                    self.assertLess(max(writes), 2 * 65536)
+
+    def test_dump_large_mixed_kinds(self):
+        # Blocks following a block with non-ASCII characters can be ASCII
+        # again.
+        ascii_part = [list(range(1000))] * 100
+        obj = ['\U0001f40d', ascii_part, '\u20ac', ascii_part,
+               '\xe9', ascii_part]
+        for binary, io in ((False, StringIO), (True, BytesIO)):
+            with self.subTest(binary=binary):
+                writes = []
+                f = io()
+                def write(data, write=f.write):
+                    writes.append(data)
+                    return write(data)
+                f.write = write
+                self.json.dump(obj, f, ensure_ascii=False, binary=binary)
+                expected = self.dumps(obj, ensure_ascii=False)
+                if binary:
+                    expected = expected.encode('utf-8')
+                self.assertEqual(f.getvalue(), expected)
+                self.assertGreater(len(writes), 6)
+                self.assertTrue(writes[-2].isascii())
+
+    def test_dump_error(self):
+        # The blocks written before the error are kept.
+        sio = StringIO()
+        obj = [list(range(100000)), object()]
+        with self.assertRaises(TypeError):
+            self.json.dump(obj, sio)
+        self.assertStartsWith(sio.getvalue(), '[[0, 1, 2')
+
+        def write(data):
+            raise OSError('disk full')
+        sio.write = write
+        with self.assertRaisesRegex(OSError, 'disk full'):
+            self.json.dump([1], sio)
+
+    def test_dump_custom_iterencode(self):
+        class Encoder(self.json.JSONEncoder):
+            def iterencode(self, o, _one_shot=False):
+                yield from super().iterencode(o, _one_shot)
+                yield '\n'
+        sio = StringIO()
+        self.json.dump([1], sio, cls=Encoder)
+        self.assertEqual(sio.getvalue(), '[1]\n')
+
     def test_dump_skipkeys(self):
         v = {b'invalid_key': False, 'valid_key': True}
         with self.assertRaises(TypeError):
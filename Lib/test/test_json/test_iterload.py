@@ -0,0 +1,189 @@
+import codecs
+import decimal
+from collections import namedtuple
+from io import BytesIO, StringIO
+from test.test_json import PyTest, CTest
+
+
+class ChunkedReader:
+    """File-like object returning at most size characters per read()."""
+
+    def __init__(self, data, size=1):
+        self.data = data
+        self.size = size
+        self.pos = 0
+
+    def read(self, n=-1):
+        chunk = self.data[self.pos:self.pos + self.size]
+        self.pos += len(chunk)
+        return chunk
+
+
+class TestIterload:
+    def iterload(self, data, size=None, **kwargs):
+        if size is not None:
+            fp = ChunkedReader(data, size)
+        elif isinstance(data, str):
+            fp = StringIO(data)
+        else:
+            fp = BytesIO(data)
+        return list(self.json.iterload(fp, **kwargs))
+
+    def test_array(self):
+        doc = ('[1, -2.5e3, "a\\u00e9\\"", true, false, null, [], {}, '
+               '{"a": [1, {"b": null}]}, 12345678901234567890, "\\ud83d\\udc0d"]')
+        expected = self.loads(doc)
+        for size in (None, 1, 2, 3, 7, 64):
+            with self.subTest(size=size):
+                self.assertEqual(self.iterload(doc, size), expected)
+                self.assertEqual(self.iterload(doc.encode(), size), expected)
+        self.assertEqual(self.iterload(' [ ] \n'), [])
+        self.assertEqual(self.iterload('[\n1\n,\n2\n]\n', 1), [1, 2])
+
+    def test_lines(self):
+        doc = '{"a": 1}\n[2, 3]\n"4"\n5\n\n  true\n12.5'
+        expected = [{'a': 1}, [2, 3], '4', 5, True, 12.5]
+        for size in (None, 1, 2, 5):
+            with self.subTest(size=size):
+                self.assertEqual(self.iterload(doc, size, lines=True),
+                                 expected)
+                self.assertEqual(self.iterload(doc.encode(), size, lines=True),
+                                 expected)
+        self.assertEqual(self.iterload('', lines=True), [])
+        self.assertEqual(self.iterload(' \n', lines=True), [])
+
+    def test_encodings(self):
+        doc = '["é", "€", "\U0001f40d"]'
+        expected = self.loads(doc)
+        for encoding in ('utf-8', 'utf-8-sig', 'utf-16', 'utf-16-le',
+                         'utf-16-be', 'utf-32', 'utf-32-le', 'utf-32-be'):
+            with self.subTest(encoding=encoding):
+                data = doc.encode(encoding)
+                self.assertEqual(self.iterload(data), expected)
+                self.assertEqual(self.iterload(data, 1), expected)
+        self.assertEqual(self.iterload(codecs.BOM_UTF8 + b'1', lines=True),
+                         [1])
+
+    def test_large(self):
+        # Values larger than the read size span several chunks.
+        big = {'key': 'x' * 200000, 'list': list(range(50000))}
+        doc = self.dumps([big, 1, big])
+        self.assertEqual(self.iterload(doc), [big, 1, big])
+        self.assertEqual(self.iterload(doc.encode(), 1000), [big, 1, big])
+
+    def test_lazy(self):
+        fp = StringIO('[1, 2, x')
+        it = self.json.iterload(fp)
+        self.assertEqual(next(it), 1)
+        self.assertEqual(next(it), 2)
+        with self.assertRaises(self.JSONDecodeError):
+            next(it)
+
+    def test_hooks(self):
+        doc = '[{"a": 1.5, "b": 2}]'
+        self.assertEqual(self.iterload(doc, parse_float=decimal.Decimal,
+                                       object_pairs_hook=list),
+                         [[('a', decimal.Decimal('1.5')), ('b', 2)]])
+        self.assertEqual(self.iterload(doc, object_hook=len), [2])
+
+        class Decoder(self.json.JSONDecoder):
+            def raw_decode(self, s, idx=0):
+                obj, end = super().raw_decode(s, idx)
+                return ('decoded', obj), end
+        self.assertEqual(self.iterload('1 2', lines=True, cls=Decoder),
+                         [('decoded', 1), ('decoded', 2)])
+
+    def test_object_factory(self):
+        # The factories are shared by the records.
+        shapes = []
+        def object_factory(keys):
+            shapes.append(keys)
+            return namedtuple('Record', keys)
+        records = [{'id': i, 'name': str(i)} for i in range(1000)]
+        lines = ''.join(self.dumps(r) + '\n' for r in records)
+        for doc, kwargs in ((lines, {'lines': True}),
+                            (self.dumps(records), {})):
+            with self.subTest(**kwargs):
+                shapes.clear()
+                rval = self.iterload(doc, object_factory=object_factory,
+                                     **kwargs)
+                self.assertEqual(shapes, [('id', 'name')])
+                self.assertEqual([r._asdict() for r in rval], records)
+                self.assertEqual({type(r) for r in rval}, {type(rval[0])})
+
+    def test_errors(self):
+        for doc, msg, pos in [
+            ('', 'Expecting value', 0),
+            ('  ', 'Expecting value', 2),
+            ('{}', "Expecting '['", 0),
+            ('[', 'Expecting value', 1),
+            ('[1', "Expecting ',' delimiter", 2),
+            ('[1 2]', "Expecting ',' delimiter", 3),
+            ('[1,', 'Expecting value', 3),
+            ('[1,]', 'Illegal trailing comma before end of array', 2),
+            ('[1, x]', 'Expecting value', 4),
+            ('[1, "abc', 'Unterminated string starting at', 4),
+            ('[1] 2', 'Extra data', 4),
+        ]:
+            for size in (None, 1):
+                with self.subTest(doc=doc, size=size):
+                    with self.assertRaises(self.JSONDecodeError) as cm:
+                        self.iterload(doc, size)
+                    self.assertEqual(cm.exception.msg, msg)
+                    self.assertEqual(cm.exception.pos, pos)
+
+        with self.assertRaises(self.JSONDecodeError) as cm:
+            self.iterload('\ufeff[]')
+        self.assertEqual(cm.exception.msg,
+                         'Unexpected UTF-8 BOM (decode using utf-8-sig)')
+        with self.assertRaises(TypeError):
+            self.iterload([])
+
+    def test_error_not_at_end(self):
+        # A syntax error followed by more input is reported without reading
+        # the rest of the input.
+        class EndlessReader:
+            reads = 0
+            def read(self, n=-1):
+                self.reads += 1
+                if self.reads == 1:
+                    return '[{"a": 1}, {"b": x'
+                return ' ' * 1000
+        fp = EndlessReader()
+        with self.assertRaises(self.JSONDecodeError) as cm:
+            list(self.json.iterload(fp))
+        self.assertEqual(cm.exception.msg, 'Expecting value')
+        self.assertEqual(cm.exception.pos, 17)
+        self.assertLess(fp.reads, 10)
+
+        # Truncated tokens are still completed by the next chunks.
+        for doc in ('[true]', '[-Infinity]', '["\\u1234"]',
+                    '["\\ud83d\\ude00"]', '[1.5]', '{"a": 1, "b": 2}'):
+            for size in (1, 3):
+                with self.subTest(doc=doc, size=size):
+                    self.assertEqual(self.iterload(doc, size, lines=True),
+                                     [self.json.loads(doc)])
+
+    def test_error_position(self):
+        # The position of the error is relative to the whole input.
+        doc = '1\n"long line"\n{"a": 1,\n x}\n'
+        for size in (None, 1, 3, 16):
+            with self.subTest(size=size):
+                with self.assertRaises(self.JSONDecodeError) as cm:
+                    self.iterload(doc, size, lines=True)
+                err = cm.exception
+                self.assertEqual(err.pos, doc.index('x'))
+                self.assertEqual(err.lineno, 4)
+                self.assertEqual(err.colno, 2)
+                self.assertEqual(str(err), 'Expecting property name '
+                                 'enclosed in double quotes: line 4 column 2 '
+                                 '(char 24)')
+
+        with self.assertRaises(self.JSONDecodeError) as cm:
+            self.iterload('[1, 2, 3, x]', 2)
+        self.assertEqual(cm.exception.pos, 10)
+        self.assertEqual(cm.exception.colno, 11)
+
+
+class TestPyIterload(TestIterload, PyTest): pass
+class TestCIterload(TestIterload, CTest): pass
@@ -40,6 +40,7 @@
 import re
 import shutil
 import socket
+import string
 import struct
 import sys
 import tempfile
@@ -854,6 +855,46 @@ def test_can_represent_stream_with_int_name(self):
         h = logging.StreamHandler(StreamWithIntName())
         self.assertEqual(repr(h), '<StreamHandler 2 (NOTSET)>')
 
+    def test_handle_batch(self):
+        class CountingStream(io.StringIO):
+            writes = 0
+            def write(self, data):
+                self.writes += 1
+                return super().write(data)
+
+        stream = CountingStream()
+        h = logging.StreamHandler(stream)
+        h.setFormatter(logging.Formatter('%(msg)s'))
+        h.addFilter(lambda record: record.msg != 'skip')
+        records = [logging.makeLogRecord({'msg': msg})
+                   for msg in ('a', 'skip', 'b', 'c')]
+        emitted = h.handle_batch(records)
+        self.assertEqual([r.msg for r in emitted], ['a', 'b', 'c'])
+        self.assertEqual(stream.getvalue(), 'a\nb\nc\n')
+        self.assertEqual(stream.writes, 1)
+
+        # A subclass overriding emit() gets each record.
+        class MyHandler(logging.StreamHandler):
+            def emit(self, record):
+                self.stream.write(record.msg.upper())
+
+        stream = CountingStream()
+        MyHandler(stream).handle_batch(records)
+        self.assertEqual(stream.getvalue(), 'ASKIPBC')
+        self.assertEqual(stream.writes, 4)
+
+    def test_handle_batch_error_handling(self):
+        h = TestStreamHandler(BadStream())
+        records = [logging.makeLogRecord({}) for _ in range(3)]
+        h.handle_batch(records)
+        self.assertIs(h.error_record, records[-1])
+
+        h = TestStreamHandler(io.StringIO())
+        bad = logging.makeLogRecord({'msg': '%d', 'args': ('x',)})
+        h.handle_batch([records[0], bad, records[1]])
+        self.assertIs(h.error_record, bad)
+        self.assertEqual(h.stream.getvalue().count('\n'), 2)
+
 # -- The following section could be moved into a server_helper.py module
 # -- if it proves to be of wider utility than just test_logging
 
@@ -4390,6 +4431,49 @@ def test_queue_listener(self):
         self.assertTrue(handler.matches(levelno=logging.CRITICAL, message='6'))
         handler.close()
 
+    def test_queue_listener_batch(self):
+        batches = []
+        class BatchHandler(TestHandler):
+            def emit_batch(self, records):
+                batches.append(len(records))
+                super().emit_batch(records)
+
+        handler = BatchHandler(support.Matcher())
+        self.assertRaises(ValueError, logging.handlers.QueueListener,
+                          self.queue, handler, batch_size=0)
+        listener = logging.handlers.QueueListener(self.queue, handler,
+                                                  batch_size=4)
+        # Queue the records before starting the listener, so that they are
+        # drained in batches.
+        for _ in range(10):
+            self.que_logger.warning(self.next_message())
+        listener.start()
+        listener.stop()
+        self.assertEqual(batches, [4, 4, 2])
+        for i in range(1, 11):
+            self.assertTrue(handler.matches(levelno=logging.WARNING,
+                                            message=str(i)))
+        self.assertEqual(self.queue.unfinished_tasks, 0)
+        handler.close()
+
+        # Now test with respect_handler_level set
+        batches.clear()
+        handler = BatchHandler(support.Matcher())
+        handler.setLevel(logging.ERROR)
+        listener = logging.handlers.QueueListener(self.queue, handler,
+                                                  respect_handler_level=True,
+                                                  batch_size=10)
+        self.que_logger.warning(self.next_message())
+        self.que_logger.error(self.next_message())
+        self.que_logger.critical(self.next_message())
+        listener.start()
+        listener.stop()
+        self.assertEqual(batches, [2])
+        self.assertFalse(handler.matches(levelno=logging.WARNING, message='11'))
+        self.assertTrue(handler.matches(levelno=logging.ERROR, message='12'))
+        self.assertTrue(handler.matches(levelno=logging.CRITICAL, message='13'))
+        handler.close()
+
     def test_queue_listener_context_manager(self):
         handler = TestHandler(support.Matcher())
         with logging.handlers.QueueListener(self.queue, handler) as listener:
@@ -4599,6 +4683,45 @@ def test_percent(self):
         f = logging.Formatter('%(asctime)#15s')
         self.assertTrue(f.usesTime())
 
+    def test_compiled_formats(self):
+        # Formats compiled into renderers give the same output as the
+        # generic interpolation.
+        r = self.get_record('custom')
+        r.message = r.getMessage()
+        r.tuple = (1, 2)
+        values = r.__dict__
+        for fmt in ['%(name)s', '%(levelname)-8s|%(lineno)5d|%(custom)#x',
+                    '100%% %(tuple)s %(tuple)r %(created).3f',
+                    'no fields', '%(lineno)*d', '%(name)ld']:
+            style = logging.PercentStyle(fmt)
+            try:
+                expected = fmt % values
+            except Exception as exc:
+                with self.assertRaises(type(exc)):
+                    style.format(r)
+            else:
+                self.assertEqual(style.format(r), expected, fmt)
+        for fmt in ['$name', '${levelname}:$lineno 100% $$x $tuple',
+                    '$ ', 'no fields']:
+            style = logging.StringTemplateStyle(fmt)
+            try:
+                expected = string.Template(fmt).substitute(values)
+            except Exception as exc:
+                with self.assertRaises(type(exc)):
+                    style.format(r)
+            else:
+                self.assertEqual(style.format(r), expected, fmt)
+
+    def test_compiled_format_changed(self):
+        r = self.get_record()
+        f = logging.Formatter('%(name)s')
+        self.assertEqual(f.format(r), 'formatter.test')
+        self.assertFalse(f.usesTime())
+        f._style._fmt = '%(asctime)s %(lineno)d'
+        self.assertTrue(f.usesTime())
+        self.assertStartsWith(f.format(r), r.asctime)
+        self.assertEndsWith(f.format(r), ' 42')
+
     def test_braces(self):
         # Test {}-formatting
         r = self.get_record()
@@ -5317,6 +5440,32 @@ def test_dict_arg(self):
         r.removeHandler(h)
         h.close()
 
+    def test_pathname(self):
+        path = os.path.join('dir', 'module.py')
+        for _ in range(2):
+            r = logging.LogRecord('x', logging.INFO, path, 1, 'msg', (), None)
+            self.assertEqual(r.filename, 'module.py')
+            self.assertEqual(r.module, 'module')
+        for path in (None, ['dir', 'module.py']):
+            r = logging.LogRecord('x', logging.INFO, path, 1, 'msg', (), None)
+            self.assertIs(r.filename, path)
+            self.assertEqual(r.module, 'Unknown module')
+
+    def test_caller(self):
+        h = RecordingHandler()
+        logger = logging.getLogger('test_caller')
+        logger.addHandler(h)
+        self.addCleanup(logger.removeHandler, h)
+        def log():
+            logger.error('msg')
+        for _ in range(2):
+            log()
+        lineno = log.__code__.co_firstlineno + 1
+        for r in h.records:
+            self.assertEqual(r.pathname, __file__)
+            self.assertEqual(r.funcName, 'log')
+            self.assertEqual(r.lineno, lineno)
+
     @staticmethod # pickled as target of child process in the following test
     def _extract_logrecord_process_name(key, logMultiprocessing, conn=None):
         prev_logMultiprocessing = logging.logMultiprocessing
@@ -6328,6 +6477,16 @@ def test_delay(self):
         self.assertTrue(os.path.exists(self.fn))
         fh.close()
 
+    def test_handle_batch_delay(self):
+        os.unlink(self.fn)
+        fh = logging.FileHandler(self.fn, encoding='utf-8', delay=True)
+        fh.setFormatter(logging.Formatter('%(message)s'))
+        fh.handle_batch([self.next_rec(), self.next_rec()])
+        self.assertIsNotNone(fh.stream)
+        fh.close()
+        with open(self.fn, encoding='utf-8') as fp:
+            self.assertEqual(fp.read(), '1\n2\n')
+
     def test_emit_after_closing_in_write_mode(self):
         # Issue #42378
         os.unlink(self.fn)
@@ -891,6 +891,142 @@ def test_extractall_hardlink_on_symlink(self):
                 self._assert_on_file_content(target_filepath, sha256sum(b"target"))
                 self._assert_on_file_content(hardlink_filepath, sha256_regtype)
 
+    def test_index(self):
+        index = io.BytesIO()
+        with tarfile.open(self.tarname, mode=self.mode,
+                          encoding="iso8859-1") as tar:
+            tar.save_index(index)
+            expected = tar.getmembers()
+        index.seek(0)
+        with tarfile.open(self.tarname, mode=self.mode,
+                          encoding="iso8859-1") as tar:
+            tar.load_index(index)
+            self.assertTrue(tar._loaded)
+            members = tar.getmembers()
+            self.assertEqual([m.get_info() for m in members],
+                             [m.get_info() for m in expected])
+            self.assertEqual([(m.offset, m.offset_data, m.sparse)
+                              for m in members],
+                             [(m.offset, m.offset_data, m.sparse)
+                              for m in expected])
+            with tar.extractfile("ustar/regtype") as fobj:
+                self.assertEqual(sha256sum(fobj.read()), sha256_regtype)
+            with tar.extractfile("gnu/sparse") as fobj:
+                self.assertEqual(sha256sum(fobj.read()), sha256_sparse)
+
+    def test_index_file(self):
+        indexname = os.path.join(TEMPDIR, "index.json")
+        self.addCleanup(os_helper.unlink, indexname)
+        with tarfile.open(self.tarname, mode=self.mode,
+                          encoding="iso8859-1") as tar:
+            tar.save_index(indexname)
+            expected = tar.getnames()
+        with tarfile.open(self.tarname, mode=self.mode,
+                          encoding="iso8859-1") as tar:
+            tar.load_index(indexname)
+            self.assertEqual(tar.getnames(), expected)
+
+    def test_index_mismatch(self):
+        index = io.BytesIO()
+        with tarfile.open(self.tarname, mode=self.mode,
+                          encoding="iso8859-1") as tar:
+            tar.save_index(index)
+        data = index.getvalue()
+        with tarfile.open(self.tarname, mode=self.mode,
+                          encoding="iso8859-1") as tar:
+            # The last header has moved.
+            corrupted = data.replace(b'"misc/eof"', b'"misc/EOF"')
+            self.assertNotEqual(corrupted, data)
+            with self.assertRaisesRegex(ValueError, "does not match"):
+                tar.load_index(io.BytesIO(corrupted))
+            for invalid in (b'', b'[]', b'{"version": 1}',
+                            b'{"version": 99, "end": 0, "members": []}',
+                            b'{"version": 1, "end": 0, "members": [[1]]}'):
+                with self.subTest(invalid=invalid):
+                    with self.assertRaisesRegex(ValueError,
+                                                "invalid tar index"):
+                        tar.load_index(io.BytesIO(invalid))
+            self.assertFalse(tar._loaded)
+            # The archive is still usable.
+            self.assertIn("misc/eof", tar.getnames())
+
+    def _tree(self, root):
+        result = {}
+        for dirpath, dirnames, filenames in os.walk(root):
+            for name in dirnames + filenames:
+                path = os.path.join(dirpath, name)
+                st = os.lstat(path)
+                if os.path.islink(path):
+                    result[path] = (st.st_mode, os.readlink(path))
+                elif os.path.isfile(path):
+                    with open(path, "rb") as fobj:
+                        data = fobj.read()
+                    result[path] = (st.st_mode, st.st_mtime, data)
+                else:
+                    result[path] = (st.st_mode,)
+        return {os.path.relpath(path, root): value
+                for path, value in result.items()}
+
+    @os_helper.skip_unless_working_chmod
+    def test_extractall_threads(self):
+        with os_helper.temp_dir() as DIR:
+            trees = []
+            for threads in 1, 4:
+                path = os.path.join(DIR, str(threads))
+                with tarfile.open(self.tarname, mode=self.mode,
+                                  encoding="iso8859-1") as tar:
+                    tar.errorlevel = 0
+                    tar.extractall(path, filter="data", threads=threads)
+                trees.append(self._tree(path))
+            self.assertIn("ustar/regtype", trees[0])
+            self.assertEqual(trees[1], trees[0])
+
+    def _extractall_aliases(self, names, setup=None):
+        # Extract regular files with the given names and distinct
+        # contents sequentially and in parallel; return both trees.
+        tarpath = os.path.join(TEMPDIR, "aliases.tar")
+        with tarfile.open(tarpath, "w") as tar:
+            for i, name in enumerate(names):
+                data = str(i % 10).encode() * (i + 1) * 10000
+                t = tarfile.TarInfo(name)
+                t.size = len(data)
+                tar.addfile(t, io.BytesIO(data))
+        self.addCleanup(os_helper.unlink, tarpath)
+        trees = []
+        with os_helper.temp_dir() as DIR:
+            for threads in 1, 4:
+                path = os.path.join(DIR, str(threads))
+                os.mkdir(path)
+                if setup is not None:
+                    setup(path)
+                with tarfile.open(tarpath) as tar:
+                    tar.extractall(path, filter="fully_trusted",
+                                   threads=threads)
+                trees.append(self._tree(path))
+        return trees
+
+    def test_extractall_threads_dotdot(self):
+        names = ["a/x"] + ["a/../b", "b"] * 8
+        trees = self._extractall_aliases(names)
+        self.assertEqual(trees[0]["b"][2], b"6" * 170000)
+        self.assertEqual(trees[1], trees[0])
+
+    @os_helper.skip_unless_symlink
+    def test_extractall_threads_symlinked_dir(self):
+        def setup(path):
+            os.mkdir(os.path.join(path, "real"))
+            os.symlink("real", os.path.join(path, "link"))
+        names = ["real/f", "link/f"] * 8
+        trees = self._extractall_aliases(names, setup)
+        self.assertEqual(trees[0][os.path.join("real", "f")][2],
+                         b"5" * 160000)
+        self.assertEqual(trees[1], trees[0])
+
+    def test_extractall_threads_invalid(self):
+        with tarfile.open(self.tarname, mode=self.mode) as tar:
+            with self.assertRaises(ValueError):
+                tar.extractall(TEMPDIR, filter="data", threads=0)
+
 
 class MiscReadTest(MiscReadTestBase, unittest.TestCase):
     test_fail_comp = None
@@ -942,6 +1078,23 @@ def test_provoke_stream_error(self):
         with self.tar.extractfile(tarinfos[0]) as f: # read the first member
             self.assertRaises(tarfile.StreamError, f.read)
 
+    def test_index(self):
+        # An index can be saved from a stream, but only loaded into a
+        # seekable archive.
+        index = io.BytesIO()
+        self.tar.save_index(index)
+        expected = self.tar.getnames()
+        self.assertRaises(tarfile.StreamError,
+                          self.tar.load_index, io.BytesIO(index.getvalue()))
+        index.seek(0)
+        with tarfile.open(tarname, encoding="iso8859-1") as tar:
+            tar.load_index(index)
+            self.assertEqual(tar.getnames(), expected)
+
+        with tarfile.open(self.tarname, mode=self.mode, stream=True) as tar:
+            self.assertRaises(tarfile.StreamError, tar.save_index, index)
+            self.assertRaises(tarfile.StreamError, tar.load_index, index)
+
     def test_compare_members(self):
         tar1 = tarfile.open(tarname, encoding="iso8859-1")
         try:
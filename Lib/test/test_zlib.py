@@ -1216,6 +1216,42 @@ def test_refleaks_in___init__(self):
             zlibd.__init__()
         self.assertAlmostEqual(gettotalrefcount() - refs_before, 0, delta=10)
 
+    def test_decompress_block(self):
+        words = self.TEXT.split()
+        rng = random.Random(0)
+        text = b' '.join(rng.choice(words) for i in range(50000))
+        data = zlib.compress(text, wbits=-zlib.MAX_WBITS)
+        zlibd = zlib._ZlibDecompressor(wbits=-zlib.MAX_WBITS)
+        out = b''
+        boundaries = []
+        for i in range(0, len(data), 100):
+            chunk = data[i:i + 100]
+            while True:
+                output, total_in, bits = zlibd._decompress_block(chunk)
+                out += output
+                if bits >= 0:
+                    boundaries.append((len(out), total_in, bits))
+                if zlibd.eof or zlibd.needs_input:
+                    break
+                chunk = b''
+        self.assertTrue(zlibd.eof)
+        self.assertEqual(out, text)
+        self.assertEqual(total_in, len(data))
+        self.assertGreaterEqual(len(boundaries), 2)
+        self.assertRaises(EOFError, zlibd._decompress_block, b'')
+
+        # Resume from every block boundary.
+        for offset, in_offset, bits in boundaries:
+            with self.subTest(offset=offset):
+                zlibd = zlib._ZlibDecompressor(wbits=-zlib.MAX_WBITS,
+                                               zdict=text[:offset][-32768:])
+                if bits:
+                    zlibd._prime(bits, data[in_offset - 1] >> (8 - bits))
+                self.assertEqual(zlibd.decompress(data[in_offset:]),
+                                 text[offset:])
+        self.assertRaises(ValueError, zlibd._prime, 17, 0)
+        self.assertRaises(EOFError, zlibd._prime, 0, 0)
+
 
 class CustomInt:
     def __index__(self):
@@ -35,6 +35,7 @@
     DecompressionParameter,
     Strategy,
     ZstdFile,
+    ZstdPool,
 )
 
 _1K = 1024
@@ -302,6 +303,14 @@ def test_compress_parameters(self):
                 ZstdCompressor(options={CompressionParameter.job_size:4})
             with self.assertRaises(ValueError):
                 ZstdCompressor(options={CompressionParameter.overlap_log:4})
+            with self.assertRaises(ValueError):
+                compress(b'', threads=4)
+            with self.assertRaises(ValueError):
+                ZstdFile(io.BytesIO(), 'w', threads=4)
+
+        with self.assertRaises(ValueError):
+            compress(b'', threads=0)
+        self.assertEqual(decompress(compress(b'abc', threads=1)), b'abc')
 
         # out of bounds error msg
         option = {CompressionParameter.window_log:100}
@@ -346,6 +355,18 @@ def test_zstd_multithread_compress(self):
         with ZstdFile(io.BytesIO(), 'w', options=options) as f:
             f.write(b)
 
+        # threads
+        options = {CompressionParameter.job_size: _1M,
+                   CompressionParameter.enable_long_distance_matching: 1}
+        dat1 = compress(b, threads=2, options=options)
+        self.assertEqual(decompress(dat1), b)
+        self.assertNotIn(CompressionParameter.nb_workers, options)
+        bio = io.BytesIO()
+        with ZstdFile(bio, 'w', level=4, threads=2) as f:
+            for i in range(0, len(b), 3*_1M):
+                f.write(b[i:i + 3*_1M])
+        self.assertEqual(decompress(bio.getvalue()), b)
+
     def test_compress_flushblock(self):
         point = len(THIS_FILE_BYTES) // 2
 
@@ -1548,6 +1569,60 @@ def test_len(self):
         self.assertEqual(len(TRAINED_DICT), len(TRAINED_DICT.dict_content))
         self.assertIn(str(len(TRAINED_DICT)), str(TRAINED_DICT))
 
+
+class ZstdPoolTestCase(unittest.TestCase):
+    def test_roundtrip(self):
+        pool = ZstdPool(TRAINED_DICT, level=5)
+        for sample in SAMPLES[:20]:
+            frame = pool.compress(sample)
+            self.assertEqual(get_frame_info(frame).dictionary_id,
+                             TRAINED_DICT.dict_id)
+            self.assertEqual(pool.decompress(frame), sample)
+            self.assertEqual(decompress(frame, TRAINED_DICT), sample)
+        # The compressor is reused for every frame.
+        self.assertEqual(len(pool._compressors), 1)
+        frames = [pool.compress(sample) for sample in SAMPLES[:5]]
+        self.assertEqual(pool.decompress(b''.join(frames)),
+                         b''.join(SAMPLES[:5]))
+
+    def test_no_dict(self):
+        pool = ZstdPool(options={CompressionParameter.checksum_flag: 1})
+        frame = pool.compress(THIS_FILE_BYTES)
+        self.assertEqual(pool.decompress(frame), THIS_FILE_BYTES)
+        self.assertEqual(pool.decompress(pool.compress(b'')), b'')
+
+    def test_bad_args(self):
+        with self.assertRaises(TypeError):
+            ZstdPool(b'dict')
+        with self.assertRaises(TypeError):
+            ZstdPool(level=3, options={})
+        with self.assertRaises(ValueError):
+            ZstdPool(options={CompressionParameter.window_log: 100})
+        with self.assertRaises(TypeError):
+            ZstdPool().compress(1)
+
+    def test_maxsize(self):
+        pool = ZstdPool(TRAINED_DICT, maxsize=0)
+        self.assertEqual(pool.decompress(pool.compress(SAMPLES[0])),
+                         SAMPLES[0])
+        self.assertEqual(pool._compressors, [])
+
+    @threading_helper.reap_threads
+    @threading_helper.requires_working_threading()
+    def test_threads(self):
+        pool = ZstdPool(TRAINED_DICT, maxsize=4)
+        results = []
+        def run(samples):
+            for sample in samples:
+                frame = pool.compress(sample)
+                results.append(pool.decompress(frame) == sample)
+        threads = [threading.Thread(target=run, args=(SAMPLES[i::8],))
+                   for i in range(8)]
+        with threading_helper.start_threads(threads):
+            pass
+        self.assertEqual(len(results), len(SAMPLES))
+        self.assertTrue(all(results))
+
 class FileTestCase(unittest.TestCase):
     def setUp(self):
         self.DECOMPRESSED_42 = b'a'*42
@@ -1576,6 +1651,8 @@ def test_init(self):
             pass
         with ZstdFile(io.BytesIO(), "r", options={}, zstd_dict=TRAINED_DICT) as f:
             pass
+        with ZstdFile(io.BytesIO(), "w", threads=1) as f:
+            pass
 
     def test_init_with_PathLike_filename(self):
         with tempfile.NamedTemporaryFile(delete=False) as tmp_f:
@@ -1681,6 +1758,10 @@ def test_init_bad_check(self):
 
         with self.assertRaises(TypeError):
             ZstdFile(io.BytesIO(COMPRESSED_100_PLUS_32KB), "r", options=33)
+        with self.assertRaises(TypeError):
+            ZstdFile(io.BytesIO(COMPRESSED_100_PLUS_32KB), "r", threads=2)
+        with self.assertRaises(ValueError):
+            ZstdFile(io.BytesIO(), "w", threads=0)
 
         with self.assertRaises(OverflowError):
             ZstdFile(io.BytesIO(COMPRESSED_100_PLUS_32KB),
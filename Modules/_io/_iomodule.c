@@ -208,7 +208,7 @@ _io_open_impl(PyObject *module, PyObject *file, const char *mode,
     int text = 0, binary = 0;
 
     char rawmode[6], *m;
-    int line_buffering, is_number, isatty = 0;
+    int line_buffering, is_number, isatty = 0, default_buffering = 0;
 
     PyObject *raw, *modeobj = NULL, *buffer, *wrapper, *result = NULL, *path_or_fd = NULL;
 
@@ -372,6 +372,7 @@ _io_open_impl(PyObject *module, PyObject *file, const char *mode,
         if (buffering == -1 && PyErr_Occurred())
             goto error;
         buffering = Py_MAX(Py_MIN(buffering, 8192 * 1024), DEFAULT_BUFFER_SIZE);
+        default_buffering = 1;
     }
     if (buffering < 0) {
         PyErr_SetString(PyExc_ValueError,
@@ -411,6 +412,11 @@ _io_open_impl(PyObject *module, PyObject *file, const char *mode,
         }
 
         buffer = PyObject_CallFunction(Buffered_class, "Oi", raw, buffering);
+        if (buffer != NULL && default_buffering &&
+            Buffered_class == (PyObject *)state->PyBufferedReader_Type)
+        {
+            _PyBufferedReader_allow_growth(buffer);
+        }
     }
     if (buffer == NULL)
         goto error;
@@ -51,6 +51,9 @@ extern int _PyIOBase_finalize(PyObject *self);
    Doesn't check the argument type, so be careful! */
 extern int _PyFileIO_closed(PyObject *self);
 
+/* Let the buffer of a BufferedReader grow on sequential reads. */
+extern void _PyBufferedReader_allow_growth(PyObject *self);
+
 /* Shortcut to the core of the IncrementalNewlineDecoder.decode method */
 extern PyObject *_PyIncrementalNewlineDecoder_decode(
     PyObject *self, PyObject *input, int final);
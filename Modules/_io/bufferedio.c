@@ -234,6 +234,11 @@ typedef struct {
        class) *and* the raw stream is a vanilla FileIO object. */
     int fast_closed_checks;
 
+    /* True if the buffer of a BufferedReader may grow when the raw stream
+       is read sequentially.  Only set by open() with the default buffering
+       policy, so that an explicit buffer size is never exceeded. */
+    char grow;
+
     /* Absolute position inside the raw stream (-1 if unknown). */
     Py_off_t abs_pos;
 
@@ -260,6 +265,10 @@ typedef struct {
     Py_ssize_t buffer_size;
     Py_ssize_t buffer_mask;
 
+    /* Absolute position of the raw stream after the last read which filled
+       the whole buffer (-1 if unknown). */
+    Py_off_t fill_end;
+
     PyObject *dict;
     PyObject *weakreflist;
 } buffered;
@@ -405,6 +414,10 @@ _enter_buffered_busy(buffered *self)
 #define RAW_TELL(self) \
     (self->abs_pos != -1 ? self->abs_pos : _buffered_raw_tell(self))
 
+/* Maximum size to which the buffer of a BufferedReader grows when reading
+   a file sequentially. */
+#define MAX_SEQUENTIAL_BUFFER_SIZE (1024 * 1024)
+
 #define MINUS_LAST_BLOCK(self, size) \
     (self->buffer_mask ? \
         (size & ~self->buffer_mask) : \
@@ -866,6 +879,7 @@ _buffered_init(buffered *self)
         self->buffer_mask = self->buffer_size - 1;
     else
         self->buffer_mask = 0;
+    self->fill_end = -1;
     if (_buffered_raw_tell(self) == -1)
         PyErr_Clear();
     return 0;
@@ -1611,6 +1625,7 @@ _io_BufferedReader___init___impl(buffered *self, PyObject *raw,
         Py_IS_TYPE(self, state->PyBufferedReader_Type) &&
         Py_IS_TYPE(raw, state->PyFileIO_Type)
     );
+    self->grow = 0;
 
     self->ok = 1;
     return 0;
@@ -1666,6 +1681,40 @@ _bufferedreader_raw_read(buffered *self, char *start, Py_ssize_t len)
     return n;
 }
 
+/* Let the buffer of a BufferedReader grow when it reads a FileIO object
+   sequentially.  Called by open() when the buffer size is not given. */
+void
+_PyBufferedReader_allow_growth(PyObject *self)
+{
+    buffered *b = buffered_CAST(self);
+    b->grow = (char)b->fast_closed_checks;
+}
+
+/* Double the size of the empty buffer of a BufferedReader reading a FileIO
+   object if the previous read filled the whole buffer and was followed by
+   no seek, so that large files read sequentially are read in larger
+   chunks. */
+static void
+_bufferedreader_grow_buffer(buffered *self)
+{
+    if (!self->grow || self->abs_pos == -1 || self->abs_pos != self->fill_end
+        || self->buffer_size >= MAX_SEQUENTIAL_BUFFER_SIZE)
+    {
+        return;
+    }
+    Py_ssize_t size = Py_MIN(self->buffer_size * 2,
+                             MAX_SEQUENTIAL_BUFFER_SIZE);
+    char *buffer = PyMem_Malloc(size);
+    if (buffer == NULL) {
+        /* Keep reading with the current buffer. */
+        return;
+    }
+    PyMem_Free(self->buffer);
+    self->buffer = buffer;
+    self->buffer_size = size;
+    self->buffer_mask = (size & (size - 1)) == 0 ? size - 1 : 0;
+}
+
 static Py_ssize_t
 _bufferedreader_fill_buffer(buffered *self)
 {
@@ -1674,12 +1723,15 @@ _bufferedreader_fill_buffer(buffered *self)
         start = Py_SAFE_DOWNCAST(self->read_end, Py_off_t, Py_ssize_t);
     else
         start = 0;
+    if (start == 0)
+        _bufferedreader_grow_buffer(self);
     len = self->buffer_size - start;
     n = _bufferedreader_raw_read(self, self->buffer + start, len);
     if (n <= 0)
         return n;
     self->read_end = start + n;
     self->raw_pos = start + n;
+    self->fill_end = (start + n == self->buffer_size) ? self->abs_pos : -1;
     return n;
 }
 
@@ -2231,6 +2283,186 @@ _io_BufferedWriter_write_impl(buffered *self, Py_buffer *buffer)
 }
 
 
+/* Maximum number of lines passed at once to FileIO.writelines() */
+#define WRITELINES_BATCH_SIZE 1024
+
+/* Write the bytes-like objects of list with FileIO.writelines(), after
+   flushing the buffer, if they do not fit in the buffer.  Return 1 if they
+   were written, 0 if they should be buffered, or -1 on error. */
+static int
+_bufferedwriter_write_vectored(buffered *self, PyObject *list)
+{
+    Py_ssize_t total = 0, avail;
+    Py_off_t offset;
+    PyObject *res;
+    int r;
+
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(list); i++) {
+        Py_buffer buf;
+        if (PyObject_GetBuffer(PyList_GET_ITEM(list, i), &buf,
+                               PyBUF_SIMPLE) < 0) {
+            return -1;
+        }
+        total += buf.len;
+        PyBuffer_Release(&buf);
+    }
+
+    if (!ENTER_BUFFERED(self))
+        return -1;
+
+    r = IS_CLOSED(self);
+    if (r < 0) {
+        goto error;
+    }
+    if (r > 0) {
+        PyErr_SetString(PyExc_ValueError, "write to closed file");
+        goto error;
+    }
+
+    /* Same condition as the fast path of write() */
+    if (!VALID_READ_BUFFER(self) && !VALID_WRITE_BUFFER(self)) {
+        self->pos = 0;
+        self->raw_pos = 0;
+    }
+    avail = Py_SAFE_DOWNCAST(self->buffer_size - self->pos, Py_off_t, Py_ssize_t);
+    if (total <= avail && total < self->buffer_size) {
+        LEAVE_BUFFERED(self)
+        return 0;
+    }
+
+    res = _bufferedwriter_flush_unlocked(self);
+    if (res == NULL) {
+        if (_buffered_check_blocking_error() != NULL) {
+            /* None of the data was written */
+            errno = EAGAIN;
+            _set_BlockingIOError("write could not complete without blocking",
+                                 0);
+        }
+        goto error;
+    }
+    Py_DECREF(res);
+
+    /* See write() */
+    offset = RAW_OFFSET(self);
+    if (offset != 0) {
+        if (_buffered_raw_seek(self, -offset, 1) < 0)
+            goto error;
+        self->raw_pos -= offset;
+    }
+    if (self->readable)
+        _bufferedreader_reset_buf(self);
+    _bufferedwriter_reset_buf(self);
+    ADJUST_POSITION(self, 0);
+    self->raw_pos = 0;
+
+    res = PyObject_CallMethodOneArg(self->raw, &_Py_ID(writelines), list);
+    if (res == NULL) {
+        /* The data may have been partially written. */
+        self->abs_pos = -1;
+        goto error;
+    }
+    Py_DECREF(res);
+    if (self->abs_pos != -1)
+        self->abs_pos += total;
+    LEAVE_BUFFERED(self)
+    return 1;
+
+error:
+    LEAVE_BUFFERED(self)
+    return -1;
+}
+
+/*[clinic input]
+@critical_section
+_io.BufferedWriter.writelines
+    lines: object
+    /
+
+Write an iterable of bytes-like objects to the stream.
+
+If the data does not fit in the buffer and the raw stream is a FileIO,
+the buffer is flushed and the data is written with the vectored
+FileIO.writelines() instead of being copied into the buffer.
+[clinic start generated code]*/
+
+/* Write the lines of list, with a vectored write if possible. */
+static int
+_bufferedwriter_writelines_batch(buffered *self, PyObject *list)
+{
+    /* Only for vanilla objects: write() may be overridden otherwise. */
+    if (self->fast_closed_checks) {
+        int r = _bufferedwriter_write_vectored(self, list);
+        if (r != 0) {
+            return r < 0 ? -1 : 0;
+        }
+    }
+
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(list); i++) {
+        PyObject *res = PyObject_CallMethodOneArg(
+            (PyObject *)self, &_Py_ID(write), PyList_GET_ITEM(list, i));
+        if (res == NULL) {
+            return -1;
+        }
+        Py_DECREF(res);
+    }
+    return 0;
+}
+
+static PyObject *
+_io_BufferedWriter_writelines_impl(buffered *self, PyObject *lines)
+/*[clinic end generated code: output=ad04a1f1c074be75 input=8d5604adbdfed4e2]*/
+{
+    PyObject *iter, *list, *line, *exc;
+    int r;
+
+    CHECK_INITIALIZED(self)
+
+    iter = PyObject_GetIter(lines);
+    if (iter == NULL)
+        return NULL;
+    list = PyList_New(0);
+    if (list == NULL) {
+        Py_DECREF(iter);
+        return NULL;
+    }
+
+    /* The lines are consumed lazily, in batches. */
+    while ((line = PyIter_Next(iter)) != NULL) {
+        r = PyList_Append(list, line);
+        Py_DECREF(line);
+        if (r < 0)
+            break;
+        if (PyList_GET_SIZE(list) == WRITELINES_BATCH_SIZE) {
+            r = _bufferedwriter_writelines_batch(self, list);
+            Py_SETREF(list, PyList_New(0));
+            if (r < 0 || list == NULL)
+                goto error;
+        }
+    }
+
+    /* Write the lines already consumed, even if the iteration failed. */
+    exc = PyErr_GetRaisedException();
+    if ((exc == NULL || PyList_GET_SIZE(list) > 0) &&
+        _bufferedwriter_writelines_batch(self, list) < 0)
+    {
+        _PyErr_ChainExceptions1(exc);
+        goto error;
+    }
+    if (exc != NULL) {
+        PyErr_SetRaisedException(exc);
+        goto error;
+    }
+    Py_DECREF(list);
+    Py_DECREF(iter);
+    Py_RETURN_NONE;
+
+error:
+    Py_XDECREF(list);
+    Py_DECREF(iter);
+    return NULL;
+}
+
+
 /*
  * BufferedRWPair
  */
@@ -2619,6 +2851,7 @@ static PyMethodDef bufferedwriter_methods[] = {
     _IO__BUFFERED__DEALLOC_WARN_METHODDEF
 
     _IO_BUFFEREDWRITER_WRITE_METHODDEF
+    _IO_BUFFEREDWRITER_WRITELINES_METHODDEF
     _IO__BUFFERED_TRUNCATE_METHODDEF
     _IO__BUFFERED_FLUSH_METHODDEF
     _IO__BUFFERED_SEEK_METHODDEF
@@ -2740,6 +2973,7 @@ static PyMethodDef bufferedrandom_methods[] = {
     _IO__BUFFERED_READLINE_METHODDEF
     _IO__BUFFERED_PEEK_METHODDEF
     _IO_BUFFEREDWRITER_WRITE_METHODDEF
+    _IO_BUFFEREDWRITER_WRITELINES_METHODDEF
     _IO__BUFFERED___SIZEOF___METHODDEF
 
     {"__getstate__", _PyIOBase_cannot_pickle, METH_NOARGS},
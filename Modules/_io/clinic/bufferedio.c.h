@@ -1127,6 +1127,34 @@ exit:
     return return_value;
 }
 
+PyDoc_STRVAR(_io_BufferedWriter_writelines__doc__,
+"writelines($self, lines, /)\n"
+"--\n"
+"\n"
+"Write an iterable of bytes-like objects to the stream.\n"
+"\n"
+"If the data does not fit in the buffer and the raw stream is a FileIO,\n"
+"the buffer is flushed and the data is written with the vectored\n"
+"FileIO.writelines() instead of being copied into the buffer.");
+
+#define _IO_BUFFEREDWRITER_WRITELINES_METHODDEF    \
+    {"writelines", (PyCFunction)_io_BufferedWriter_writelines, METH_O, _io_BufferedWriter_writelines__doc__},
+
+static PyObject *
+_io_BufferedWriter_writelines_impl(buffered *self, PyObject *lines);
+
+static PyObject *
+_io_BufferedWriter_writelines(PyObject *self, PyObject *lines)
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _io_BufferedWriter_writelines_impl((buffered *)self, lines);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
 PyDoc_STRVAR(_io_BufferedRWPair___init____doc__,
 "BufferedRWPair(reader, writer, buffer_size=DEFAULT_BUFFER_SIZE, /)\n"
 "--\n"
@@ -1265,4 +1293,4 @@ skip_optional_pos:
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=3ee17211d2010462 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=8bc798dd463644ca input=a9049054013a1b77]*/
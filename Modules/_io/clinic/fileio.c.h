@@ -406,6 +406,55 @@ exit:
     return return_value;
 }
 
+PyDoc_STRVAR(_io_FileIO_writelines__doc__,
+"writelines($self, lines, /)\n"
+"--\n"
+"\n"
+"Write an iterable of bytes-like objects to the file.\n"
+"\n"
+"All the data is written, with as few writev() system calls as possible\n"
+"where available.  In non-blocking mode, BlockingIOError is raised if the\n"
+"write would block, with the number of bytes written in its\n"
+"characters_written attribute.");
+
+#define _IO_FILEIO_WRITELINES_METHODDEF    \
+    {"writelines", _PyCFunction_CAST(_io_FileIO_writelines), METH_METHOD|METH_FASTCALL|METH_KEYWORDS, _io_FileIO_writelines__doc__},
+
+static PyObject *
+_io_FileIO_writelines_impl(fileio *self, PyTypeObject *cls, PyObject *lines);
+
+static PyObject *
+_io_FileIO_writelines(PyObject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+    #  define KWTUPLE (PyObject *)&_Py_SINGLETON(tuple_empty)
+    #else
+    #  define KWTUPLE NULL
+    #endif
+
+    static const char * const _keywords[] = {"", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "writelines",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    PyObject *lines;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 1, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    lines = args[0];
+    return_value = _io_FileIO_writelines_impl((fileio *)self, cls, lines);
+
+exit:
+    return return_value;
+}
+
 PyDoc_STRVAR(_io_FileIO_seek__doc__,
 "seek($self, pos, whence=0, /)\n"
 "--\n"
@@ -471,6 +520,63 @@ _io_FileIO_tell(PyObject *self, PyObject *Py_UNUSED(ignored))
     return _io_FileIO_tell_impl((fileio *)self);
 }
 
+PyDoc_STRVAR(_io_FileIO_advise__doc__,
+"advise($self, advice, offset=0, length=0, /)\n"
+"--\n"
+"\n"
+"Announce how the file will be accessed.\n"
+"\n"
+"advice is one of \'normal\', \'sequential\', \'random\', \'willneed\',\n"
+"\'dontneed\' or \'noreuse\'.  It applies to length bytes starting at\n"
+"offset, or up to the end of the file if length is 0.  This is only a\n"
+"hint: it does nothing on platforms without posix_fadvise().");
+
+#define _IO_FILEIO_ADVISE_METHODDEF    \
+    {"advise", _PyCFunction_CAST(_io_FileIO_advise), METH_FASTCALL, _io_FileIO_advise__doc__},
+
+static PyObject *
+_io_FileIO_advise_impl(fileio *self, const char *advice, PyObject *offsetobj,
+                       PyObject *lengthobj);
+
+static PyObject *
+_io_FileIO_advise(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    const char *advice;
+    PyObject *offsetobj = NULL;
+    PyObject *lengthobj = NULL;
+
+    if (!_PyArg_CheckPositional("advise", nargs, 1, 3)) {
+        goto exit;
+    }
+    if (!PyUnicode_Check(args[0])) {
+        _PyArg_BadArgument("advise", "argument 1", "str", args[0]);
+        goto exit;
+    }
+    Py_ssize_t advice_length;
+    advice = PyUnicode_AsUTF8AndSize(args[0], &advice_length);
+    if (advice == NULL) {
+        goto exit;
+    }
+    if (strlen(advice) != (size_t)advice_length) {
+        PyErr_SetString(PyExc_ValueError, "embedded null character");
+        goto exit;
+    }
+    if (nargs < 2) {
+        goto skip_optional;
+    }
+    offsetobj = args[1];
+    if (nargs < 3) {
+        goto skip_optional;
+    }
+    lengthobj = args[2];
+skip_optional:
+    return_value = _io_FileIO_advise_impl((fileio *)self, advice, offsetobj, lengthobj);
+
+exit:
+    return return_value;
+}
+
 #if defined(HAVE_FTRUNCATE)
 
 PyDoc_STRVAR(_io_FileIO_truncate__doc__,
@@ -547,4 +653,4 @@ _io_FileIO_isatty(PyObject *self, PyObject *Py_UNUSED(ignored))
 #ifndef _IO_FILEIO_TRUNCATE_METHODDEF
     #define _IO_FILEIO_TRUNCATE_METHODDEF
 #endif /* !defined(_IO_FILEIO_TRUNCATE_METHODDEF) */
-/*[clinic end generated code: output=2e48f3df2f189170 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=ecd00084bcf0b494 input=a9049054013a1b77]*/
@@ -19,6 +19,10 @@
 #ifdef HAVE_FCNTL_H
 #  include <fcntl.h>              // open()
 #endif
+#ifdef HAVE_SYS_UIO_H
+#  include <sys/uio.h>            // writev()
+#endif
+#include <limits.h>               // IOV_MAX
 
 #include "_iomodule.h"
 
@@ -56,6 +60,20 @@
    avoid excessive memory allocation */
 #define LARGE_BUFFER_CUTOFF_SIZE 65536
 
+#ifdef HAVE_WRITEV
+#  ifndef IOV_MAX
+#    define IOV_MAX 16
+#  endif
+typedef struct iovec fileio_iovec;
+#  define FILEIO_WRITELINES_BATCH IOV_MAX
+#else
+#  define FILEIO_WRITELINES_BATCH 16
+typedef struct {
+    void *iov_base;
+    size_t iov_len;
+} fileio_iovec;
+#endif
+
 /*[clinic input]
 module _io
 class _io.FileIO "fileio *" "clinic_state()->PyFileIO_Type"
@@ -949,6 +967,167 @@ _io_FileIO_write_impl(fileio *self, PyTypeObject *cls, Py_buffer *b)
     return PyLong_FromSsize_t(n);
 }
 
+/* Write the buffers iov[0:cnt], or only a prefix of them.  Return the number
+   of bytes written, or set an exception and return -1 with errno set. */
+static Py_ssize_t
+fileio_writev(int fd, fileio_iovec *iov, Py_ssize_t cnt)
+{
+#ifdef HAVE_WRITEV
+    Py_ssize_t n;
+    int async_err = 0;
+
+    cnt = Py_MIN(cnt, IOV_MAX);
+    do {
+        Py_BEGIN_ALLOW_THREADS
+        errno = 0;
+        n = writev(fd, iov, (int)cnt);
+        Py_END_ALLOW_THREADS
+    } while (n < 0 && errno == EINTR && !(async_err = PyErr_CheckSignals()));
+    if (n < 0 && !async_err) {
+        int err = errno;
+        PyErr_SetFromErrno(PyExc_OSError);
+        errno = err;
+    }
+    return n;
+#else
+    return _Py_write(fd, iov->iov_base, iov->iov_len);
+#endif
+}
+
+/*[clinic input]
+_io.FileIO.writelines
+    cls: defining_class
+    lines: object
+    /
+
+Write an iterable of bytes-like objects to the file.
+
+All the data is written, with as few writev() system calls as possible
+where available.  In non-blocking mode, BlockingIOError is raised if the
+write would block, with the number of bytes written in its
+characters_written attribute.
+[clinic start generated code]*/
+
+/* Write all the buffers iov[0:cnt], adding the number of bytes written to
+   *written.  Return 0, or set an exception and return -1. */
+static int
+fileio_writev_all(fileio *self, fileio_iovec *iov, Py_ssize_t cnt,
+                  Py_ssize_t *written)
+{
+    Py_ssize_t i = 0;
+    while (i < cnt) {
+        if (iov[i].iov_len == 0) {
+            i++;
+            continue;
+        }
+        Py_ssize_t res = fileio_writev(self->fd, &iov[i], cnt - i);
+        if (res < 0) {
+            if (errno == EAGAIN) {
+                PyErr_Clear();
+                PyObject *err = PyObject_CallFunction(
+                    PyExc_BlockingIOError, "isn", errno,
+                    "write could not complete without blocking", *written);
+                if (err != NULL) {
+                    PyErr_SetObject(PyExc_BlockingIOError, err);
+                    Py_DECREF(err);
+                }
+            }
+            return -1;
+        }
+        *written += res;
+        /* Skip the buffers written, and the written part of the last one
+           after a partial write. */
+        while (res > 0) {
+            if ((size_t)res < iov[i].iov_len) {
+                iov[i].iov_base = (char *)iov[i].iov_base + res;
+                iov[i].iov_len -= (size_t)res;
+                break;
+            }
+            res -= (Py_ssize_t)iov[i].iov_len;
+            i++;
+        }
+        /* Run signal handlers before blocking another time, as
+           BufferedWriter.write() does. */
+        if (i < cnt && PyErr_CheckSignals() < 0) {
+            return -1;
+        }
+    }
+    return 0;
+}
+
+static PyObject *
+_io_FileIO_writelines_impl(fileio *self, PyTypeObject *cls, PyObject *lines)
+/*[clinic end generated code: output=b863b79d2ed9cd7a input=adc98e22c71b61b5]*/
+{
+    PyObject *result = NULL;
+    Py_buffer *bufs = NULL;
+    fileio_iovec *iov = NULL;
+    Py_ssize_t nbufs = 0;
+    Py_ssize_t written = 0;
+
+    if (self->fd < 0)
+        return err_closed();
+    if (!self->writable) {
+        _PyIO_State *state = get_io_state_by_cls(cls);
+        return err_mode(state, "writing");
+    }
+
+    PyObject *iter = PyObject_GetIter(lines);
+    if (iter == NULL) {
+        return NULL;
+    }
+    /* The lines are consumed lazily and written in batches of at most
+       IOV_MAX buffers, which must stay alive until they are written. */
+    bufs = PyMem_New(Py_buffer, FILEIO_WRITELINES_BATCH);
+    iov = PyMem_New(fileio_iovec, FILEIO_WRITELINES_BATCH);
+    if (bufs == NULL || iov == NULL) {
+        PyErr_NoMemory();
+        goto done;
+    }
+    PyObject *line;
+    while ((line = PyIter_Next(iter)) != NULL) {
+        int r = PyObject_GetBuffer(line, &bufs[nbufs], PyBUF_SIMPLE);
+        Py_DECREF(line);
+        if (r < 0) {
+            break;
+        }
+        iov[nbufs].iov_base = bufs[nbufs].buf;
+        iov[nbufs].iov_len = (size_t)bufs[nbufs].len;
+        nbufs++;
+        if (nbufs == FILEIO_WRITELINES_BATCH) {
+            r = fileio_writev_all(self, iov, nbufs, &written);
+            for (Py_ssize_t j = 0; j < nbufs; j++) {
+                PyBuffer_Release(&bufs[j]);
+            }
+            nbufs = 0;
+            if (r < 0) {
+                goto done;
+            }
+        }
+    }
+
+    /* Write the lines already consumed, even if the iteration failed. */
+    PyObject *exc = PyErr_GetRaisedException();
+    if (fileio_writev_all(self, iov, nbufs, &written) < 0) {
+        _PyErr_ChainExceptions1(exc);
+        goto done;
+    }
+    if (exc != NULL) {
+        PyErr_SetRaisedException(exc);
+        goto done;
+    }
+    result = Py_NewRef(Py_None);
+
+done:
+    for (Py_ssize_t j = 0; j < nbufs; j++) {
+        PyBuffer_Release(&bufs[j]);
+    }
+    PyMem_Free(bufs);
+    PyMem_Free(iov);
+    Py_DECREF(iter);
+    return result;
+}
+
 /* XXX Windows support below is likely incomplete */
 
 /* Cribbed from posix_lseek() */
@@ -1061,6 +1240,92 @@ _io_FileIO_tell_impl(fileio *self)
     return portable_lseek(self, NULL, 1, false);
 }
 
+/*[clinic input]
+_io.FileIO.advise
+    advice: str
+    offset as offsetobj: object(c_default="NULL") = 0
+    length as lengthobj: object(c_default="NULL") = 0
+    /
+
+Announce how the file will be accessed.
+
+advice is one of 'normal', 'sequential', 'random', 'willneed',
+'dontneed' or 'noreuse'.  It applies to length bytes starting at
+offset, or up to the end of the file if length is 0.  This is only a
+hint: it does nothing on platforms without posix_fadvise().
+[clinic start generated code]*/
+
+static PyObject *
+_io_FileIO_advise_impl(fileio *self, const char *advice, PyObject *offsetobj,
+                       PyObject *lengthobj)
+/*[clinic end generated code: output=c1294491ed3d1429 input=7ad8f795a297d91d]*/
+{
+    Py_off_t offset, length;
+    int adv;
+
+    if (self->fd < 0)
+        return err_closed();
+
+    if (strcmp(advice, "normal") == 0)
+        adv = 0;
+    else if (strcmp(advice, "sequential") == 0)
+        adv = 1;
+    else if (strcmp(advice, "random") == 0)
+        adv = 2;
+    else if (strcmp(advice, "willneed") == 0)
+        adv = 3;
+    else if (strcmp(advice, "dontneed") == 0)
+        adv = 4;
+    else if (strcmp(advice, "noreuse") == 0)
+        adv = 5;
+    else {
+        PyErr_Format(PyExc_ValueError, "invalid advice: '%s'", advice);
+        return NULL;
+    }
+
+    offset = 0;
+    if (offsetobj != NULL) {
+        offset = PyNumber_AsOff_t(offsetobj, PyExc_OverflowError);
+        if (offset == -1 && PyErr_Occurred())
+            return NULL;
+    }
+    length = 0;
+    if (lengthobj != NULL) {
+        length = PyNumber_AsOff_t(lengthobj, PyExc_OverflowError);
+        if (length == -1 && PyErr_Occurred())
+            return NULL;
+    }
+    if (offset < 0 || length < 0) {
+        PyErr_SetString(PyExc_ValueError,
+                        "offset and length must be non-negative");
+        return NULL;
+    }
+
+#ifdef HAVE_POSIX_FADVISE
+    static const int advices[] = {
+        POSIX_FADV_NORMAL, POSIX_FADV_SEQUENTIAL, POSIX_FADV_RANDOM,
+        POSIX_FADV_WILLNEED, POSIX_FADV_DONTNEED, POSIX_FADV_NOREUSE,
+    };
+    int result;
+    int async_err = 0;
+
+    do {
+        Py_BEGIN_ALLOW_THREADS
+        result = posix_fadvise(self->fd, offset, length, advices[adv]);
+        Py_END_ALLOW_THREADS
+    } while (result == EINTR && !(async_err = PyErr_CheckSignals()));
+
+    if (result == 0)
+        Py_RETURN_NONE;
+    if (async_err)
+        return NULL;
+    errno = result;
+    return PyErr_SetFromErrno(PyExc_OSError);
+#else
+    Py_RETURN_NONE;
+#endif
+}
+
 #ifdef HAVE_FTRUNCATE
 /*[clinic input]
 _io.FileIO.truncate
@@ -1256,8 +1521,10 @@ static PyMethodDef fileio_methods[] = {
     _IO_FILEIO_READALL_METHODDEF
     _IO_FILEIO_READINTO_METHODDEF
     _IO_FILEIO_WRITE_METHODDEF
+    _IO_FILEIO_WRITELINES_METHODDEF
     _IO_FILEIO_SEEK_METHODDEF
     _IO_FILEIO_TELL_METHODDEF
+    _IO_FILEIO_ADVISE_METHODDEF
     _IO_FILEIO_TRUNCATE_METHODDEF
     _IO_FILEIO_CLOSE_METHODDEF
     _IO_FILEIO_SEEKABLE_METHODDEF
@@ -14,7 +14,7 @@
 #include "pycore_global_strings.h" // _Py_ID()
 #include "pycore_pyerrors.h"      // _PyErr_FormatNote
 #include "pycore_runtime.h"       // _PyRuntime
-#include "pycore_unicodeobject.h" // _PyUnicode_CheckConsistency()
+#include "pycore_unicodeobject.h" // _PyUnicodeWriter_TakeContent()
 
 #include <stdbool.h>              // bool
 
@@ -25,11 +25,19 @@ module _json
 [clinic start generated code]*/
 /*[clinic end generated code: output=da39a3ee5e6b4b0d input=549fa53592c925b2]*/
 
+/* Maximum number of tuples of keys for which the result of object_factory
+   is kept by a scanner */
+#define SHAPES_CACHE_SIZE 256
+
 typedef struct _PyScannerObject {
     PyObject_HEAD
     signed char strict;
     PyObject *object_hook;
     PyObject *object_pairs_hook;
+    PyObject *object_factory;
+    /* Map a tuple of keys to the result of object_factory(keys), for at
+       most SHAPES_CACHE_SIZE tuples */
+    PyObject *shapes;
     PyObject *parse_float;
     PyObject *parse_int;
     PyObject *parse_constant;
@@ -41,6 +49,7 @@ static PyMemberDef scanner_members[] = {
     {"strict", Py_T_BOOL, offsetof(PyScannerObject, strict), Py_READONLY, "strict"},
     {"object_hook", _Py_T_OBJECT, offsetof(PyScannerObject, object_hook), Py_READONLY, "object_hook"},
     {"object_pairs_hook", _Py_T_OBJECT, offsetof(PyScannerObject, object_pairs_hook), Py_READONLY},
+    {"object_factory", _Py_T_OBJECT, offsetof(PyScannerObject, object_factory), Py_READONLY},
     {"parse_float", _Py_T_OBJECT, offsetof(PyScannerObject, parse_float), Py_READONLY, "parse_float"},
     {"parse_int", _Py_T_OBJECT, offsetof(PyScannerObject, parse_int), Py_READONLY, "parse_int"},
     {"parse_constant", _Py_T_OBJECT, offsetof(PyScannerObject, parse_constant), Py_READONLY, "parse_constant"},
@@ -59,6 +68,11 @@ typedef struct _PyEncoderObject {
     char skipkeys;
     int allow_nan;
     int (*fast_encode)(PyUnicodeWriter *, PyObject *);
+    /* Set while encoding to a write() callable: the output is passed to it
+       in chunks of about chunk_size characters. */
+    PyObject *write;
+    Py_ssize_t chunk_size;
+    int binary;
 } PyEncoderObject;
 
 #define PyEncoderObject_CAST(op)    ((PyEncoderObject *)(op))
@@ -720,6 +734,8 @@ scanner_traverse(PyObject *op, visitproc visit, void *arg)
     Py_VISIT(Py_TYPE(self));
     Py_VISIT(self->object_hook);
     Py_VISIT(self->object_pairs_hook);
+    Py_VISIT(self->object_factory);
+    Py_VISIT(self->shapes);
     Py_VISIT(self->parse_float);
     Py_VISIT(self->parse_int);
     Py_VISIT(self->parse_constant);
@@ -732,12 +748,135 @@ scanner_clear(PyObject *op)
     PyScannerObject *self = PyScannerObject_CAST(op);
     Py_CLEAR(self->object_hook);
     Py_CLEAR(self->object_pairs_hook);
+    Py_CLEAR(self->object_factory);
+    Py_CLEAR(self->shapes);
     Py_CLEAR(self->parse_float);
     Py_CLEAR(self->parse_int);
     Py_CLEAR(self->parse_constant);
     return 0;
 }
 
+static int
+evict_oldest_shape(PyScannerObject *s)
+{
+    /* Make room for a new tuple of keys in s->shapes by removing the one
+       which was added first, so that the cache stays bounded when decoding
+       objects with many different sets of keys. */
+    int res = 0;
+    Py_BEGIN_CRITICAL_SECTION(s->shapes);
+    if (PyDict_GET_SIZE(s->shapes) >= SHAPES_CACHE_SIZE) {
+        Py_ssize_t pos = 0;
+        PyObject *oldest;
+        if (PyDict_Next(s->shapes, &pos, &oldest, NULL)) {
+            Py_INCREF(oldest);
+            res = PyDict_DelItem(s->shapes, oldest);
+            Py_DECREF(oldest);
+        }
+    }
+    Py_END_CRITICAL_SECTION();
+    return res;
+}
+
+static PyObject *
+_build_object(PyScannerObject *s, PyObject *keys, PyObject *values)
+{
+    /* Build the Python object of a JSON object whose keys and values are
+       in the lists keys and values.  The callable returned by
+       object_factory(keys) is cached per tuple of keys; it is called with
+       the values as positional arguments.  If it is None, the object is
+       built as if object_factory were not set.
+    */
+    PyObject *shape = PyList_AsTuple(keys);
+    if (shape == NULL) {
+        return NULL;
+    }
+    PyObject *factory;
+    if (PyDict_GetItemRef(s->shapes, shape, &factory) < 0) {
+        Py_DECREF(shape);
+        return NULL;
+    }
+    if (factory == NULL) {
+        factory = PyObject_CallOneArg(s->object_factory, shape);
+        if (factory == NULL) {
+            Py_DECREF(shape);
+            return NULL;
+        }
+        if (evict_oldest_shape(s) < 0) {
+            Py_DECREF(shape);
+            Py_DECREF(factory);
+            return NULL;
+        }
+        PyObject *cached;
+        if (PyDict_SetDefaultRef(s->shapes, shape, factory, &cached) < 0) {
+            Py_DECREF(shape);
+            Py_DECREF(factory);
+            return NULL;
+        }
+        Py_SETREF(factory, cached);
+    }
+    Py_DECREF(shape);
+
+    PyObject *rval;
+    Py_ssize_t n = PyList_GET_SIZE(keys);
+    if (factory != Py_None) {
+        /* values is not exposed to Python code: its items stay alive */
+        PyObject *small_args[8];
+        PyObject **args = small_args;
+        if (n > (Py_ssize_t)Py_ARRAY_LENGTH(small_args)) {
+            args = PyMem_New(PyObject *, n);
+            if (args == NULL) {
+                Py_DECREF(factory);
+                return PyErr_NoMemory();
+            }
+        }
+        for (Py_ssize_t i = 0; i < n; i++) {
+            args[i] = PyList_GET_ITEM(values, i);
+        }
+        rval = PyObject_Vectorcall(factory, args, n, NULL);
+        if (args != small_args) {
+            PyMem_Free(args);
+        }
+        Py_DECREF(factory);
+        return rval;
+    }
+    Py_DECREF(factory);
+
+    if (s->object_pairs_hook != Py_None) {
+        PyObject *pairs = PyList_New(n);
+        if (pairs == NULL) {
+            return NULL;
+        }
+        for (Py_ssize_t i = 0; i < n; i++) {
+            PyObject *item = PyTuple_Pack(2, PyList_GET_ITEM(keys, i),
+                                          PyList_GET_ITEM(values, i));
+            if (item == NULL) {
+                Py_DECREF(pairs);
+                return NULL;
+            }
+            PyList_SET_ITEM(pairs, i, item);
+        }
+        rval = PyObject_CallOneArg(s->object_pairs_hook, pairs);
+        Py_DECREF(pairs);
+        return rval;
+    }
+
+    rval = PyDict_New();
+    if (rval == NULL) {
+        return NULL;
+    }
+    for (Py_ssize_t i = 0; i < n; i++) {
+        if (PyDict_SetItem(rval, PyList_GET_ITEM(keys, i),
+                           PyList_GET_ITEM(values, i)) < 0) {
+            Py_DECREF(rval);
+            return NULL;
+        }
+    }
+    if (s->object_hook != Py_None) {
+        Py_SETREF(rval, PyObject_CallOneArg(s->object_hook, rval));
+    }
+    return rval;
+}
+
 static PyObject *
 _parse_object_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr)
 {
@@ -754,7 +893,9 @@ _parse_object_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ss
     PyObject *val = NULL;
     PyObject *rval = NULL;
     PyObject *key = NULL;
+    PyObject *values = NULL;
     int has_pairs_hook = (s->object_pairs_hook != Py_None);
+    int has_factory = (s->object_factory != Py_None);
     Py_ssize_t next_idx;
     Py_ssize_t comma_idx;
 
@@ -762,12 +903,23 @@ _parse_object_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ss
     kind = PyUnicode_KIND(pystr);
     end_idx = PyUnicode_GET_LENGTH(pystr) - 1;
 
-    if (has_pairs_hook)
+    if (has_factory) {
+        /* rval is the list of keys */
+        rval = PyList_New(0);
+        values = PyList_New(0);
+        if (values == NULL) {
+            Py_XDECREF(rval);
+            return NULL;
+        }
+    }
+    else if (has_pairs_hook)
         rval = PyList_New(0);
     else
         rval = PyDict_New();
-    if (rval == NULL)
+    if (rval == NULL) {
+        Py_XDECREF(values);
         return NULL;
+    }
 
     /* skip whitespace after { */
     while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind,str, idx))) idx++;
@@ -805,7 +957,14 @@ _parse_object_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ss
             if (val == NULL)
                 goto bail;
 
-            if (has_pairs_hook) {
+            if (has_factory) {
+                if (PyList_Append(rval, key) < 0 ||
+                    PyList_Append(values, val) < 0)
+                    goto bail;
+                Py_CLEAR(key);
+                Py_CLEAR(val);
+            }
+            else if (has_pairs_hook) {
                 PyObject *item = PyTuple_Pack(2, key, val);
                 if (item == NULL)
                     goto bail;
@@ -850,6 +1009,13 @@ _parse_object_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ss
 
     *next_idx_ptr = idx + 1;
 
+    if (has_factory) {
+        val = _build_object(s, rval, values);
+        Py_DECREF(rval);
+        Py_DECREF(values);
+        return val;
+    }
+
     if (has_pairs_hook) {
         val = PyObject_CallOneArg(s->object_pairs_hook, rval);
         Py_DECREF(rval);
@@ -867,6 +1033,7 @@ _parse_object_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ss
     Py_XDECREF(key);
     Py_XDECREF(val);
     Py_XDECREF(rval);
+    Py_XDECREF(values);
     return NULL;
 }
 
@@ -1259,6 +1426,18 @@ scanner_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     s->object_pairs_hook = PyObject_GetAttrString(ctx, "object_pairs_hook");
     if (s->object_pairs_hook == NULL)
         goto bail;
+    /* Optional for backward compatibility with custom contexts */
+    if (PyObject_GetOptionalAttrString(ctx, "object_factory",
+                                       &s->object_factory) < 0)
+        goto bail;
+    if (s->object_factory == NULL) {
+        s->object_factory = Py_NewRef(Py_None);
+    }
+    else if (s->object_factory != Py_None) {
+        s->shapes = PyDict_New();
+        if (s->shapes == NULL)
+            goto bail;
+    }
     s->parse_float = PyObject_GetAttrString(ctx, "parse_float");
     if (s->parse_float == NULL)
         goto bail;
@@ -1334,6 +1513,9 @@ encoder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     s->skipkeys = skipkeys;
     s->allow_nan = allow_nan;
     s->fast_encode = NULL;
+    s->write = NULL;
+    s->chunk_size = 0;
+    s->binary = 0;
 
     if (PyCFunction_Check(s->encoder)) {
         PyCFunction f = PyCFunction_GetFunction(s->encoder);
@@ -1434,18 +1616,71 @@ write_newline_indent(PyUnicodeWriter *writer,
 }
 
 
+static int
+encoder_flush(PyEncoderObject *s, PyUnicodeWriter *writer)
+{
+    /* Pass the content of the writer to s->write, as a str or as UTF-8
+       encoded bytes, and empty the writer.  Its buffer is reused, which
+       bounds the memory used to encode a large document. */
+    if (_PyUnicodeWriter_GetLength(writer) == 0) {
+        return 0;
+    }
+    PyObject *chunk = _PyUnicodeWriter_TakeContent(writer, s->binary);
+    if (chunk == NULL) {
+        return -1;
+    }
+    PyObject *res = PyObject_CallOneArg(s->write, chunk);
+    Py_DECREF(chunk);
+    if (res == NULL) {
+        return -1;
+    }
+    Py_DECREF(res);
+    return 0;
+}
+
+static inline int
+encoder_maybe_flush(PyEncoderObject *s, PyUnicodeWriter *writer)
+{
+    if (s->write != NULL
+        && _PyUnicodeWriter_GetLength(writer) >= s->chunk_size)
+    {
+        return encoder_flush(s, writer);
+    }
+    return 0;
+}
+
 static PyObject *
 encoder_call(PyObject *op, PyObject *args, PyObject *kwds)
 {
     /* Python callable interface to encoder_listencode_obj */
-    static char *kwlist[] = {"obj", "_current_indent_level", NULL};
+    static char *kwlist[] = {"obj", "_current_indent_level", "_write",
+                             "_chunk_size", "_binary", NULL};
     PyObject *obj;
     Py_ssize_t indent_level;
+    PyObject *write = Py_None;
+    Py_ssize_t chunk_size = 65536;
+    int binary = 0;
     PyEncoderObject *self = PyEncoderObject_CAST(op);
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "On:_iterencode", kwlist,
-                                     &obj, &indent_level))
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "On|$Onp:_iterencode", kwlist,
+                                     &obj, &indent_level, &write,
+                                     &chunk_size, &binary))
         return NULL;
+    if (write != Py_None) {
+        if (!PyCallable_Check(write)) {
+            PyErr_SetString(PyExc_TypeError, "_write must be callable");
+            return NULL;
+        }
+        if (chunk_size < 1) {
+            PyErr_SetString(PyExc_ValueError,
+                            "_chunk_size must be positive");
+            return NULL;
+        }
+    }
+    if (self->write != NULL) {
+        PyErr_SetString(PyExc_RuntimeError, "encoder is already writing");
+        return NULL;
+    }
 
     PyUnicodeWriter *writer = PyUnicodeWriter_Create(0);
     if (writer == NULL) {
@@ -1460,13 +1695,32 @@ encoder_call(PyObject *op, PyObject *args, PyObject *kwds)
             return NULL;
         }
     }
+    if (write != Py_None) {
+        self->write = Py_NewRef(write);
+        self->chunk_size = chunk_size;
+        self->binary = binary;
+    }
     indent_level = 0;
-    if (encoder_listencode_obj(self, writer, obj, indent_level, indent_cache)) {
+    int rv = encoder_listencode_obj(self, writer, obj, indent_level,
+                                    indent_cache);
+    Py_XDECREF(indent_cache);
+    if (self->write != NULL) {
+        if (rv == 0) {
+            rv = encoder_flush(self, writer);
+        }
+        Py_CLEAR(self->write);
+        /* The buffer of the writer may have been partially flushed: do not
+           turn it into a string. */
+        PyUnicodeWriter_Discard(writer);
+        if (rv) {
+            return NULL;
+        }
+        Py_RETURN_NONE;
+    }
+    if (rv) {
         PyUnicodeWriter_Discard(writer);
-        Py_XDECREF(indent_cache);
         return NULL;
     }
-    Py_XDECREF(indent_cache);
 
     PyObject *str = PyUnicodeWriter_Finish(writer);
     if (str == NULL) {
@@ -1722,7 +1976,7 @@ encoder_encode_key_value(PyEncoderObject *s, PyUnicodeWriter *writer, bool *firs
         _PyErr_FormatNote("when serializing %T item %R", dct, key);
         return -1;
     }
-    return 0;
+    return encoder_maybe_flush(s, writer);
 }
 
 static inline int
@@ -1917,6 +2171,9 @@ _encoder_iterate_fast_seq_lock_held(PyEncoderObject *s, PyUnicodeWriter *writer,
 #ifdef Py_GIL_DISABLED
         Py_DECREF(obj);
 #endif
+        if (encoder_maybe_flush(s, writer) < 0) {
+            return -1;
+        }
     }
     return 0;
 }
@@ -2022,6 +2279,7 @@ encoder_traverse(PyObject *op, visitproc visit, void *arg)
     Py_VISIT(self->indent);
     Py_VISIT(self->key_separator);
     Py_VISIT(self->item_separator);
+    Py_VISIT(self->write);
     return 0;
 }
 
@@ -2036,6 +2294,7 @@ encoder_clear(PyObject *op)
     Py_CLEAR(self->indent);
     Py_CLEAR(self->key_separator);
     Py_CLEAR(self->item_separator);
+    Py_CLEAR(self->write);
     return 0;
 }
 
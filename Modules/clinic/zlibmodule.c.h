@@ -1006,6 +1006,85 @@ exit:
     return return_value;
 }
 
+PyDoc_STRVAR(zlib__ZlibDecompressor__decompress_block__doc__,
+"_decompress_block($self, data, /)\n"
+"--\n"
+"\n"
+"Decompress *data* up to the end of the current deflate block.\n"
+"\n"
+"Return a tuple (output, total_in, bits).  total_in is the number of\n"
+"input bytes consumed since the creation of the decompressor.  If the\n"
+"decompression stopped at the boundary between two deflate blocks, bits\n"
+"is the number of bits of the last consumed byte which belong to the next\n"
+"block, otherwise it is -1.  Used by the gzip module to build indexes.");
+
+#define ZLIB__ZLIBDECOMPRESSOR__DECOMPRESS_BLOCK_METHODDEF    \
+    {"_decompress_block", (PyCFunction)zlib__ZlibDecompressor__decompress_block, METH_O, zlib__ZlibDecompressor__decompress_block__doc__},
+
+static PyObject *
+zlib__ZlibDecompressor__decompress_block_impl(ZlibDecompressor *self,
+                                              Py_buffer *data);
+
+static PyObject *
+zlib__ZlibDecompressor__decompress_block(PyObject *self, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    Py_buffer data = {NULL, NULL};
+
+    if (PyObject_GetBuffer(arg, &data, PyBUF_SIMPLE) != 0) {
+        goto exit;
+    }
+    return_value = zlib__ZlibDecompressor__decompress_block_impl((ZlibDecompressor *)self, &data);
+
+exit:
+    /* Cleanup for data */
+    if (data.obj) {
+       PyBuffer_Release(&data);
+    }
+
+    return return_value;
+}
+
+PyDoc_STRVAR(zlib__ZlibDecompressor__prime__doc__,
+"_prime($self, bits, value, /)\n"
+"--\n"
+"\n"
+"Insert bits at the start of the input of the decompressor.\n"
+"\n"
+"Used with a dictionary to resume decompression at a deflate block\n"
+"boundary which is not at a byte boundary.");
+
+#define ZLIB__ZLIBDECOMPRESSOR__PRIME_METHODDEF    \
+    {"_prime", _PyCFunction_CAST(zlib__ZlibDecompressor__prime), METH_FASTCALL, zlib__ZlibDecompressor__prime__doc__},
+
+static PyObject *
+zlib__ZlibDecompressor__prime_impl(ZlibDecompressor *self, int bits,
+                                   int value);
+
+static PyObject *
+zlib__ZlibDecompressor__prime(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    int bits;
+    int value;
+
+    if (!_PyArg_CheckPositional("_prime", nargs, 2, 2)) {
+        goto exit;
+    }
+    bits = PyLong_AsInt(args[0]);
+    if (bits == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+    value = PyLong_AsInt(args[1]);
+    if (value == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+    return_value = zlib__ZlibDecompressor__prime_impl((ZlibDecompressor *)self, bits, value);
+
+exit:
+    return return_value;
+}
+
 PyDoc_STRVAR(zlib__ZlibDecompressor__doc__,
 "_ZlibDecompressor(wbits=MAX_WBITS, zdict=b\'\')\n"
 "--\n"
@@ -1402,4 +1481,4 @@ exit:
 #ifndef ZLIB_DECOMPRESS___DEEPCOPY___METHODDEF
     #define ZLIB_DECOMPRESS___DEEPCOPY___METHODDEF
 #endif /* !defined(ZLIB_DECOMPRESS___DEEPCOPY___METHODDEF) */
-/*[clinic end generated code: output=fa5fc356f3090cce input=a9049054013a1b77]*/
+/*[clinic end generated code: output=401982519807eb48 input=a9049054013a1b77]*/
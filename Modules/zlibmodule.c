@@ -1356,6 +1356,9 @@ typedef struct {
        separately. Conversion and looping is encapsulated in
        decompress_buf() */
     Py_ssize_t avail_in_real;
+    /* Number of input bytes consumed by inflate() so far. zst.total_in is
+       only 32 bit on some platforms. */
+    unsigned long long total_in;
     bool is_initialised;
     char eof;           /* Py_T_BOOL expects a char */
     char needs_input;
@@ -1462,9 +1465,9 @@ arrange_output_buffer_with_maximum(uint32_t *avail_out,
    of sufficiently low size, max_length is allocated immediately. At most
    max_length bytes are returned, so some of the input may not be consumed.
    self->state.next_in and self->avail_in_real are updated to reflect the
-   consumed input. */
+   consumed input. If flush is Z_BLOCK, stop at the end of a deflate block. */
 static PyObject*
-decompress_buf(ZlibDecompressor *self, Py_ssize_t max_length)
+decompress_buf(ZlibDecompressor *self, Py_ssize_t max_length, int flush)
 {
     /* data_size is strictly positive, but because we repeatedly have to
        compare against max_length and PyBytes_GET_SIZE we declare it as
@@ -1512,9 +1515,17 @@ decompress_buf(ZlibDecompressor *self, Py_ssize_t max_length)
             else if (obuflen == -2) {
                 break;
             }
+            uInt avail_in = self->zst.avail_in;
             Py_BEGIN_ALLOW_THREADS
-            err = inflate(&self->zst, Z_SYNC_FLUSH);
+            err = inflate(&self->zst, flush);
+            if (flush == Z_BLOCK && err == Z_OK
+                && (self->zst.data_type & 192) == 192)
+            {
+                /* Stopped after the last block: finish the stream. */
+                err = inflate(&self->zst, Z_SYNC_FLUSH);
+            }
             Py_END_ALLOW_THREADS
+            self->total_in += avail_in - self->zst.avail_in;
             switch (err) {
             case Z_OK:  _Py_FALLTHROUGH;
             case Z_BUF_ERROR: _Py_FALLTHROUGH;
@@ -1528,8 +1539,14 @@ decompress_buf(ZlibDecompressor *self, Py_ssize_t max_length)
                     break;
                 }
             }
+            if (flush == Z_BLOCK && err == Z_OK
+                && (self->zst.data_type & 128))
+            {
+                goto block_end;
+            }
         } while (self->zst.avail_out == 0);
     } while(err != Z_STREAM_END && self->avail_in_real != 0);
+block_end:
 
     if (err == Z_STREAM_END) {
         FT_ATOMIC_STORE_CHAR_RELAXED(self->eof, 1);
@@ -1563,7 +1580,7 @@ decompress_buf(ZlibDecompressor *self, Py_ssize_t max_length)
 
 static PyObject *
 decompress(ZlibDecompressor *self, uint8_t *data,
-           size_t len, Py_ssize_t max_length)
+           size_t len, Py_ssize_t max_length, int flush)
 {
     bool input_buffer_in_use;
     PyObject *result;
@@ -1613,7 +1630,7 @@ decompress(ZlibDecompressor *self, uint8_t *data,
         input_buffer_in_use = 0;
     }
 
-    result = decompress_buf(self, max_length);
+    result = decompress_buf(self, max_length, flush);
     if(result == NULL) {
         self->zst.next_in = NULL;
         return NULL;
@@ -1710,12 +1727,94 @@ zlib__ZlibDecompressor_decompress_impl(ZlibDecompressor *self,
         PyErr_SetString(PyExc_EOFError, "End of stream already reached");
     }
     else {
-        result = decompress(self, data->buf, data->len, max_length);
+        result = decompress(self, data->buf, data->len, max_length,
+                            Z_SYNC_FLUSH);
+    }
+    PyMutex_Unlock(&self->mutex);
+    return result;
+}
+
+/*[clinic input]
+zlib._ZlibDecompressor._decompress_block
+
+    data: Py_buffer
+    /
+
+Decompress *data* up to the end of the current deflate block.
+
+Return a tuple (output, total_in, bits).  total_in is the number of
+input bytes consumed since the creation of the decompressor.  If the
+decompression stopped at the boundary between two deflate blocks, bits
+is the number of bits of the last consumed byte which belong to the next
+block, otherwise it is -1.  Used by the gzip module to build indexes.
+[clinic start generated code]*/
+
+static PyObject *
+zlib__ZlibDecompressor__decompress_block_impl(ZlibDecompressor *self,
+                                              Py_buffer *data)
+/*[clinic end generated code: output=0521d9fb119b372b input=fe26497f52dfd9e5]*/
+{
+    PyObject *result = NULL;
+
+    PyMutex_Lock(&self->mutex);
+    if (self->eof) {
+        PyErr_SetString(PyExc_EOFError, "End of stream already reached");
+    }
+    else {
+        PyObject *output = decompress(self, data->buf, data->len, -1,
+                                      Z_BLOCK);
+        if (output != NULL) {
+            int bits = -1;
+            if (!self->eof && (self->zst.data_type & 128)) {
+                bits = self->zst.data_type & 7;
+            }
+            result = Py_BuildValue("(NKi)", output, self->total_in, bits);
+        }
     }
     PyMutex_Unlock(&self->mutex);
     return result;
 }
 
+/*[clinic input]
+zlib._ZlibDecompressor._prime
+
+    bits: int
+    value: int
+    /
+
+Insert bits at the start of the input of the decompressor.
+
+Used with a dictionary to resume decompression at a deflate block
+boundary which is not at a byte boundary.
+[clinic start generated code]*/
+
+static PyObject *
+zlib__ZlibDecompressor__prime_impl(ZlibDecompressor *self, int bits,
+                                   int value)
+/*[clinic end generated code: output=a8a324003a7fdd6d input=1458edc760ba68be]*/
+{
+    zlibstate *state = PyType_GetModuleState(Py_TYPE(self));
+    int err;
+
+    if (bits < 0 || bits > 16) {
+        PyErr_SetString(PyExc_ValueError, "bits must be between 0 and 16");
+        return NULL;
+    }
+    PyMutex_Lock(&self->mutex);
+    if (self->eof) {
+        PyErr_SetString(PyExc_EOFError, "End of stream already reached");
+        PyMutex_Unlock(&self->mutex);
+        return NULL;
+    }
+    err = inflatePrime(&self->zst, bits, value);
+    PyMutex_Unlock(&self->mutex);
+    if (err != Z_OK) {
+        zlib_error(state, self->zst, err, "while priming the decompressor");
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
 /*[clinic input]
 @classmethod
 zlib._ZlibDecompressor.__new__
@@ -1745,6 +1844,7 @@ zlib__ZlibDecompressor_impl(PyTypeObject *type, int wbits, PyObject *zdict)
     self->eof = 0;
     self->needs_input = 1;
     self->avail_in_real = 0;
+    self->total_in = 0;
     self->input_buffer = NULL;
     self->input_buffer_size = 0;
     self->zdict = Py_XNewRef(zdict);
@@ -1806,6 +1906,8 @@ static PyMethodDef Decomp_methods[] =
 
 static PyMethodDef ZlibDecompressor_methods[] = {
     ZLIB__ZLIBDECOMPRESSOR_DECOMPRESS_METHODDEF
+    ZLIB__ZLIBDECOMPRESSOR__DECOMPRESS_BLOCK_METHODDEF
+    ZLIB__ZLIBDECOMPRESSOR__PRIME_METHODDEF
     {NULL}
 };
 
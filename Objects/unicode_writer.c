@@ -622,6 +622,52 @@ _PyUnicodeWriter_Finish(_PyUnicodeWriter *writer)
 }
 
 
+// Take the content of the writer as a str or, if as_utf8 is non-zero, as
+// UTF-8 encoded bytes, and empty the writer.  Its buffer is kept for the
+// next writes if it only contains ASCII characters, otherwise the writer
+// starts again from an ASCII buffer.
+PyObject*
+_PyUnicodeWriter_TakeContent(PyUnicodeWriter *pub_writer, int as_utf8)
+{
+    _PyUnicodeWriter *writer = (_PyUnicodeWriter*)pub_writer;
+    PyObject *res;
+
+    if (writer->pos == 0) {
+        if (as_utf8) {
+            return Py_GetConstant(Py_CONSTANT_EMPTY_BYTES);
+        }
+        return _PyUnicode_GetEmpty();
+    }
+
+    if (writer->maxchar < 128 && !writer->readonly) {
+        // ASCII is valid UTF-8
+        if (as_utf8) {
+            res = PyBytes_FromStringAndSize(writer->data, writer->pos);
+        }
+        else {
+            res = _PyUnicode_FromASCII(writer->data, writer->pos);
+        }
+        if (res != NULL) {
+            writer->pos = 0;
+        }
+        return res;
+    }
+
+    res = _PyUnicodeWriter_Finish(writer);
+    assert(writer->buffer == NULL);
+    writer->readonly = 0;
+    writer->data = NULL;
+    writer->kind = 0;
+    writer->maxchar = 0;
+    writer->size = 0;
+    writer->pos = 0;
+    if (res != NULL && as_utf8) {
+        Py_SETREF(res, PyUnicode_AsUTF8String(res));
+    }
+    return res;
+}
+
+
 PyObject*
 PyUnicodeWriter_Finish(PyUnicodeWriter *writer)
 {
@@ -0,0 +1,103 @@
+"""
+asyncio.Queue throughput benchmark.
+
+Measures the per-item overhead of moving messages from producer tasks to
+consumer tasks through an asyncio queue, using either single-item
+put()/get() or the batch put_many()/get_many() methods.
+
+To run:
+
+    python3 Tools/scripts/asyncio_queue_benchmark.py
+
+Options:
+
+    * `--messages` to set the number of messages per run
+    * `--batch` to set the number of messages per put_many() call
+    * `--producers` and `--consumers` to set the number of tasks
+    * `--maxsize` to bound the queue
+    * `--queue` to select Queue, LifoQueue or PriorityQueue
+"""
+
+import argparse
+import asyncio
+import time
+
+
+async def single(queue_class, messages, batch, producers, consumers, maxsize):
+    q = queue_class(maxsize)
+
+    async def produce(n):
+        put = q.put
+        for i in range(n):
+            await put(i)
+
+    async def consume():
+        get = q.get
+        while True:
+            await get()
+            q.task_done()
+
+    return await _run(q, produce, consume, messages, producers, consumers)
+
+
+async def batched(queue_class, messages, batch, producers, consumers, maxsize):
+    q = queue_class(maxsize)
+
+    async def produce(n):
+        put_many = q.put_many
+        for start in range(0, n, batch):
+            await put_many(range(start, min(start + batch, n)))
+
+    async def consume():
+        get_many = q.get_many
+        while True:
+            items = await get_many()
+            for _ in items:
+                q.task_done()
+
+    return await _run(q, produce, consume, messages, producers, consumers)
+
+
+async def _run(q, produce, consume, messages, producers, consumers):
+    consumer_tasks = [asyncio.create_task(consume()) for _ in range(consumers)]
+    start = time.perf_counter()
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(producers):
+            tg.create_task(produce(messages // producers))
+    await q.join()
+    elapsed = time.perf_counter() - start
+    for task in consumer_tasks:
+        task.cancel()
+    await asyncio.gather(*consumer_tasks, return_exceptions=True)
+    return elapsed
+
+
+QUEUES = {
+    "Queue": asyncio.Queue,
+    "LifoQueue": asyncio.LifoQueue,
+    "PriorityQueue": asyncio.PriorityQueue,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--messages", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=256)
+    parser.add_argument("--producers", type=int, default=1)
+    parser.add_argument("--consumers", type=int, default=4)
+    parser.add_argument("--maxsize", type=int, default=0)
+    parser.add_argument("--queue", choices=sorted(QUEUES), default="Queue")
+    args = parser.parse_args()
+
+    queue_class = QUEUES[args.queue]
+    messages = args.messages - args.messages % args.producers
+    for name, bench in (("put/get", single), ("put_many/get_many", batched)):
+        elapsed = asyncio.run(bench(queue_class, messages, args.batch,
+                                    args.producers, args.consumers,
+                                    args.maxsize))
+        print(f"{args.queue} {name:18}: {elapsed * 1e9 / messages:7.1f} ns/item, "
+              f"{messages / elapsed:12,.0f} items/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Compression throughput benchmark.
+
+Measures the compression and decompression speed (in MB/s of uncompressed
+data) and the compression ratio of gzip, bz2, lzma and compression.zstd on
+the same corpus, including the multithreaded modes of gzip and zstd.
+
+To run:
+
+    python3 Tools/scripts/compression_benchmark.py [FILE ...]
+
+The corpus is the concatenation of the given files, or the Python files of
+the standard library if none is given.
+
+Options:
+
+    * `--size` to truncate or repeat the corpus to this number of MiB
+    * `--threads` to set the number of threads of the multithreaded modes
+    * `--repeat` to set the number of measurements, the best one is reported
+"""
+
+import argparse
+import bz2
+import gzip
+import lzma
+import os
+import time
+
+try:
+    from compression import zstd
+except ImportError:
+    zstd = None
+
+
+def make_corpus(files, size):
+    if not files:
+        libdir = os.path.dirname(os.__file__)
+        files = sorted(os.path.join(libdir, name)
+                       for name in os.listdir(libdir)
+                       if name.endswith(".py"))
+    chunks = []
+    for name in files:
+        with open(name, "rb") as f:
+            chunks.append(f.read())
+    data = b"".join(chunks)
+    if size:
+        data = data * (size // len(data) + 1)
+        data = data[:size]
+    return data
+
+
+def codecs(threads):
+    yield "gzip", gzip.compress, gzip.decompress
+    yield (f"gzip threads={threads}",
+           lambda data: gzip.compress(data, threads=threads),
+           gzip.decompress)
+    yield "bz2", bz2.compress, bz2.decompress
+    yield "lzma", lzma.compress, lzma.decompress
+    if zstd is None:
+        return
+    yield "zstd", zstd.compress, zstd.decompress
+    if zstd.CompressionParameter.nb_workers.bounds() != (0, 0):
+        yield (f"zstd threads={threads}",
+               lambda data: zstd.compress(data, threads=threads),
+               zstd.decompress)
+
+
+def bench(func, data, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func(data)
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("files", nargs="*")
+    parser.add_argument("--size", type=int, default=32,
+                        help="corpus size in MiB (0: use the files as is)")
+    parser.add_argument("--threads", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    data = make_corpus(args.files, args.size * 1024 * 1024)
+    mb = len(data) / 1e6
+    print(f"corpus: {mb:.1f} MB")
+    if zstd is None:
+        print("compression.zstd is not available")
+    for name, compress, decompress in codecs(args.threads):
+        t_comp, compressed = bench(compress, data, args.repeat)
+        t_decomp, decompressed = bench(decompress, compressed, args.repeat)
+        assert decompressed == data
+        print(f"{name:>16}: compress {mb / t_comp:8.1f} MB/s, "
+              f"decompress {mb / t_decomp:8.1f} MB/s, "
+              f"ratio {len(data) / len(compressed):5.2f}")
+
+
+if __name__ == "__main__":
+    main()
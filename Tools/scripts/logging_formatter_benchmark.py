@@ -0,0 +1,86 @@
+"""
+logging.Formatter throughput benchmark.
+
+Measures the time taken by logging.Formatter.format() for the three format
+styles, comparing the compiled renderers of the style objects with an
+interpolation of the record's __dict__ on every call.
+
+To run:
+
+    python3 Tools/scripts/logging_formatter_benchmark.py
+
+Options:
+
+    * `--records` to set the number of records formatted per measurement
+    * `--repeat` to set the number of measurements, the best one is reported
+"""
+
+import argparse
+import logging
+import timeit
+
+
+FORMATS = {
+    "%": "%(levelname)-8s %(name)s %(module)s:%(lineno)d %(message)s",
+    "{": "{levelname:<8} {name} {module}:{lineno} {message}",
+    "$": "${levelname} ${name} ${module}:${lineno} ${message}",
+}
+
+
+# Interpolate record.__dict__ on every call, without compiled renderers.
+
+class GenericPercentStyle(logging.PercentStyle):
+    def _format(self, record):
+        return self._fmt % record.__dict__
+
+
+class GenericStrFormatStyle(logging.StrFormatStyle):
+    def _format(self, record):
+        return self._fmt.format(**record.__dict__)
+
+
+class GenericStringTemplateStyle(logging.StringTemplateStyle):
+    def _format(self, record):
+        return self._tpl.substitute(**record.__dict__)
+
+
+GENERIC_STYLES = {
+    "%": GenericPercentStyle,
+    "{": GenericStrFormatStyle,
+    "$": GenericStringTemplateStyle,
+}
+
+
+def make_record():
+    logger = logging.getLogger("bench")
+    return logger.makeRecord("bench", logging.INFO, __file__, 42,
+                             "request %s took %d ms", ("/index", 12), None)
+
+
+def bench(formatter, record, number, repeat):
+    times = timeit.repeat(lambda: formatter.format(record),
+                          number=number, repeat=repeat)
+    return min(times) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    record = make_record()
+    for style, fmt in FORMATS.items():
+        compiled = logging.Formatter(fmt, style=style)
+        generic = logging.Formatter(fmt, style=style)
+        generic._style = GENERIC_STYLES[style](fmt)
+        assert compiled.format(record) == generic.format(record)
+        t_generic = bench(generic, record, args.records, args.repeat)
+        t_compiled = bench(compiled, record, args.records, args.repeat)
+        print(f"style {style!r}: generic {t_generic * 1e9:7.1f} ns, "
+              f"compiled {t_compiled * 1e9:7.1f} ns "
+              f"({t_generic / t_compiled:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()